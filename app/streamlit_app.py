@@ -1,4 +1,7 @@
 # app/streamlit_app.py — Application professionnelle pour la détection de fraudes bancaires
+import hashlib
+import io
+import multiprocessing
 from datetime import datetime
 from pathlib import Path
 
@@ -8,10 +11,12 @@ import plotly.express as px
 import streamlit as st
 
 # Import des modules src/
-from src.data.loader import ArtifactLoader
-from src.models.predictor import FraudPredictor
-from src.models.explainer import FraudExplainer
+from src.data.io import find_table, read_table
+from src.data.loader import DEFAULT_WARMUP_SIZES, ArtifactLoader, format_warmup
+from src.models.predictor import ScoredBatch
+from src.models.explainer import ExplanationCache, FraudExplainer
 from src.visualization.plots import FraudVisualizer
+from src.serving.reloader import ModelReloader
 from src.utils.validation import DataValidator
 
 # =========================
@@ -179,15 +184,34 @@ st.markdown("---")
 # Chargement des artefacts avec vérification de santé
 # =========================
 @st.cache_resource(show_spinner=False)
-def load_artifacts():
-    """Charge les artefacts en utilisant ArtifactLoader."""
-    loader = ArtifactLoader(MODEL_DIR)
-    pipe, m, cols, warnings = loader.load_artifacts()
-    return pipe, m, cols, warnings
+def get_model_reloader():
+    """Charge le modèle et surveille ses artefacts (rechargement à chaud)."""
+    # Forêt compilée projetée en mémoire; le pipeline complet reste chargé
+    # (ses arbres servent aux explications SHAP)
+    reloader = ModelReloader(
+        MODEL_DIR,
+        engine="auto",
+        mmap_mode="r",
+        interval=10.0,
+        warmup_sizes=DEFAULT_WARMUP_SIZES,
+    )
+    reloader.start()
+    return reloader
 
 
 with st.spinner("Chargement du modèle..."):
-    pipe, metrics_valid, cols, artifact_warnings = load_artifacts()
+    model_reloader = get_model_reloader()
+    # Version lue une seule fois par exécution: une bascule s'applique au prochain rerun
+    model_version = model_reloader.current
+
+pipe = model_version.pipeline
+metrics_valid = model_version.metrics
+cols = model_version.columns
+artifact_warnings = model_version.warnings
+load_info = model_version.load_info
+
+if model_reloader.last_error:
+    st.warning(f"⚠️ {model_reloader.last_error} (version précédente conservée)")
 
 # Afficher les warnings s'il y en a
 if artifact_warnings:
@@ -200,8 +224,35 @@ else:
 # Initialiser le prédicateur et l'explainer
 THRESHOLD = float(metrics_valid["threshold"])
 EXPECTED_COLS = cols["all_cols"]
-predictor = FraudPredictor(pipe, EXPECTED_COLS, threshold=THRESHOLD)
-explainer = FraudExplainer(pipe)
+predictor = model_version.predictor
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def load_explainer(version_id: str, _pipe):
+    """
+    Crée l'explainer une seule fois par version du modèle.
+
+    Le TreeExplainer SHAP est construit dans un thread en arrière-plan: le
+    premier affichage n'attend pas, la première explication le réutilise.
+    """
+    pipe = _pipe
+    # Résumé SHAP global précalculé à l'entraînement (None s'il est absent)
+    global_summary = ArtifactLoader(MODEL_DIR).load_global_shap()
+    # Le serveur Streamlit est multi-thread: pas de fork pour le pool SHAP
+    start_method = (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+    explainer = FraudExplainer(
+        pipe,
+        cache=ExplanationCache(max_entries=512),
+        global_summary=global_summary,
+        start_method=start_method,
+    )
+    explainer.warm_up(background=True)
+    return explainer
+
+
+explainer = load_explainer(model_version.version_id, pipe)
 
 # =========================
 # Sidebar professionnelle
@@ -277,6 +328,30 @@ with st.sidebar:
         **Session**: {datetime.now().strftime('%d/%m/%Y à %H:%M')}
         """
         )
+        rss_text = (
+            f", RSS {load_info['rss_mb']:.0f} MB" if load_info.get("rss_mb") is not None else ""
+        )
+        st.caption(
+            f"📦 Pipeline ({load_info['pipeline_mb']:.1f} MB) chargé en "
+            f"{load_info['load_seconds']:.2f} s{rss_text}"
+        )
+        if load_info.get("warmup"):
+            st.caption(f"🔥 Préchauffage: {format_warmup(load_info['warmup'])}")
+        st.caption(
+            f"🔄 Version `{model_version.version_id}` en service depuis "
+            f"{model_version.loaded_at.strftime('%d/%m/%Y %H:%M:%S')} "
+            f"({model_reloader.reloads} rechargement(s) à chaud)"
+        )
+        if explainer.is_ready:
+            st.caption(f"⏱️ Explainer SHAP construit en {explainer.build_seconds:.2f} s")
+        else:
+            st.caption("⏳ Explainer SHAP en cours de construction...")
+        cache_stats = explainer.cache.stats()
+        st.caption(
+            f"🗂️ Cache SHAP: {cache_stats['size']} explication(s), "
+            f"taux de succès {cache_stats['hit_rate']:.0%} "
+            f"({cache_stats['hits']}/{cache_stats['hits'] + cache_stats['misses']})"
+        )
 
     st.caption(
         "💡 Un seuil plus élevé réduit les faux positifs mais peut manquer certaines fraudes."
@@ -292,8 +367,10 @@ st.markdown("## 🔍 Analyse de Transaction Unique")
 def load_demo_examples():
     """Charge 25 exemples prédéfinis (15 fraudes + 10 normales) pour faciliter les démonstrations."""
     try:
-        X = pd.read_csv(ROOT / "data" / "processed" / "X_test.csv")
-        y = pd.read_csv(ROOT / "data" / "processed" / "y_test.csv").squeeze()
+        # Parquet/Arrow si disponibles (lecture plus rapide), sinon CSV
+        processed_dir = ROOT / "data" / "processed"
+        X = read_table(find_table(processed_dir, "X_test"))
+        y = read_table(find_table(processed_dir, "y_test")).squeeze()
 
         # Sélectionner des exemples variés
         fraud_indices = y[y == 1].index.tolist()
@@ -361,7 +438,7 @@ if demo_examples:
         with col_info3:
             st.metric("Temps", f"{example_data.get('Time', 0):.0f} s")
 else:
-    st.caption("ℹ️ Les exemples prédéfinis seront disponibles après l'entraînement du modèle (data/processed/X_test.csv)")
+    st.caption("ℹ️ Les exemples prédéfinis seront disponibles après l'entraînement du modèle (data/processed/X_test.csv ou .parquet)")
 
 with st.form("single_tx_form"):
     # Initialisation des valeurs
@@ -475,7 +552,10 @@ if submitted:
     with st.expander("📊 Analyse détaillée des facteurs", expanded=True):
         # Utiliser FraudExplainer
         x_df = pd.DataFrame([payload])
+        hits_before = explainer.cache.hits
         reasons, error = explainer.explain(x_df, top_k=5)
+        if explainer.cache.hits > hits_before:
+            st.caption("♻️ Explication réutilisée depuis le cache SHAP")
 
         if error:
             st.warning(
@@ -513,6 +593,39 @@ if submitted:
                 "💡 **Interprétation**: Les valeurs SHAP positives (rouge) augmentent la probabilité de fraude, les valeurs négatives (vert) la diminuent."
             )
 
+# =========================
+# Explications globales (précalculées)
+# =========================
+with st.expander("🌐 Facteurs de risque globaux (SHAP)"):
+    shap_importance = explainer.get_feature_importance(method="shap")
+    if shap_importance:
+        summary = explainer.global_summary
+        fig_global = FraudVisualizer.create_global_importance(shap_importance, top_n=10)
+        st.plotly_chart(fig_global, use_container_width=True)
+
+        # Distribution des contributions SHAP sur les fraudes de l'échantillon
+        fraud_stats = summary["by_class"].get("1")
+        if fraud_stats:
+            top_features = sorted(shap_importance, key=shap_importance.get, reverse=True)[:10]
+            quantile_cols = [f"q{int(q * 100)}" for q in summary["quantiles"]]
+            dist = pd.DataFrame(
+                [fraud_stats["quantiles"][name] for name in top_features],
+                index=top_features,
+                columns=quantile_cols,
+            )
+            st.markdown("#### Distribution des contributions sur les fraudes")
+            st.dataframe(dist.style.format("{:.4f}"), use_container_width=True)
+
+        st.caption(
+            f"Calculé à l'entraînement sur {summary['n_samples']:,} transactions "
+            f"(échantillon stratifié), {summary.get('generated_at', 'date inconnue')}"
+        )
+    else:
+        st.info(
+            "ℹ️ Résumé SHAP global non disponible: relancez scripts/train_model.py "
+            "pour le générer (global_shap.json)."
+        )
+
 # =========================
 # Prédictions par lot (CSV)
 # =========================
@@ -528,16 +641,25 @@ st.caption(
 
 up = st.file_uploader("Sélectionner un fichier CSV", type=["csv"])
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def read_upload(content_hash: str, _raw: bytes):
+    """Lit, valide et nettoie un fichier importé (mis en cache par empreinte du contenu)."""
+    df_in = pd.read_csv(io.BytesIO(_raw))
+    validator = DataValidator(EXPECTED_COLS, max_rows=100_000)
+    is_valid, errors = validator.validate_dataframe(df_in)
+    df = validator.sanitize_dataframe(df_in) if is_valid else None
+    return df_in, df, errors
+
+
 if up is not None:
-    try:
-        # Lecture initiale
-        df_in = pd.read_csv(up)
+    raw = up.getvalue()
+    content_hash = hashlib.sha256(raw).hexdigest()
 
-        # Validation avec DataValidator
-        validator = DataValidator(EXPECTED_COLS, max_rows=100_000)
-        is_valid, errors = validator.validate_dataframe(df_in)
+    try:
+        # Lecture initiale + validation avec DataValidator
+        df_in, df, errors = read_upload(content_hash, raw)
 
-        if not is_valid:
+        if errors:
             for error in errors:
                 st.error(f"❌ {error}")
             st.info(
@@ -545,8 +667,6 @@ if up is not None:
             )
             st.stop()
 
-        # Nettoyer les données
-        df = validator.sanitize_dataframe(df_in)
         n_rows = len(df)
 
         if n_rows > 10_000:
@@ -558,10 +678,19 @@ if up is not None:
         st.error(f"Erreur de lecture du fichier: {e}")
         st.stop()
 
+    # Probabilités mises en cache par fichier: changer le seuil ne relance pas la forêt
+    # Clé sur l'empreinte de la version (un id() peut être réutilisé après un rechargement)
+    score_cache = st.session_state.setdefault("_score_cache", {})
+    cache_key = (content_hash, model_version.version_id)
+    scored = score_cache.get(cache_key)
+
     # Utiliser FraudPredictor pour les prédictions par batch
     CHUNK_SIZE = 5000
 
-    if n_rows > CHUNK_SIZE:
+    if scored is not None:
+        st.caption("♻️ Probabilités réutilisées: seul le seuil de décision est réappliqué")
+
+    elif n_rows > CHUNK_SIZE:
         st.info(f"📦 Traitement par batch de {CHUNK_SIZE:,} lignes...")
 
         progress_bar = st.progress(0)
@@ -573,12 +702,9 @@ if up is not None:
             progress_bar.progress(progress)
             status_text.text(f"Traité: {current:,} / {total:,} lignes")
 
-        # Utiliser predict_batch qui gère automatiquement les chunks
-        proba, pred = predictor.predict_batch(df, chunk_size=CHUNK_SIZE, threshold=user_thr)
-
-        # Simuler la progression pour l'affichage
-        for i in range(0, n_rows, CHUNK_SIZE):
-            update_progress(min(i + CHUNK_SIZE, n_rows), n_rows)
+        # predict_batch appelle le callback après chaque chunk traité
+        proba, _ = predictor.predict_batch(df, chunk_size=CHUNK_SIZE, progress=update_progress)
+        scored = ScoredBatch(proba)
 
         progress_bar.empty()
         status_text.empty()
@@ -587,16 +713,61 @@ if up is not None:
     else:
         # Traitement direct pour petits fichiers
         with st.spinner("Analyse en cours..."):
-            proba, pred = predictor.predict(df, threshold=user_thr)
+            proba, _ = predictor.predict(df)
+            scored = ScoredBatch(proba)
+
+    # Garder seulement les derniers fichiers analysés (le plus récent en dernier)
+    score_cache.pop(cache_key, None)
+    score_cache[cache_key] = scored
+    while len(score_cache) > 3:
+        score_cache.pop(next(iter(score_cache)))
+
+    # Sorties dépendant du seuil, recalculées depuis les probabilités en cache
+    proba = scored.probabilities
+    pred = scored.predictions(user_thr)
 
     # Résultats
     out = df_in.copy()
     out["fraud_proba"] = proba
     out["fraud_pred"] = pred
-    # Utiliser get_risk_level du predictor
-    out["risk_level"] = out["fraud_proba"].apply(predictor.get_risk_level)
+    # Niveaux de risque vectorisés (catégorielle ordonnée)
+    out["risk_level"] = predictor.get_risk_levels(proba)
+
+    n_alertes = scored.alert_count(user_thr)
 
-    n_alertes = int((pred == 1).sum())
+    # Raisons SHAP des seules transactions signalées, ajoutées au rapport
+    explain_alerts = st.checkbox(
+        "🔍 Ajouter les raisons SHAP des alertes au rapport",
+        value=False,
+        help="Explique uniquement les transactions au-dessus du seuil (pool de processus).",
+    )
+    if explain_alerts and n_alertes > 0:
+        reasons_cache = st.session_state.setdefault("_reasons_cache", {})
+        reasons_key = (content_hash, model_version.version_id, float(user_thr))
+        reasons = reasons_cache.get(reasons_key)
+
+        if reasons is None:
+            progress_bar = st.progress(0)
+
+            def update_explain_progress(current, total):
+                progress_bar.progress(current / total)
+
+            with st.spinner(f"Explication de {n_alertes:,} alerte(s)..."):
+                reasons, error = explainer.explain_flagged(
+                    df, pred, top_k=3, n_jobs=-1, progress=update_explain_progress
+                )
+            progress_bar.empty()
+
+            if error:
+                st.warning(f"⚠️ {error}")
+            else:
+                # Garder seulement les dernières explications (la plus récente en dernier)
+                reasons_cache[reasons_key] = reasons
+                while len(reasons_cache) > 3:
+                    reasons_cache.pop(next(iter(reasons_cache)))
+
+        if reasons is not None:
+            out = FraudExplainer.attach_reasons(out, reasons)
     n_total = len(out)
     pct_alertes = (n_alertes / n_total * 100) if n_total > 0 else 0
 
@@ -697,6 +868,13 @@ if up is not None:
     with tab2:
         fraudes = out[out["fraud_pred"] == 1]
         if len(fraudes) > 0:
+            if "reason_1" in fraudes.columns:
+                # Raisons affichées juste après la probabilité
+                reason_cols = [col for col in fraudes.columns if col.startswith("reason_")]
+                first_cols = ["fraud_proba", "risk_level"] + reason_cols
+                fraudes = fraudes[
+                    first_cols + [col for col in fraudes.columns if col not in first_cols]
+                ]
             st.dataframe(fraudes, use_container_width=True, height=400)
 
             st.markdown("#### Statistiques des fraudes")
@@ -739,14 +917,15 @@ if up is not None:
 
     with tab4:
         # Camembert des risques avec FraudVisualizer
-        risk_counts = out["risk_level"].value_counts().to_dict()
+        risk_counts = out["risk_level"].value_counts(sort=False)
+        risk_counts = risk_counts[risk_counts > 0].to_dict()
         fig_pie = FraudVisualizer.create_risk_pie(risk_counts)
         st.plotly_chart(fig_pie, use_container_width=True)
 
         # Tableau récapitulatif
         st.markdown("#### Récapitulatif par niveau de risque")
         risk_summary = (
-            out.groupby("risk_level")
+            out.groupby("risk_level", observed=True)
             .agg({"fraud_proba": ["count", "mean", "min", "max"]})
             .round(4)
         )
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark du temps d'import des modules src (coût de démarrage des CLI).
+
+Chaque module est importé dans un interpréteur neuf, plusieurs fois; le
+script affiche la médiane du temps d'import, du temps total du processus et
+les dépendances lourdes chargées au passage.
+
+Usage:
+    python scripts/bench_imports.py
+    python scripts/bench_imports.py --repeat 10 --max-ms 1500 --output reports/import_times.jsonl
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).parent.parent
+
+# Modules utilisés par les scripts de scoring (predict.py, serve.py) et l'application
+DEFAULT_MODULES = [
+    "src.data.loader",
+    "src.models.predictor",
+    "src.models.explainer",
+    "src.serving.server",
+    "src.visualization.plots",
+]
+
+# Dépendances dont le chargement est signalé
+HEAVY_MODULES = ["shap", "sklearn", "imblearn", "scipy", "plotly", "streamlit", "pyarrow"]
+
+CHILD_CODE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    """Importe un module dans un nouvel interpréteur et mesure le temps écoulé."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    process_seconds = time.perf_counter() - start
+    measure = json.loads(result.stdout.strip().splitlines()[-1])
+    measure["process_seconds"] = process_seconds
+    return measure
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Benchmark du temps d'import des modules src")
+    parser.add_argument(
+        "--modules", nargs="+", default=DEFAULT_MODULES, help="Modules à mesurer"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Mesures par module (default: 5)")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="Budget d'import par module (ms): code de sortie 1 si une médiane le dépasse",
+    )
+    parser.add_argument(
+        "--output", type=str, help="Fichier .jsonl où ajouter les résultats (suivi dans le temps)"
+    )
+    args = parser.parse_args()
+
+    print(f"⏱️  Temps d'import ({args.repeat} interpréteurs neufs par module)\n")
+    print(f"   {'Module':<28}{'import (ms)':>12}{'processus (ms)':>16}   Dépendances lourdes")
+
+    results = {}
+    for module in args.modules:
+        measures = [measure_import(module) for _ in range(args.repeat)]
+        import_ms = float(np.median([m["seconds"] for m in measures]) * 1000)
+        process_ms = float(np.median([m["process_seconds"] for m in measures]) * 1000)
+        heavy = measures[-1]["heavy"]
+        results[module] = {"import_ms": import_ms, "process_ms": process_ms, "heavy": heavy}
+        print(
+            f"   {module:<28}{import_ms:>12.0f}{process_ms:>16.0f}   {', '.join(heavy) or '-'}"
+        )
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "repeat": args.repeat,
+            "modules": results,
+        }
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        print(f"\n💾 Résultats ajoutés à {output_path}")
+
+    if args.max_ms is not None:
+        over = [m for m, r in results.items() if r["import_ms"] > args.max_ms]
+        if over:
+            print(f"\n❌ Budget de {args.max_ms:.0f} ms dépassé: {', '.join(over)}")
+            sys.exit(1)
+        print(f"\n✅ Tous les imports sous {args.max_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
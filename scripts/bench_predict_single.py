@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latence de FraudPredictor.predict_single.
+
+Compare le chemin pandas + pipeline sklearn au chemin rapide
+(dictionnaire -> ndarray, prétraitement et forêt compilés).
+
+Usage:
+    python scripts/bench_predict_single.py --model models/rf_smote_final --n 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ajouter le dossier parent au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.loader import ArtifactLoader
+from src.models.predictor import FraudPredictor
+
+
+def measure(predictor: FraudPredictor, transactions: list, warmup: int = 20) -> np.ndarray:
+    """Mesure la latence (en ms) de chaque appel à predict_single."""
+    for tx in transactions[:warmup]:
+        predictor.predict_single(tx)
+
+    latencies = np.empty(len(transactions))
+    for i, tx in enumerate(transactions):
+        start = time.perf_counter()
+        predictor.predict_single(tx)
+        latencies[i] = (time.perf_counter() - start) * 1000.0
+    return latencies
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Benchmark de latence de predict_single")
+    parser.add_argument("--model", type=str, required=True, help="Dossier contenant le modèle")
+    parser.add_argument("--n", type=int, default=2000, help="Nombre d'appels (default: 2000)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine aléatoire (default: 0)")
+    args = parser.parse_args()
+
+    loader = ArtifactLoader(Path(args.model))
+    pipeline, metrics, columns, _ = loader.load_artifacts()
+    all_cols = columns["all_cols"]
+    threshold = metrics.get("threshold", 0.5)
+
+    rng = np.random.default_rng(args.seed)
+    values = rng.normal(size=(args.n, len(all_cols)))
+    transactions = [dict(zip(all_cols, row)) for row in values]
+
+    print(f"⏱️  {args.n:,} transactions uniques, {len(all_cols)} features\n")
+    print(f"   {'Chemin':<28}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}")
+
+    for label, engine in [("pandas + sklearn", "sklearn"), ("rapide (compilé)", "auto")]:
+        predictor = FraudPredictor(pipeline, all_cols, threshold, engine=engine)
+        latencies = measure(predictor, transactions)
+        p50, p99 = np.percentile(latencies, [50, 99])
+        print(f"   {label:<28}{p50:>10.3f}{p99:>10.3f}{latencies.max():>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
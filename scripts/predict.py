@@ -8,19 +8,199 @@ Usage:
 
     # Prédire une transaction unique
     python scripts/predict.py --model models/rf_smote_final --amount 100.5 --time 3600
+
+    # Transaction unique via le démon (modèle déjà chargé), sinon chargement local
+    python scripts/serve.py --model models/rf_smote_final --unix-socket &
+    python scripts/predict.py --model models/rf_smote_final --amount 100.5 --time 3600
+
+    # Scoring parallèle sur tous les cœurs
+    python scripts/predict.py --input data/test.csv --model models/rf_smote_final --workers -1
+
+    # Fichier volumineux: lecture et écriture par blocs (mémoire bornée)
+    python scripts/predict.py --input dump.csv --output scored.csv --model models/rf_smote_final --stream
+
+    # Formats colonnes (choisis par extension: .csv, .parquet, .arrow/.feather)
+    python scripts/predict.py --input dump.parquet --output scored.parquet --model models/rf_smote_final
+
+    # Raisons SHAP des transactions signalées ajoutées au rapport
+    python scripts/predict.py --input data/test.csv --output scored.csv --model models/rf_smote_final --explain
 """
 
 import argparse
 import sys
 from pathlib import Path
-
-import pandas as pd
+from typing import TYPE_CHECKING, List, Optional
 
 # Ajouter le dossier parent au PYTHONPATH
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.data.loader import ArtifactLoader
-from src.models.predictor import FraudPredictor
+# Seul le client (bibliothèque standard) est importé au démarrage: une
+# transaction servie par le démon ne paie pas l'import de pandas/sklearn
+from src.serving.client import DEFAULT_SOCKET, ScoringClient
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.models.explainer import FraudExplainer
+    from src.models.predictor import FraudPredictor
+
+
+def score_dataframe(
+    predictor: "FraudPredictor",
+    df: "pd.DataFrame",
+    chunk_size: int,
+    n_jobs: int,
+    explainer: Optional["FraudExplainer"] = None,
+    top_k: int = 3,
+) -> "pd.DataFrame":
+    """
+    Ajoute les colonnes fraud_proba, fraud_pred et risk_level à un DataFrame.
+
+    Avec un explainer, ajoute aussi les ``top_k`` raisons SHAP des lignes
+    signalées (colonnes reason_i et reason_i_shap).
+    """
+    probas, preds = predictor.predict_batch(df, chunk_size=chunk_size, n_jobs=n_jobs)
+    reasons = None
+    if explainer is not None:
+        # Explications calculées sur les features d'origine, avant ajout des sorties
+        reasons, error = explainer.explain_flagged(
+            predictor.ensure_columns(df), preds, top_k=top_k, n_jobs=n_jobs
+        )
+        if error:
+            print(f"⚠️  {error}")
+            # Colonnes de raisons vides: même schéma d'un bloc à l'autre (ajout CSV, Parquet)
+            reasons = explainer.empty_reasons(top_k)
+    df["fraud_proba"] = probas
+    df["fraud_pred"] = preds
+    df["risk_level"] = predictor.get_risk_levels(probas)
+    if reasons is not None:
+        df = explainer.attach_reasons(df, reasons)
+    return df
+
+
+def score_stream(
+    predictor: "FraudPredictor",
+    input_path: Path,
+    output_path: Optional[Path],
+    stream_rows: int,
+    chunk_size: int,
+    n_jobs: int,
+    columns: Optional[List[str]] = None,
+    float32: bool = False,
+    explainer: Optional["FraudExplainer"] = None,
+    top_k: int = 3,
+) -> dict:
+    """
+    Score un fichier bloc par bloc, en ajoutant chaque bloc au fichier de sortie.
+
+    Seul un bloc de ``stream_rows`` lignes est en mémoire à la fois; les
+    statistiques du résumé sont cumulées au fil des blocs. Une entrée vide
+    donne un bloc vide: la sortie garde ses colonnes (en-tête seul).
+
+    Returns:
+        Dictionnaire {total, fraudes, proba_sum, preview}
+    """
+    from itertools import chain
+
+    import pandas as pd
+
+    from src.data.io import TableWriter, iter_table, table_columns
+
+    summary = {"total": 0, "fraudes": 0, "proba_sum": 0.0, "preview": None}
+    writer = TableWriter(output_path, float32=float32) if output_path is not None else None
+
+    try:
+        # Variables du modèle lues en flottants dans tous les blocs: l'inférence
+        # bloc par bloc du CSV changerait sinon le schéma de sortie en cours de route
+        dtype = {col: "float64" for col in predictor.expected_columns}
+        chunks = iter_table(input_path, stream_rows, columns=columns, float32=float32, dtype=dtype)
+        first = next(chunks, None)
+        if first is None:
+            # Parquet/Arrow sans ligne: aucun bloc lu, on score un bloc vide
+            names = columns if columns is not None else table_columns(input_path)
+            first = pd.DataFrame(columns=names, dtype="float64")
+        for chunk in chain([first], chunks):
+            chunk = score_dataframe(predictor, chunk, chunk_size, n_jobs, explainer, top_k)
+
+            summary["total"] += len(chunk)
+            summary["fraudes"] += int(chunk["fraud_pred"].sum())
+            summary["proba_sum"] += float(chunk["fraud_proba"].sum())
+            if summary["preview"] is None:
+                summary["preview"] = chunk.head(10)
+
+            if writer is not None:
+                writer.write(chunk)
+            print(f"   {summary['total']:,} transactions traitées", end="\r", flush=True)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    print()
+    return summary
+
+
+def print_load_info(load_info: dict) -> None:
+    """Affiche le temps de chargement et la mémoire résidente du modèle."""
+    rss_text = ""
+    if load_info.get("rss_mb") is not None:
+        rss_text = f", RSS {load_info['rss_mb']:.0f} MB ({load_info['rss_delta_mb']:+.0f} MB)"
+    forest_text = ", arbres projetés en mémoire" if load_info.get("forest_only") else ""
+    print(
+        f"   ⏱️  Pipeline ({load_info['pipeline_mb']:.1f} MB) chargé en "
+        f"{load_info['load_seconds']:.2f}s{rss_text}{forest_text}"
+    )
+
+
+def print_transaction_result(
+    transaction: dict, proba: float, pred: int, risk: str
+) -> None:
+    """Affiche le résultat d'une transaction unique."""
+    print(f"💳 Analyse de la transaction:")
+    print(f"   Montant: {transaction['Amount']:.2f}€")
+    print(f"   Temps: {transaction['Time']:.0f}s")
+
+    print(f"\n📊 Résultat:")
+    print(f"   Probabilité de fraude: {proba*100:.2f}%")
+    print(f"   Prédiction: {'🚨 FRAUDE' if pred == 1 else '✅ NORMALE'}")
+    print(f"   Niveau de risque: {risk}")
+
+
+def predict_with_daemon(args) -> bool:
+    """
+    Score la transaction unique avec le démon s'il sert le modèle demandé,
+    avec le moteur (--engine) et le mode mmap (--mmap) explicitement demandés.
+
+    Returns:
+        True si le démon a répondu, False pour basculer sur le chargement local
+    """
+    # Options explicites transmises au démon: il ne répond que s'il les applique
+    options = {}
+    if args.engine is not None:
+        options["engine"] = args.engine
+    if args.mmap:
+        options["mmap"] = True
+    if args.compact_forest:
+        options["compact_forest"] = True
+
+    client = ScoringClient(Path(args.socket))
+    if not client.serves(Path(args.model), options):
+        return False
+
+    transaction = {"Amount": args.amount, "Time": args.time}
+    try:
+        result = client.predict(transaction)
+    except OSError:
+        return False
+    except ValueError as e:
+        print(f"❌ Erreur: {e}")
+        sys.exit(1)
+
+    proba = result["fraud_proba"]
+    pred = int(proba >= args.threshold) if args.threshold else result["fraud_pred"]
+    print(f"⚡ Modèle servi par le démon ({args.socket})")
+    print()
+    print_transaction_result(transaction, proba, pred, result["risk_level"])
+    return True
 
 
 def main():
@@ -30,7 +210,7 @@ def main():
         "--model", type=str, required=True, help="Dossier contenant le modèle"
     )
     parser.add_argument(
-        "--input", type=str, help="Fichier CSV contenant les transactions"
+        "--input", type=str, help="Fichier de transactions (.csv, .parquet, .arrow)"
     )
     parser.add_argument(
         "--output", type=str, help="Fichier de sortie pour les prédictions"
@@ -40,12 +220,123 @@ def main():
     parser.add_argument(
         "--threshold", type=float, help="Seuil de décision personnalisé"
     )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help=(
+            "Scorer avec la forêt compilée projetée en mémoire, sans charger les arbres du "
+            "pipeline (nécessite --export-forest; pipeline complet avec --explain)"
+        ),
+    )
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Mesurer la latence du moteur sur des lots synthétiques après le chargement",
+    )
+    parser.add_argument(
+        "--compact-forest",
+        action="store_true",
+        help=(
+            "Scorer avec la forêt compacte (train_model.py --export-compact): plus légère, "
+            "probabilités légèrement différentes de celles de sklearn"
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["sklearn", "compiled", "auto"],
+        default=None,
+        help="Moteur d'inférence (default: auto)",
+    )
+    parser.add_argument(
+        "--risk-bands",
+        type=float,
+        nargs=3,
+        default=None,
+        metavar=("MODERE", "ELEVE", "CRITIQUE"),
+        help="Bornes des niveaux de risque (default: 0.3 0.5 0.8)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Nombre de processus pour le scoring par lot, à partir de 20 000 lignes "
+            "(-1 = tous les cœurs, default: 1)"
+        ),
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=5000, help="Taille des chunks (default: 5000)"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Lire et écrire le fichier par blocs (mémoire bornée)",
+    )
+    parser.add_argument(
+        "--stream-rows",
+        type=int,
+        default=100_000,
+        help="Nombre de lignes lues par bloc en mode --stream (default: 100000)",
+    )
+    parser.add_argument(
+        "--model-columns-only",
+        action="store_true",
+        help="Ne lire que les colonnes utilisées par le modèle (projection)",
+    )
+    parser.add_argument(
+        "--float32",
+        action="store_true",
+        help="Lire et écrire les colonnes flottantes en float32",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Ajouter les raisons SHAP des transactions signalées au rapport",
+    )
+    parser.add_argument(
+        "--explain-top-k",
+        type=int,
+        default=3,
+        help="Nombre de raisons par transaction signalée (default: 3)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=str(DEFAULT_SOCKET),
+        help=f"Socket du démon de scoring (serve.py --unix-socket, default: {DEFAULT_SOCKET})",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Toujours charger le modèle localement, sans interroger le démon",
+    )
 
     args = parser.parse_args()
 
+    # Mode client: transaction unique scorée par le démon (niveaux de risque par défaut)
+    single = args.input is None and args.amount is not None and args.time is not None
+    if single and not args.no_daemon and args.risk_bands is None and predict_with_daemon(args):
+        return
+
+    # Chargement local: dépendances lourdes importées seulement maintenant
+    from src.data.io import read_table, table_columns, write_table
+    from src.data.loader import DEFAULT_WARMUP_SIZES, ArtifactLoader, format_warmup
+    from src.models.explainer import FraudExplainer
+    from src.models.predictor import DEFAULT_RISK_BANDS, FraudPredictor
+
+    args.engine = args.engine or "auto"
+    args.risk_bands = args.risk_bands or DEFAULT_RISK_BANDS
+
     # Charger les artefacts
     print(f"📂 Chargement du modèle depuis {args.model}...")
-    loader = ArtifactLoader(Path(args.model))
+    loader = ArtifactLoader(
+        Path(args.model),
+        mmap_mode="r" if args.mmap else None,
+        warmup_sizes=DEFAULT_WARMUP_SIZES if args.warmup else (),
+        # SHAP a besoin des arbres sklearn
+        forest_only=args.mmap and args.engine != "sklearn" and not args.explain,
+        compact=args.compact_forest,
+    )
 
     try:
         pipeline, metrics, columns, warnings = loader.load_artifacts()
@@ -56,6 +347,7 @@ def main():
 
         if not warnings:
             print("✅ Modèle chargé avec succès")
+        print_load_info(loader.load_info)
 
     except FileNotFoundError as e:
         print(f"❌ Erreur: {e}")
@@ -63,7 +355,25 @@ def main():
 
     # Créer le prédicateur
     threshold = args.threshold if args.threshold else metrics.get("threshold", 0.5)
-    predictor = FraudPredictor(pipeline, columns["all_cols"], threshold)
+    forest = loader.load_compiled_forest(pipeline) if args.engine != "sklearn" else None
+    if forest is not None:
+        print(f"   🌲 Forêt compilée chargée ({forest.nbytes / 2**20:.1f} MB)")
+    predictor = FraudPredictor(
+        pipeline,
+        columns["all_cols"],
+        threshold,
+        engine=args.engine,
+        risk_bands=args.risk_bands,
+        forest=forest,
+    )
+
+    # Préchauffage optionnel (--warmup), avec le moteur configuré
+    for warning in loader.warmup(predictor, metrics):
+        print(f"   {warning}")
+    if loader.load_info["warmup"]:
+        print(f"   🔥 Préchauffage: {format_warmup(loader.load_info['warmup'])}")
+
+    explainer = FraudExplainer(pipeline) if args.explain else None
 
     print(f"🎯 Seuil de décision: {threshold:.4f}")
     print()
@@ -77,48 +387,70 @@ def main():
             sys.exit(1)
 
         print(f"📊 Prédiction sur {input_path}...")
-        df = pd.read_csv(input_path)
-        print(f"   {len(df):,} transactions à analyser")
+        output_path = Path(args.output) if args.output else None
 
-        # Prédire
-        probas, preds = predictor.predict_batch(df)
+        # Projection: uniquement les colonnes du modèle présentes dans le fichier
+        read_cols = None
+        if args.model_columns_only:
+            available = set(table_columns(input_path))
+            read_cols = [col for col in columns["all_cols"] if col in available]
 
-        # Ajouter les résultats
-        df["fraud_proba"] = probas
-        df["fraud_pred"] = preds
-        df["risk_level"] = [predictor.get_risk_level(p) for p in probas]
+        if args.stream:
+            summary = score_stream(
+                predictor,
+                input_path,
+                output_path,
+                args.stream_rows,
+                args.chunk_size,
+                args.workers,
+                columns=read_cols,
+                float32=args.float32,
+                explainer=explainer,
+                top_k=args.explain_top_k,
+            )
+        else:
+            df = read_table(input_path, columns=read_cols, float32=args.float32)
+            print(f"   {len(df):,} transactions à analyser")
+
+            # Prédire et ajouter les résultats
+            df = score_dataframe(
+                predictor, df, args.chunk_size, args.workers, explainer, args.explain_top_k
+            )
+            summary = {
+                "total": len(df),
+                "fraudes": int(df["fraud_pred"].sum()),
+                "proba_sum": float(df["fraud_proba"].sum()),
+                "preview": df.head(10),
+            }
+            if output_path is not None:
+                write_table(df, output_path, float32=args.float32)
+        predictor.close()
+        if explainer is not None:
+            explainer.close()
 
         # Résumé
-        n_fraudes = preds.sum()
+        n_total = summary["total"]
+        n_fraudes = summary["fraudes"]
         print(f"\n📈 Résultats:")
-        print(f"   Total: {len(df):,} transactions")
-        print(f"   Fraudes détectées: {n_fraudes} ({n_fraudes/len(df)*100:.2f}%)")
-        print(f"   Probabilité moyenne: {probas.mean():.4f}")
-
-        # Sauvegarder
-        if args.output:
-            output_path = Path(args.output)
-            df.to_csv(output_path, index=False)
+        print(f"   Total: {n_total:,} transactions")
+        if n_total:
+            print(f"   Fraudes détectées: {n_fraudes} ({n_fraudes/n_total*100:.2f}%)")
+            print(f"   Probabilité moyenne: {summary['proba_sum'] / n_total:.4f}")
+
+        # Sauvegarde / aperçu
+        if output_path is not None:
             print(f"\n💾 Résultats sauvegardés dans {output_path}")
-        else:
+        elif n_total:
             print("\n📋 Aperçu des résultats:")
-            print(df.head(10))
+            print(summary["preview"])
+        else:
+            print("\n📋 Aucune transaction dans le fichier d'entrée")
 
     elif args.amount is not None and args.time is not None:
         # Prédiction sur transaction unique
         transaction = {"Amount": args.amount, "Time": args.time}
-
-        print(f"💳 Analyse de la transaction:")
-        print(f"   Montant: {args.amount:.2f}€")
-        print(f"   Temps: {args.time:.0f}s")
-
         proba, pred = predictor.predict_single(transaction, threshold)
-        risk = predictor.get_risk_level(proba)
-
-        print(f"\n📊 Résultat:")
-        print(f"   Probabilité de fraude: {proba*100:.2f}%")
-        print(f"   Prédiction: {'🚨 FRAUDE' if pred == 1 else '✅ NORMALE'}")
-        print(f"   Niveau de risque: {risk}")
+        print_transaction_result(transaction, proba, pred, predictor.get_risk_level(proba))
 
     else:
         print("❌ Erreur: Spécifiez --input ou (--amount et --time)")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Service HTTP local de scoring avec regroupement en micro-lots.
+
+Usage:
+    python scripts/serve.py --model models/rf_smote_final --port 8765
+
+    curl -X POST http://127.0.0.1:8765/predict -d '{"Amount": 100.5, "Time": 3600}'
+
+    # Rechargement à chaud: un nouveau modèle copié dans le dossier est mis
+    # en service sans redémarrage (vérification toutes les 5 secondes)
+    python scripts/serve.py --model models/rf_smote_final --reload-interval 5
+
+    # Démon local: modèle gardé en mémoire derrière une socket Unix, utilisé
+    # par predict.py --amount/--time (client) au lieu de recharger le modèle
+    python scripts/serve.py --model models/rf_smote_final --unix-socket
+
+    # Registre: le champion est servi, les challengers sont évalués en fantôme
+    # et leurs scores journalisés dans reports/shadow/shadow_scores.jsonl
+    python scripts/serve.py --registry models
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Ajouter le dossier parent au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.loader import DEFAULT_WARMUP_SIZES, format_warmup
+from src.data.registry import ModelRegistry
+from src.models.shadow import ShadowLog
+from src.serving.client import DEFAULT_SOCKET
+from src.serving.reloader import ModelReloader, ModelVersion
+from src.serving.server import ScoringServer
+
+
+def main():
+    """Fonction principale."""
+    parser = argparse.ArgumentParser(description="Service local de scoring de fraude")
+    parser.add_argument(
+        "--model",
+        type=str,
+        help="Dossier contenant le modèle (default: champion du registre)",
+    )
+    parser.add_argument(
+        "--registry",
+        type=str,
+        help="Registre de modèles: les challengers sont évalués en fantôme",
+    )
+    parser.add_argument(
+        "--shadow-log",
+        type=str,
+        default="reports/shadow/shadow_scores.jsonl",
+        help="Journal des scores fantômes (default: reports/shadow/shadow_scores.jsonl)",
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Adresse d'écoute")
+    parser.add_argument(
+        "--unix-socket",
+        nargs="?",
+        const=str(DEFAULT_SOCKET),
+        help=f"Mode démon: écouter sur une socket Unix au lieu de TCP (default: {DEFAULT_SOCKET})",
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Port d'écoute (default: 8765)")
+    parser.add_argument("--threshold", type=float, help="Seuil de décision personnalisé")
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help=(
+            "Scorer avec la forêt compilée projetée en mémoire, sans charger les arbres du "
+            "pipeline (pages partagées entre processus, nécessite --export-forest)"
+        ),
+    )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Ne pas mesurer la latence du moteur sur des lots synthétiques au chargement",
+    )
+    parser.add_argument(
+        "--compact-forest",
+        action="store_true",
+        help=(
+            "Scorer avec la forêt compacte (train_model.py --export-compact): plus légère, "
+            "probabilités légèrement différentes de celles de sklearn"
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["sklearn", "compiled", "auto"],
+        default="auto",
+        help="Moteur d'inférence (default: auto)",
+    )
+    parser.add_argument(
+        "--max-batch-size", type=int, default=64, help="Taille maximale d'un micro-lot"
+    )
+    parser.add_argument(
+        "--max-wait-ms", type=float, default=2.0, help="Attente maximale d'un micro-lot (ms)"
+    )
+    parser.add_argument(
+        "--reload-interval",
+        type=float,
+        default=0.0,
+        help="Intervalle (s) de vérification des artefacts pour le rechargement à chaud "
+        "(0 = désactivé, default: 0)",
+    )
+    args = parser.parse_args()
+
+    registry = ModelRegistry(Path(args.registry)) if args.registry else None
+    if args.model:
+        model_dir = Path(args.model)
+    elif registry is not None and registry.champion() is not None:
+        model_dir = registry.root / registry.champion()
+    else:
+        parser.error("--model est requis (ou --registry avec une version champion)")
+
+    print(f"📂 Chargement du modèle depuis {model_dir}...")
+    try:
+        reloader = ModelReloader(
+            model_dir,
+            engine=args.engine,
+            threshold=args.threshold,
+            mmap_mode="r" if args.mmap else None,
+            interval=args.reload_interval,
+            warmup_sizes=() if args.no_warmup else DEFAULT_WARMUP_SIZES,
+            forest_only=args.mmap and args.engine != "sklearn",
+            compact=args.compact_forest,
+        )
+    except FileNotFoundError as e:
+        print(f"❌ Erreur: {e}")
+        sys.exit(1)
+
+    version = reloader.current
+    for warning in version.warnings:
+        print(f"   {warning}")
+    print(f"   ⏱️  Pipeline chargé en {version.load_info['load_seconds']:.2f}s")
+    if version.load_info.get("warmup"):
+        print(f"   🔥 Préchauffage: {format_warmup(version.load_info['warmup'])}")
+
+    # Challengers du registre, chargés une seule fois et rattachés à chaque version servie
+    challengers = {}
+    if registry is not None:
+        for name in registry.challengers():
+            if name == model_dir.name:
+                continue
+            pipe, metrics, _, _ = registry.loader(name).load_artifacts()
+            challengers[name] = (pipe, metrics.get("threshold"))
+    shadow_log = ShadowLog(Path(args.shadow_log)) if challengers else None
+
+    def attach_challengers(predictor) -> None:
+        """Ajoute les challengers au prédicateur en service."""
+        predictor.champion_name = model_dir.name
+        predictor.shadow_log = shadow_log
+        for name, (pipe, challenger_threshold) in challengers.items():
+            shared = predictor.add_challenger(name, pipe, threshold=challenger_threshold)
+            mode = "prétraitement partagé" if shared else "pipeline complet"
+            print(f"   👥 Challenger {name} évalué en fantôme ({mode})")
+
+    predictor = version.predictor
+    attach_challengers(predictor)
+    threshold = predictor.threshold
+    server = ScoringServer(
+        predictor,
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        unix_socket=Path(args.unix_socket) if args.unix_socket else None,
+        # Options comparées par predict.py avant de lui confier une transaction
+        metadata={
+            "model_dir": str(model_dir.resolve()),
+            "engine": args.engine,
+            "mmap": args.mmap,
+            "compact_forest": args.compact_forest,
+        },
+    )
+
+    def on_swap(new_version: ModelVersion) -> None:
+        """Met la nouvelle version en service."""
+        attach_challengers(new_version.predictor)
+        server.set_predictor(new_version.predictor)
+        print(f"🔄 Nouveau modèle en service: {new_version.version_id}")
+
+    if args.reload_interval > 0:
+        reloader.on_swap = on_swap
+        reloader.start()
+        print(f"🔄 Rechargement à chaud actif (toutes les {args.reload_interval:g}s)")
+
+    print(f"🎯 Seuil de décision: {threshold:.4f}")
+    if shadow_log is not None:
+        print(f"📝 Scores fantômes journalisés dans {shadow_log.path}")
+    if args.unix_socket:
+        print(f"🚀 Démon disponible sur {args.unix_socket} (Ctrl+C pour arrêter)")
+    else:
+        print(f"🚀 Service disponible sur http://{args.host}:{args.port} (Ctrl+C pour arrêter)")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n👋 Service arrêté")
+    except OSError as e:
+        print(f"❌ Erreur: {e}")
+        sys.exit(1)
+    finally:
+        reloader.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,17 @@ Basé sur le notebook 02_preparation.ipynb
 
 Usage:
     python scripts/train_model.py --data data/raw/creditcard.csv
+
+    # Mise à jour incrémentale: arbres ajoutés sur une nouvelle fenêtre de données
+    python scripts/train_model.py --data data/raw/window.csv \
+        --warm-start-from models/rf_smote_final --add-trees 50 --max-trees 300 \
+        --output models/rf_smote_v2
 """
 
 import argparse
 import json
 import sys
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
@@ -32,11 +38,24 @@ from sklearn.metrics import (
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
+# Ajouter le dossier parent au PYTHONPATH
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.cache import DEFAULT_CACHE_DIR, ResampleCache
+from src.data.io import read_table, write_table
+from src.data.loader import ArtifactLoader, benchmark_scoring, format_warmup
+from src.data.registry import STAGES, ModelRegistry
+from src.models.explainer import FraudExplainer
+from src.models.forest import CompiledForest, transform_features
+from src.models.incremental import warm_start_forest
+from src.models.predictor import FraudPredictor
+from src.models.search import DEFAULT_PARAM_GRID, SuccessiveHalvingSearch
+
 
 def load_data(data_path: Path) -> pd.DataFrame:
     """Charge les données."""
     print(f"📂 Chargement des données depuis {data_path}...")
-    df = pd.read_csv(data_path)
+    df = read_table(data_path)
     print(f"✅ {len(df):,} transactions chargées")
     return df
 
@@ -65,12 +84,25 @@ def split_data(df: pd.DataFrame, test_size: float = 0.30, random_state: int = 42
     return X_train, X_valid, X_test, y_train, y_valid, y_test
 
 
-def build_pipeline(smote_strategy: float = 0.2, random_state: int = 42, all_cols: list = None) -> ImbPipeline:
+def build_pipeline(
+    smote_strategy: float = 0.2,
+    random_state: int = 42,
+    all_cols: list = None,
+    n_estimators: int = 300,
+    max_depth: int = None,
+    max_features="sqrt",
+    n_jobs: int = -1,
+    verbose: bool = True,
+) -> ImbPipeline:
     """
     Construit le pipeline ML exactement comme dans le notebook.
     Pipeline: ColumnTransformer (scale Amount/Time) → SMOTE → RandomForest
+
+    Les paramètres de la forêt (n_estimators, max_depth, max_features) sont
+    ceux du notebook par défaut et peuvent venir de la recherche (--search).
     """
-    print("\n🔧 Construction du pipeline...")
+    if verbose:
+        print("\n🔧 Construction du pipeline...")
 
     scale_cols = ["Amount", "Time"]
     
@@ -82,8 +114,10 @@ def build_pipeline(smote_strategy: float = 0.2, random_state: int = 42, all_cols
 
     # Random Forest avec les mêmes paramètres que le notebook
     rf = RandomForestClassifier(
-        n_estimators=300,
-        n_jobs=-1,
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        max_features=max_features,
+        n_jobs=n_jobs,
         random_state=random_state
     )
 
@@ -94,10 +128,58 @@ def build_pipeline(smote_strategy: float = 0.2, random_state: int = 42, all_cols
         ("model", rf),
     ])
 
-    print("✅ Pipeline créé: ColumnTransformer → SMOTE → RandomForest")
+    if verbose:
+        print("✅ Pipeline créé: ColumnTransformer → SMOTE → RandomForest")
     return pipeline
 
 
+def search_hyperparameters(
+    X_train,
+    y_train,
+    X_valid,
+    y_valid,
+    param_grid: dict = None,
+    factor: int = 3,
+    n_jobs: int = -1,
+    random_state: int = 42,
+    resample_cache: ResampleCache = None,
+):
+    """
+    Recherche n_estimators, max_depth, max_features et la stratégie SMOTE
+    par divisions successives (PR-AUC sur le validation set).
+
+    Returns:
+        Tuple (meilleurs paramètres, trace complète de la recherche)
+    """
+    # Un thread par modèle: le parallélisme vient du pool de processus
+    builder = partial(build_pipeline, random_state=random_state, n_jobs=1, verbose=False)
+    search = SuccessiveHalvingSearch(
+        builder,
+        param_grid=param_grid,
+        factor=factor,
+        n_jobs=n_jobs,
+        random_state=random_state,
+        resample_cache=resample_cache,
+    )
+    print(
+        f"\n🔎 Recherche d'hyperparamètres: {len(search.candidates)} candidats, "
+        f"{search.n_rounds} tours (facteur {factor})..."
+    )
+
+    def report(entry: dict) -> None:
+        """Affiche le résultat d'un tour."""
+        best = entry["results"][0]
+        print(
+            f"   Tour {entry['round']}: {entry['n_candidates']} candidat(s) sur "
+            f"{entry['n_rows']:,} lignes ({entry['seconds']:.1f}s), "
+            f"meilleure PR-AUC {best['pr_auc'] or 0:.4f} {best['params']}"
+        )
+
+    best_params = search.fit(X_train, y_train, X_valid, y_valid, progress=report)
+    print(f"✅ Meilleure configuration: {best_params} (PR-AUC {search.best_score:.4f})")
+    return best_params, search.to_dict()
+
+
 def choose_threshold_by_precision_recall(y_true, y_proba, precision_min=0.20):
     """
     Choisit le seuil optimal basé sur Precision >= precision_min et Recall max.
@@ -131,17 +213,80 @@ def choose_threshold_by_precision_recall(y_true, y_proba, precision_min=0.20):
     }
 
 
-def train_model(pipeline: ImbPipeline, X_train, y_train):
-    """Entraîne le modèle."""
+def train_model(pipeline: ImbPipeline, X_train, y_train, resample_cache: ResampleCache = None):
+    """Entraîne le modèle (SMOTE servi par le cache disque s'il est fourni)."""
     print("\n🎯 Entraînement du modèle...")
     print("   Cela peut prendre 5-10 minutes... ☕")
     
-    pipeline.fit(X_train, y_train)
+    if resample_cache is None:
+        pipeline.fit(X_train, y_train)
+    else:
+        hits = resample_cache.stats["hits"]
+        resample_cache.fit_pipeline(pipeline, X_train, y_train)
+        if resample_cache.stats["hits"] > hits:
+            print(f"   ♻️  Ré-échantillonnage SMOTE lu depuis le cache ({resample_cache.root})")
+        else:
+            print(f"   💾 Ré-échantillonnage SMOTE mis en cache ({resample_cache.root})")
     
     print("✅ Modèle entraîné")
     return pipeline
 
 
+def update_model(
+    base_dir: Path,
+    X_train,
+    y_train,
+    X_valid,
+    y_valid,
+    n_new_trees: int = 50,
+    max_trees: int = None,
+    random_state: int = 42,
+    resample_cache: ResampleCache = None,
+):
+    """
+    Charge un modèle existant et lui ajoute des arbres appris sur la nouvelle
+    fenêtre (warm start), en retirant les plus anciens au-delà de max_trees.
+
+    Returns:
+        Tuple (pipeline mis à jour, rapport de mise à jour)
+    """
+    print(f"\n♻️  Mise à jour incrémentale du modèle {base_dir}...")
+    pipeline, base_metrics, columns, _ = ArtifactLoader(base_dir).load_artifacts()
+    if columns.get("all_cols") and columns["all_cols"] != X_train.columns.tolist():
+        raise ValueError(f"Les colonnes des données ne correspondent pas à celles de {base_dir}")
+
+    # Performance du modèle existant sur la nouvelle fenêtre (dérive)
+    base_pr_auc = float(average_precision_score(y_valid, pipeline.predict_proba(X_valid)[:, 1]))
+
+    # Une graine différente à chaque mise à jour successive
+    history = base_metrics.get("incremental", {}).get("history", [])
+    report = warm_start_forest(
+        pipeline,
+        X_train,
+        y_train,
+        n_new_trees=n_new_trees,
+        max_trees=max_trees,
+        random_state=random_state + len(history) + 1,
+        resample_cache=resample_cache,
+    )
+    report.update(
+        {
+            "base_model": str(base_dir),
+            "base_pr_auc": base_pr_auc,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+    )
+    report["history"] = history + [{k: v for k, v in report.items() if k != "history"}]
+
+    print(
+        f"   🌲 {report['n_trees_before']} arbres + {report['n_trees_added']} "
+        f"(fenêtre de {report['n_rows']:,} lignes) - {report['n_trees_retired']} retirés "
+        f"= {report['n_trees_after']}"
+    )
+    print(f"   PR-AUC du modèle existant sur la fenêtre: {base_pr_auc:.4f}")
+    return pipeline, report
+
+
 def evaluate_model(pipeline: ImbPipeline, X_valid, y_valid, precision_min: float = 0.20):
     """Évalue le modèle et trouve le seuil optimal."""
     print("\n📈 Évaluation sur l'ensemble de validation...")
@@ -187,7 +332,14 @@ def evaluate_model(pipeline: ImbPipeline, X_valid, y_valid, precision_min: float
     return metrics
 
 
-def save_model(pipeline: ImbPipeline, metrics: dict, columns: list, output_dir: Path):
+def save_model(
+    pipeline: ImbPipeline,
+    metrics: dict,
+    columns: list,
+    output_dir: Path,
+    export_forest: bool = False,
+    compact_forest: CompiledForest = None,
+):
     """Sauvegarde le modèle et les artefacts (format du notebook)."""
     print(f"\n💾 Sauvegarde dans {output_dir}...")
 
@@ -212,31 +364,119 @@ def save_model(pipeline: ImbPipeline, metrics: dict, columns: list, output_dir:
         json.dump(cols_info, f, indent=2, ensure_ascii=False)
     print("   ✅ columns.json")
 
+    # 4) Tableaux de la forêt compilée, projetables en mémoire (mmap)
+    if export_forest:
+        CompiledForest.from_pipeline(pipeline).save(output_dir / "forest_arrays.joblib")
+        print("   ✅ forest_arrays.joblib")
+
+    # 5) Forêt compacte pour l'inférence (préférée par ArtifactLoader)
+    if compact_forest is not None:
+        compact_forest.save(output_dir / "forest_compact.joblib")
+        print("   ✅ forest_compact.joblib")
+
+    # 6) Pipeline sans arbres, scoré avec la forêt projetée (--mmap de serve.py/predict.py)
+    if export_forest or compact_forest is not None:
+        ArtifactLoader(output_dir).save_pipeline_without_forest(pipeline)
+        print("   ✅ pipeline_noforest.joblib")
+
     print("\n✅ Modèle sauvegardé avec succès")
 
 
-def save_processed_splits(X_train, X_valid, X_test, y_train, y_valid, y_test):
-    """Sauvegarde les splits pour analyse ultérieure."""
+def build_compact_forest(
+    pipeline: ImbPipeline,
+    X_valid,
+    threshold: float,
+    value_bits: int = 16,
+    tolerance: float = 1e-4,
+):
+    """
+    Construit la forêt compacte et vérifie ses prédictions sur le validation set.
+
+    Returns:
+        Tuple (forêt compacte ou None si l'écart dépasse la tolérance, rapport)
+    """
+    print(f"\n🗜️  Forêt compacte (seuils float32, feuilles sur {value_bits} bits)...")
+    full = CompiledForest.from_pipeline(pipeline)
+    compact = full.compact(value_bits=value_bits)
+
+    reference = pipeline.predict_proba(X_valid)[:, 1]
+    proba = compact.predict_proba(transform_features(pipeline, X_valid))
+    max_abs_diff = float(np.max(np.abs(proba - reference))) if len(reference) else 0.0
+    report = {
+        "value_bits": value_bits,
+        "tolerance": tolerance,
+        "max_abs_diff": max_abs_diff,
+        "decision_changes": int(np.sum((proba >= threshold) != (reference >= threshold))),
+        "n_rows_checked": int(len(reference)),
+        "size_mb": compact.nbytes / 2**20,
+        "full_size_mb": full.nbytes / 2**20,
+    }
+    print(
+        f"   {report['full_size_mb']:.1f} MB -> {report['size_mb']:.1f} MB, "
+        f"écart max {max_abs_diff:.2e} sur {len(reference):,} lignes, "
+        f"{report['decision_changes']} décision(s) modifiée(s)"
+    )
+    if max_abs_diff > tolerance:
+        print(f"   ❌ Écart supérieur à la tolérance ({tolerance:g}): forêt compacte non exportée")
+        return None, report
+    return compact, report
+
+
+def save_global_shap(
+    pipeline: ImbPipeline,
+    X_ref,
+    y_ref,
+    output_dir: Path,
+    sample_size: int = 2000,
+    n_jobs: int = -1,
+    random_state: int = 42,
+):
+    """Précalcule le résumé SHAP global (échantillon stratifié) et le sauvegarde."""
+    print(f"\n🧠 Résumé SHAP global (échantillon stratifié de ~{sample_size:,} lignes)...")
+    start = datetime.now()
+
+    explainer = FraudExplainer(pipeline)
+    summary = explainer.global_shap_summary(
+        X_ref, y_ref, sample_size=sample_size, n_jobs=n_jobs, random_state=random_state
+    )
+    explainer.close()
+    summary["generated_at"] = datetime.now().isoformat(timespec="seconds")
+
+    with open(output_dir / "global_shap.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    elapsed = (datetime.now() - start).total_seconds()
+    top = sorted(summary["mean_abs_shap"].items(), key=lambda item: item[1], reverse=True)[:5]
+    print(f"   ✅ global_shap.json ({summary['n_samples']:,} lignes, {elapsed:.1f}s)")
+    print(f"   Top features: {', '.join(name for name, _ in top)}")
+    return summary
+
+
+def save_processed_splits(
+    X_train, X_valid, X_test, y_train, y_valid, y_test, fmt: str = "csv", float32: bool = False
+):
+    """Sauvegarde les splits pour analyse ultérieure (csv, parquet ou arrow)."""
     processed_dir = Path("data/processed")
     processed_dir.mkdir(parents=True, exist_ok=True)
-    
+    suffix = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}[fmt]
+
     print("\n💾 Sauvegarde des splits...")
-    X_train.to_csv(processed_dir / "X_train.csv", index=False)
-    X_valid.to_csv(processed_dir / "X_valid.csv", index=False)
-    X_test.to_csv(processed_dir / "X_test.csv", index=False)
-    
-    y_train.to_csv(processed_dir / "y_train.csv", index=False)
-    y_valid.to_csv(processed_dir / "y_valid.csv", index=False)
-    y_test.to_csv(processed_dir / "y_test.csv", index=False)
-    
-    print("   ✅ Splits sauvegardés dans data/processed/")
+    write_table(X_train, processed_dir / f"X_train{suffix}", float32=float32)
+    write_table(X_valid, processed_dir / f"X_valid{suffix}", float32=float32)
+    write_table(X_test, processed_dir / f"X_test{suffix}", float32=float32)
+
+    write_table(y_train.to_frame(), processed_dir / f"y_train{suffix}")
+    write_table(y_valid.to_frame(), processed_dir / f"y_valid{suffix}")
+    write_table(y_test.to_frame(), processed_dir / f"y_test{suffix}")
+
+    print(f"   ✅ Splits sauvegardés dans data/processed/ (format {fmt})")
 
 
 def main():
     """Fonction principale."""
     parser = argparse.ArgumentParser(description="Entraîner le modèle de détection de fraude")
     parser.add_argument(
-        "--data", type=str, required=True, help="Chemin vers creditcard.csv"
+        "--data", type=str, required=True, help="Chemin vers creditcard.csv (ou .parquet)"
     )
     parser.add_argument(
         "--output", type=str, default="models/rf_smote_final", help="Dossier de sortie"
@@ -244,12 +484,114 @@ def main():
     parser.add_argument(
         "--smote-strategy", type=float, default=0.2, help="Stratégie SMOTE (default: 0.2)"
     )
+    parser.add_argument(
+        "--search",
+        action="store_true",
+        help="Rechercher n_estimators, max_depth, max_features et la stratégie SMOTE "
+        "(divisions successives, PR-AUC de validation) avant l'entraînement final",
+    )
+    parser.add_argument(
+        "--search-grid",
+        type=str,
+        help="Fichier JSON {paramètre: [valeurs]} remplaçant la grille par défaut",
+    )
+    parser.add_argument(
+        "--search-factor",
+        type=int,
+        default=3,
+        help="Facteur de réduction des candidats à chaque tour (default: 3)",
+    )
+    parser.add_argument(
+        "--search-workers",
+        type=int,
+        default=-1,
+        help="Nombre de processus de la recherche (-1 = tous les cœurs, default: -1)",
+    )
+    parser.add_argument(
+        "--warm-start-from",
+        type=str,
+        help="Dossier d'un modèle existant à mettre à jour: des arbres appris sur --data "
+        "sont ajoutés à sa forêt au lieu de tout ré-entraîner",
+    )
+    parser.add_argument(
+        "--add-trees",
+        type=int,
+        default=50,
+        help="Nombre d'arbres ajoutés en mise à jour incrémentale (default: 50)",
+    )
+    parser.add_argument(
+        "--max-trees",
+        type=int,
+        help="Taille maximale de la forêt mise à jour: les arbres les plus anciens sont retirés",
+    )
+    parser.add_argument(
+        "--smote-cache",
+        type=str,
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Dossier du cache des ré-échantillonnages SMOTE (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-smote-cache", action="store_true", help="Recalculer SMOTE sans passer par le cache"
+    )
     parser.add_argument(
         "--precision-min", type=float, default=0.20, help="Precision minimale pour seuil (default: 0.20)"
     )
     parser.add_argument(
         "--random-state", type=int, default=42, help="Random state (default: 42)"
     )
+    parser.add_argument(
+        "--splits-format",
+        choices=["csv", "parquet", "arrow"],
+        default="csv",
+        help="Format des splits sauvegardés dans data/processed (default: csv)",
+    )
+    parser.add_argument(
+        "--splits-float32", action="store_true", help="Sauvegarder les features en float32"
+    )
+    parser.add_argument(
+        "--export-forest",
+        action="store_true",
+        help="Exporter les tableaux de la forêt compilée (chargement partagé en mmap)",
+    )
+    parser.add_argument(
+        "--export-compact",
+        action="store_true",
+        help="Exporter une forêt compacte pour l'inférence (seuils float32, feuilles quantifiées)",
+    )
+    parser.add_argument(
+        "--compact-bits",
+        type=int,
+        choices=[8, 16],
+        default=16,
+        help="Bits des valeurs de feuilles de la forêt compacte (default: 16)",
+    )
+    parser.add_argument(
+        "--compact-tolerance",
+        type=float,
+        default=1e-4,
+        help="Écart maximal toléré avec le modèle d'origine (default: 1e-4)",
+    )
+    parser.add_argument(
+        "--shap-sample",
+        type=int,
+        default=2000,
+        help="Taille de l'échantillon du résumé SHAP global (0 pour désactiver, default: 2000)",
+    )
+    parser.add_argument(
+        "--shap-workers",
+        type=int,
+        default=-1,
+        help="Nombre de processus pour le résumé SHAP (-1 = tous les cœurs, default: -1)",
+    )
+    parser.add_argument(
+        "--register",
+        choices=STAGES,
+        help="Enregistrer le modèle dans le registre (dossier parent de --output) "
+        "avec ce statut",
+    )
+    parser.add_argument(
+        "--description", type=str, default="", help="Description de la version enregistrée"
+    )
 
     args = parser.parse_args()
 
@@ -257,6 +599,9 @@ def main():
     data_path = Path(args.data)
     output_dir = Path(args.output)
 
+    if args.warm_start_from and args.search:
+        parser.error("--search et --warm-start-from sont incompatibles")
+
     if not data_path.exists():
         print(f"❌ Erreur: {data_path} n'existe pas")
         print(f"\n💡 Téléchargez le dataset depuis:")
@@ -272,21 +617,118 @@ def main():
     X_train, X_valid, X_test, y_train, y_valid, y_test = split_data(df, random_state=args.random_state)
     
     # Sauvegarder les splits
-    save_processed_splits(X_train, X_valid, X_test, y_train, y_valid, y_test)
-    
-    # Construire et entraîner
-    pipeline = build_pipeline(
-        smote_strategy=args.smote_strategy, 
-        random_state=args.random_state,
-        all_cols=X_train.columns.tolist()
+    save_processed_splits(
+        X_train, X_valid, X_test, y_train, y_valid, y_test,
+        fmt=args.splits_format, float32=args.splits_float32,
     )
-    pipeline = train_model(pipeline, X_train, y_train)
     
-    # Évaluer
+    # Cache des ré-échantillonnages SMOTE, partagé entre exécutions et candidats
+    resample_cache = None if args.no_smote_cache else ResampleCache(Path(args.smote_cache))
+
+    # Recherche d'hyperparamètres (optionnelle)
+    params = {"smote_strategy": args.smote_strategy}
+    search_trace = None
+    if args.search:
+        param_grid = DEFAULT_PARAM_GRID
+        if args.search_grid:
+            with open(args.search_grid, "r", encoding="utf-8") as f:
+                param_grid = json.load(f)
+        params, search_trace = search_hyperparameters(
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            param_grid=param_grid,
+            factor=args.search_factor,
+            n_jobs=args.search_workers,
+            random_state=args.random_state,
+            resample_cache=resample_cache,
+        )
+
+    # Construire et entraîner (ou mettre à jour un modèle existant)
+    incremental = None
+    if args.warm_start_from:
+        try:
+            pipeline, incremental = update_model(
+                Path(args.warm_start_from),
+                X_train,
+                y_train,
+                X_valid,
+                y_valid,
+                n_new_trees=args.add_trees,
+                max_trees=args.max_trees,
+                random_state=args.random_state,
+                resample_cache=resample_cache,
+            )
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ Erreur: {e}")
+            sys.exit(1)
+    else:
+        pipeline = build_pipeline(
+            random_state=args.random_state,
+            all_cols=X_train.columns.tolist(),
+            **params,
+        )
+        pipeline = train_model(pipeline, X_train, y_train, resample_cache=resample_cache)
+    
+    # Évaluer (le seuil est re-sélectionné sur le validation set de la fenêtre)
     metrics = evaluate_model(pipeline, X_valid, y_valid, precision_min=args.precision_min)
+    if search_trace is not None:
+        metrics["search"] = search_trace
+    if incremental is not None:
+        metrics["incremental"] = incremental
+
+    # Latences de référence (moteur "auto" de serve.py et de l'application),
+    # comparées au préchauffage d'ArtifactLoader
+    print("\n⏱️  Latences de référence (lots synthétiques, moteur auto)...")
+    reference = FraudPredictor(pipeline, X_train.columns.tolist(), engine="auto")
+    metrics["latency"] = benchmark_scoring(reference.predict, X_train.columns.tolist())
+    metrics["latency_engine"] = reference.engine
+    print(f"   {format_warmup(metrics['latency'])}")
     
+    # Forêt compacte, vérifiée sur le validation set avant export
+    compact_forest = None
+    if args.export_compact:
+        compact_forest, metrics["compact_forest"] = build_compact_forest(
+            pipeline,
+            X_valid,
+            metrics["threshold"],
+            value_bits=args.compact_bits,
+            tolerance=args.compact_tolerance,
+        )
+
     # Sauvegarder
-    save_model(pipeline, metrics, X_train.columns.tolist(), output_dir)
+    save_model(
+        pipeline,
+        metrics,
+        X_train.columns.tolist(),
+        output_dir,
+        export_forest=args.export_forest,
+        compact_forest=compact_forest,
+    )
+
+    # Résumé SHAP global (chargé par ArtifactLoader.load_global_shap)
+    if args.shap_sample > 0:
+        save_global_shap(
+            pipeline,
+            X_train,
+            y_train,
+            output_dir,
+            sample_size=args.shap_sample,
+            n_jobs=args.shap_workers,
+            random_state=args.random_state,
+        )
+
+    # Enregistrement dans le registre (manifeste écrit après tous les artefacts)
+    if args.register:
+        registry = ModelRegistry(output_dir.parent)
+        manifest = registry.register(
+            output_dir.name, stage=args.register, description=args.description
+        )
+        print(
+            f"\n📒 Version {manifest['version']} enregistrée: {manifest['name']} "
+            f"({manifest['stage']})"
+        )
 
     print("\n" + "=" * 70)
     print("✅ ENTRAÎNEMENT TERMINÉ AVEC SUCCÈS")
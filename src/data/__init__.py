@@ -1,5 +1,19 @@
-"""Module de chargement de données."""
+"""Module de chargement de données (importé à la première utilisation)."""
 
-from .loader import ArtifactLoader
+from typing import TYPE_CHECKING
 
-__all__ = ["ArtifactLoader"]
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import ResampleCache
+    from .loader import ArtifactLoader
+    from .registry import ModelRegistry
+
+_EXPORTS = {
+    "ArtifactLoader": ".loader",
+    "ModelRegistry": ".registry",
+    "ResampleCache": ".cache",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,164 @@
+"""Cache disque des données ré-échantillonnées (SMOTE) pour l'entraînement."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Dossier par défaut du cache, hors des artefacts versionnés
+DEFAULT_CACHE_DIR = Path("data/cache/smote")
+
+
+class ResampleCache:
+    """
+    Cache des matrices ré-échantillonnées par SMOTE.
+
+    La recherche des k plus proches voisins de SMOTE sur tout le train set
+    représente une bonne part du temps d'entraînement, alors que son
+    résultat ne dépend que des données d'entrée et des paramètres du
+    sampler. Chaque résultat est stocké dans un fichier ``<clé>.npz`` dont la
+    clé est l'empreinte SHA-256 des données passées à SMOTE (features
+    transformées et cible) et des paramètres du sampler (``sampling_strategy``,
+    ``k_neighbors``, ``random_state``...). Il est réutilisé entre exécutions
+    et entre les candidats d'une recherche d'hyperparamètres.
+
+    Les écritures sont atomiques (fichier temporaire puis renommage): des
+    processus concurrents peuvent partager le même dossier. Au-delà de
+    ``max_size_mb``, les entrées les moins récemment utilisées sont supprimées.
+    """
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, max_size_mb: Optional[float] = 2048):
+        """
+        Initialise le cache.
+
+        Args:
+            root: Dossier du cache (créé à la première écriture)
+            max_size_mb: Taille maximale du dossier (None pour ne pas limiter)
+        """
+        self.root = Path(root)
+        self.max_size_mb = max_size_mb
+        self.stats = {"hits": 0, "misses": 0}
+
+    def key(self, sampler, X, y) -> str:
+        """
+        Calcule la clé d'un ré-échantillonnage.
+
+        Args:
+            sampler: Sampler imblearn (ex: SMOTE), non entraîné
+            X: Features passées au sampler
+            y: Cible
+
+        Returns:
+            Empreinte hexadécimale
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.int64)
+        params = sorted(sampler.get_params(deep=False).items())
+
+        digest = hashlib.sha256()
+        digest.update(f"{type(sampler).__name__}|{params!r}|{X.shape}".encode("utf-8"))
+        digest.update(X.tobytes())
+        digest.update(y.tobytes())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Chemin du fichier d'une entrée."""
+        return self.root / f"{key}.npz"
+
+    def fit_resample(self, sampler, X, y) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ré-échantillonne X, y en passant par le cache.
+
+        Args:
+            sampler: Sampler imblearn (ex: SMOTE)
+            X: Features passées au sampler
+            y: Cible
+
+        Returns:
+            Tuple (X ré-échantillonné, y ré-échantillonné)
+        """
+        path = self.path(self.key(sampler, X, y))
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    X_res, y_res = data["X"], data["y"]
+            except (OSError, ValueError, KeyError):
+                # Entrée illisible (écriture interrompue): recalculée
+                pass
+            else:
+                self.stats["hits"] += 1
+                # Date de dernière utilisation, pour l'éviction
+                os.utime(path)
+                return X_res, y_res
+
+        self.stats["misses"] += 1
+        X_res, y_res = sampler.fit_resample(X, y)
+        X_res, y_res = np.asarray(X_res), np.asarray(y_res)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp_path, X=X_res, y=y_res)
+        tmp_path.replace(path)
+        self._prune()
+        return X_res, y_res
+
+    def fit_pipeline(self, pipeline, X, y):
+        """
+        Entraîne un pipeline imblearn avec le ré-échantillonnage en cache.
+
+        Équivalent à ``pipeline.fit(X, y)``: les étapes avant le sampler sont
+        entraînées puis appliquées, le sampler passe par le cache, et les
+        étapes suivantes sont entraînées sur les données ré-échantillonnées.
+        Un pipeline sans sampler est entraîné normalement.
+
+        Args:
+            pipeline: Pipeline imblearn non entraîné
+            X: Features d'entraînement
+            y: Cible d'entraînement
+
+        Returns:
+            Le pipeline entraîné
+        """
+        index = next(
+            (i for i, (_, step) in enumerate(pipeline.steps) if hasattr(step, "fit_resample")),
+            None,
+        )
+        if index is None:
+            return pipeline.fit(X, y)
+
+        Xt = pipeline[:index].fit_transform(X, y) if index > 0 else X
+        X_res, y_res = self.fit_resample(pipeline.steps[index][1], Xt, y)
+        # Les tranches partagent les étapes du pipeline: elles sont entraînées en place
+        pipeline[index + 1 :].fit(X_res, y_res)
+        return pipeline
+
+    def size_mb(self) -> float:
+        """Taille totale des entrées du cache (MB)."""
+        if not self.root.exists():
+            return 0.0
+        return sum(p.stat().st_size for p in self.root.glob("*.npz")) / 2**20
+
+    def _prune(self) -> None:
+        """Supprime les entrées les moins récemment utilisées au-delà de max_size_mb."""
+        if self.max_size_mb is None:
+            return
+        entries = []
+        for path in self.root.glob("*.npz"):
+            if path.name.endswith(".tmp.npz"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        budget = self.max_size_mb * 2**20
+        # La plus récente (celle qui vient d'être écrite) est toujours conservée
+        for _, size, path in sorted(entries)[:-1]:
+            if total <= budget:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
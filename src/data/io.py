@@ -0,0 +1,280 @@
+"""Lecture et écriture de tables (CSV, Parquet, Arrow IPC) selon l'extension."""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Format déduit de l'extension du fichier (CSV par défaut)
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+# Priorité des formats de find_table à date égale: formats colonnes d'abord
+SEARCH_ORDER = (".parquet", ".arrow", ".feather", ".csv")
+
+
+def table_format(path: Path) -> str:
+    """
+    Détermine le format d'un fichier à partir de son extension.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        "csv", "parquet" ou "arrow" (CSV pour une extension inconnue)
+    """
+    return FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def _require_pyarrow():
+    """Importe pyarrow ou lève une erreur explicite."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "Les formats Parquet/Arrow nécessitent pyarrow (pip install pyarrow)."
+        ) from e
+
+
+def _to_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """Convertit les colonnes float64 en float32."""
+    float_cols = df.select_dtypes(include=[np.float64]).columns
+    if len(float_cols):
+        df = df.astype({col: np.float32 for col in float_cols})
+    return df
+
+
+def table_columns(path: Path) -> List[str]:
+    """
+    Lit uniquement les noms de colonnes d'un fichier.
+
+    Args:
+        path: Chemin du fichier
+
+    Returns:
+        Liste des colonnes
+    """
+    fmt = table_format(path)
+    if fmt == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt == "parquet":
+        return list(pq.read_schema(path).names)
+    with pa.memory_map(str(path), "r") as source:
+        return list(pa.ipc.open_file(source).schema.names)
+
+
+def read_table(
+    path: Path, columns: Optional[Sequence[str]] = None, float32: bool = False
+) -> pd.DataFrame:
+    """
+    Lit une table complète.
+
+    Args:
+        path: Chemin du fichier (.csv, .parquet, .arrow/.feather)
+        columns: Colonnes à lire (projection), toutes par défaut
+        float32: Convertir les colonnes float64 en float32
+
+    Returns:
+        DataFrame lu
+    """
+    fmt = table_format(path)
+    columns = list(columns) if columns is not None else None
+
+    if fmt == "csv":
+        df = pd.read_csv(path, usecols=columns)
+    else:
+        _require_pyarrow()
+        if fmt == "parquet":
+            df = pd.read_parquet(path, columns=columns)
+        else:
+            df = pd.read_feather(path, columns=columns)
+
+    if columns is not None:
+        df = df[columns]
+    return _to_float32(df) if float32 else df
+
+
+def iter_table(
+    path: Path,
+    batch_rows: int,
+    columns: Optional[Sequence[str]] = None,
+    float32: bool = False,
+    dtype: Optional[Dict[str, object]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Lit une table par blocs de ``batch_rows`` lignes.
+
+    En CSV, pandas infère les types bloc par bloc: une colonne entière dans un
+    bloc peut devenir flottante dans le suivant. ``dtype`` fixe ces types pour
+    que tous les blocs partagent le même schéma.
+
+    Args:
+        path: Chemin du fichier
+        batch_rows: Nombre de lignes par bloc
+        columns: Colonnes à lire (projection), toutes par défaut
+        float32: Convertir les colonnes float64 en float32
+        dtype: Types imposés par colonne (CSV uniquement, les colonnes
+            absentes du fichier sont ignorées)
+
+    Yields:
+        DataFrames successifs
+    """
+    fmt = table_format(path)
+    columns = list(columns) if columns is not None else None
+
+    if fmt == "csv":
+        for chunk in pd.read_csv(path, usecols=columns, chunksize=batch_rows, dtype=dtype):
+            chunk = chunk[columns] if columns is not None else chunk
+            yield _to_float32(chunk) if float32 else chunk
+        return
+
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt == "parquet":
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=batch_rows, columns=columns):
+            chunk = batch.to_pandas()
+            yield _to_float32(chunk) if float32 else chunk
+        return
+
+    # Arrow IPC: fichier projeté en mémoire, découpé sans copie
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        for start in range(0, table.num_rows, batch_rows):
+            chunk = table.slice(start, batch_rows).to_pandas()
+            yield _to_float32(chunk) if float32 else chunk
+
+
+def write_table(df: pd.DataFrame, path: Path, float32: bool = False) -> None:
+    """
+    Écrit une table complète.
+
+    Args:
+        df: DataFrame à écrire
+        path: Chemin du fichier (format déduit de l'extension)
+        float32: Convertir les colonnes float64 en float32
+    """
+    with TableWriter(path, float32=float32) as writer:
+        writer.write(df)
+
+
+class TableWriter:
+    """Écriture incrémentale d'une table, bloc par bloc."""
+
+    def __init__(self, path: Path, float32: bool = False):
+        """
+        Initialise l'écrivain.
+
+        Args:
+            path: Chemin du fichier de sortie (format déduit de l'extension)
+            float32: Convertir les colonnes float64 en float32
+        """
+        self.path = Path(path)
+        self.format = table_format(path)
+        self.float32 = float32
+        self._writer = None
+        self._schema = None
+        self._started = False
+        if self.format != "csv":
+            _require_pyarrow()
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        Ajoute un bloc au fichier.
+
+        Le schéma Parquet/Arrow est fixé par le premier bloc; les blocs
+        suivants y sont convertis.
+
+        Args:
+            df: Bloc à écrire (mêmes colonnes pour tous les blocs)
+
+        Raises:
+            ValueError: Si un bloc ne peut pas être converti sans perte vers
+                le schéma du premier bloc (ex: flottants dans une colonne
+                entière)
+        """
+        if self.float32:
+            df = _to_float32(df)
+
+        if self.format == "csv":
+            df.to_csv(
+                self.path, mode="a" if self._started else "w", header=not self._started, index=False
+            )
+            self._started = True
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(
+                f"Bloc incompatible avec le schéma du premier bloc ({self.path.name}): {e}"
+            ) from e
+        if self._writer is None:
+            self._schema = table.schema
+            if self.format == "parquet":
+                self._writer = pq.ParquetWriter(str(self.path), self._schema)
+            else:
+                self._writer = pa.ipc.new_file(str(self.path), self._schema)
+        self._writer.write_table(table)
+        self._started = True
+
+    def close(self) -> None:
+        """Finalise le fichier."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "TableWriter":
+        """Ouvre le contexte d'écriture."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Finalise le fichier en sortie de contexte."""
+        self.close()
+
+
+def find_table(directory: Path, stem: str) -> Optional[Path]:
+    """
+    Cherche une table par nom, quel que soit son format.
+
+    Si plusieurs formats existent, le fichier le plus récent est retenu: un
+    Parquet plus ancien qu'un CSV régénéré depuis est périmé. À date égale,
+    l'ordre de SEARCH_ORDER départage (formats colonnes d'abord).
+
+    Args:
+        directory: Dossier de recherche
+        stem: Nom du fichier sans extension (ex: "X_test")
+
+    Returns:
+        Fichier existant le plus récent (Parquet, Arrow puis CSV à date
+        égale) ou None
+    """
+    best, best_mtime = None, None
+    for suffix in SEARCH_ORDER:
+        candidate = Path(directory) / f"{stem}{suffix}"
+        try:
+            mtime = candidate.stat().st_mtime_ns
+        except OSError:
+            continue
+        if best_mtime is None or mtime > best_mtime:
+            best, best_mtime = candidate, mtime
+    return best
@@ -1,27 +1,235 @@
 """Module pour charger les artefacts du modèle de détection de fraude."""
 
+import hashlib
 import json
+import os
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import joblib
+import numpy as np
 import pandas as pd
 
+# Tailles des lots synthétiques du préchauffage (transaction unique, micro-lot, fichier)
+DEFAULT_WARMUP_SIZES = (1, 64, 5000)
+
+
+def _rss_mb() -> Optional[float]:
+    """Mémoire résidente actuelle du processus en MB (None si indisponible)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def benchmark_scoring(
+    score: Callable[[pd.DataFrame], object],
+    columns: List[str],
+    sizes: Sequence[int] = DEFAULT_WARMUP_SIZES,
+    row_budget: int = 10000,
+    random_state: int = 0,
+) -> Dict[str, Dict]:
+    """
+    Mesure la latence d'une fonction de scoring sur des lots synthétiques.
+
+    Chaque taille est d'abord évaluée une fois sans mesure (préchauffage),
+    puis répétée autant de fois que le budget de lignes le permet (entre 3
+    et 200 fois). Les petits lots, sensibles aux pics de latence, ont ainsi
+    assez de mesures pour un p99 significatif; pour les gros lots, mesurés
+    quelques fois seulement, le p99 se confond avec le maximum.
+
+    Args:
+        score: Fonction appliquée à chaque lot (ex: pipeline.predict_proba,
+            FraudPredictor.predict)
+        columns: Colonnes d'entrée attendues
+        sizes: Tailles de lots à mesurer
+        row_budget: Nombre approximatif de lignes scorées par taille
+        random_state: Graine des données synthétiques
+
+    Returns:
+        Dictionnaire {taille: {p50_ms, p99_ms, max_ms, rows_per_s, repeats}}
+    """
+    rng = np.random.default_rng(random_state)
+    results = {}
+    for size in sizes:
+        batch = pd.DataFrame(rng.normal(size=(size, len(columns))), columns=columns)
+        score(batch)
+
+        repeats = int(np.clip(row_budget // max(size, 1), 3, 200))
+        latencies = np.empty(repeats)
+        for i in range(repeats):
+            start = time.perf_counter()
+            score(batch)
+            latencies[i] = time.perf_counter() - start
+
+        p50, p99 = (float(v) for v in np.percentile(latencies, [50, 99]))
+        results[str(size)] = {
+            "p50_ms": p50 * 1000,
+            "p99_ms": p99 * 1000,
+            "max_ms": float(latencies.max() * 1000),
+            "rows_per_s": float(size / p50) if p50 > 0 else float("inf"),
+            "repeats": repeats,
+        }
+    return results
+
+
+def benchmark_pipeline(
+    pipeline,
+    columns: List[str],
+    sizes: Sequence[int] = DEFAULT_WARMUP_SIZES,
+    row_budget: int = 10000,
+    random_state: int = 0,
+) -> Dict[str, Dict]:
+    """
+    Mesure la latence de predict_proba d'un pipeline (voir benchmark_scoring).
+
+    Args:
+        pipeline: Pipeline entraîné
+        columns: Colonnes d'entrée attendues
+        sizes: Tailles de lots à mesurer
+        row_budget: Nombre approximatif de lignes scorées par taille
+        random_state: Graine des données synthétiques
+
+    Returns:
+        Dictionnaire {taille: {p50_ms, p99_ms, max_ms, rows_per_s, repeats}}
+    """
+    return benchmark_scoring(pipeline.predict_proba, columns, sizes, row_budget, random_state)
+
+
+def format_warmup(warmup: Dict[str, Dict]) -> str:
+    """
+    Résume les mesures du préchauffage sur une ligne.
+
+    Args:
+        warmup: Mesures du préchauffage (voir benchmark_scoring)
+
+    Returns:
+        Texte du type "1 ligne: p50 12.1 ms / p99 14.8 ms / max 15.3 ms · ..."
+    """
+    parts = []
+    for size, result in warmup.items():
+        rows = "ligne" if size == "1" else "lignes"
+        p99 = f" / p99 {result['p99_ms']:.1f} ms" if "p99_ms" in result else ""
+        parts.append(
+            f"{size} {rows}: p50 {result['p50_ms']:.1f} ms{p99} / max {result['max_ms']:.1f} ms "
+            f"({result['rows_per_s']:,.0f} lignes/s)"
+        )
+    return " · ".join(parts)
+
 
 class ArtifactLoader:
     """Chargeur d'artefacts pour le modèle de détection de fraude."""
 
-    def __init__(self, model_dir: Path):
+    # Seuils au-delà desquels le chargement est signalé dans les warnings
+    slow_load_seconds = 30.0
+    high_memory_mb = 2048.0
+    # Régression signalée si le p99 du préchauffage dépasse ce multiple de
+    # la valeur mesurée à l'entraînement (médiane pour les anciennes métriques)
+    latency_regression_factor = 2.0
+
+    def __init__(
+        self,
+        model_dir: Path,
+        mmap_mode: Optional[str] = None,
+        warmup_sizes: Sequence[int] = (),
+        forest_only: bool = False,
+        compact: bool = False,
+    ):
         """
         Initialise le chargeur d'artefacts.
 
         Args:
             model_dir: Chemin vers le dossier contenant les artefacts du modèle
+            mmap_mode: Mode de projection en mémoire des tableaux de la forêt
+                compilée ("r"), désactivé par défaut
+            warmup_sizes: Tailles des lots synthétiques scorés par warmup()
+                (vide par défaut: préchauffage réservé aux processus de
+                longue durée, ex: DEFAULT_WARMUP_SIZES pour serve.py et l'app)
+            forest_only: Avec mmap_mode, charger le pipeline sans ses arbres
+                (``pipeline_noforest.joblib``) et scorer uniquement avec la
+                forêt compilée projetée: les arbres ne sont pas recopiés dans
+                la mémoire du processus. Incompatible avec SHAP et le moteur
+                sklearn; pipeline complet si les fichiers manquent.
+            compact: Utiliser la forêt compacte (``forest_compact.joblib``:
+                seuils float32, feuilles quantifiées) plutôt que la forêt
+                exacte. Ses probabilités diffèrent légèrement de celles de
+                sklearn: avec le moteur "auto", une même transaction peut
+                alors changer de score selon la taille du lot.
         """
         self.model_dir = Path(model_dir)
+        self.mmap_mode = mmap_mode
+        self.warmup_sizes = tuple(warmup_sizes)
+        self.forest_only = forest_only
+        self.compact = compact
         self.pipe_path = self.model_dir / "pipeline.joblib"
+        self.noforest_path = self.model_dir / "pipeline_noforest.joblib"
         self.metrics_path = self.model_dir / "metrics_valid.json"
         self.cols_path = self.model_dir / "columns.json"
+        self.shap_path = self.model_dir / "global_shap.json"
+        self.forest_path = self.model_dir / "forest_arrays.joblib"
+        self.compact_path = self.model_dir / "forest_compact.joblib"
+        # Mesures du dernier chargement (temps, mémoire, taille des fichiers)
+        self.load_info: Dict = {}
+        # Empreintes déjà calculées: {chemin: ((mtime_ns, taille), sha256)}
+        self._hash_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        # Forêt projetée chargée avec le pipeline sans arbres (forest_only)
+        self._forest = None
+
+    def artifact_paths(self) -> Dict[str, Path]:
+        """
+        Retourne les fichiers d'artefacts suivis pour la détection de changements.
+
+        Returns:
+            Dictionnaire {nom du fichier: chemin}
+        """
+        paths = [
+            self.pipe_path,
+            self.metrics_path,
+            self.cols_path,
+            self.forest_path,
+            self.compact_path,
+            self.noforest_path,
+            self.shap_path,
+        ]
+        return {path.name: path for path in paths}
+
+    def fingerprint(self) -> Dict[str, Optional[str]]:
+        """
+        Calcule l'empreinte du contenu de chaque artefact.
+
+        Le contenu n'est haché à nouveau que si la date de modification ou
+        la taille du fichier a changé; un fichier simplement touché garde
+        donc la même empreinte.
+
+        Returns:
+            Dictionnaire {nom du fichier: SHA-256 du contenu, None si absent}
+        """
+        return {name: self._file_sha256(path) for name, path in self.artifact_paths().items()}
+
+    def _file_sha256(self, path: Path) -> Optional[str]:
+        """SHA-256 du contenu d'un fichier (mis en cache selon mtime et taille), None si absent."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._hash_cache.get(path)
+        if cached is None or cached[0] != signature:
+            digest = hashlib.sha256()
+            try:
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(block)
+            except OSError:
+                # Fichier supprimé ou remplacé pendant la lecture
+                return None
+            cached = (signature, digest.hexdigest())
+            self._hash_cache[path] = cached
+        return cached[1]
 
     def load_artifacts(self) -> Tuple[object, Dict, Dict, List[str]]:
         """
@@ -49,8 +257,24 @@ class ArtifactLoader:
         if errors:
             raise FileNotFoundError("\n".join(errors))
 
-        # Charger le pipeline
-        pipeline = joblib.load(self.pipe_path)
+        # Charger le pipeline (mesure du temps et de la mémoire résidente)
+        rss_before = _rss_mb()
+        start = time.perf_counter()
+        self._forest = None
+        pipeline = None
+        if self.forest_only and self.mmap_mode:
+            loaded = self._load_without_forest()
+            if loaded is not None:
+                pipeline, self._forest = loaded
+            else:
+                warnings.append(
+                    f"⚠️ {self.noforest_path.name} absent ou périmé (--export-forest): "
+                    "pipeline complet chargé"
+                )
+        if pipeline is None:
+            pipeline = joblib.load(self.pipe_path, mmap_mode=self.mmap_mode)
+        load_seconds = time.perf_counter() - start
+        rss_after = _rss_mb()
 
         # Charger les métriques (avec fallback)
         if self.metrics_path.exists():
@@ -80,8 +304,224 @@ class ArtifactLoader:
                 [[0.0] * len(columns.get("all_cols", []))],
                 columns=columns.get("all_cols", []),
             )
-            _ = pipeline.predict_proba(test_df)
+            if self._forest is not None:
+                from ..models.forest import transform_features
+
+                _ = self._forest.predict_proba(transform_features(pipeline, test_df))
+            else:
+                _ = pipeline.predict_proba(test_df)
         except Exception as e:
             warnings.append(f"⚠️ Divergence pipeline/colonnes détectée: {str(e)[:100]}")
 
+        self.load_info = {
+            "load_seconds": load_seconds,
+            "pipeline_mb": (
+                self.noforest_path if self._forest is not None else self.pipe_path
+            ).stat().st_size
+            / 2**20,
+            "rss_mb": rss_after,
+            "rss_delta_mb": (
+                rss_after - rss_before if rss_after is not None and rss_before is not None else None
+            ),
+            "mmap_mode": self.mmap_mode,
+            "forest_only": self._forest is not None,
+            "warmup": {},
+        }
+        if load_seconds > self.slow_load_seconds:
+            warnings.append(
+                f"⏱️ Chargement lent du pipeline: {load_seconds:.1f}s "
+                f"({self.load_info['pipeline_mb']:.0f} MB)"
+            )
+        if rss_after is not None and rss_after > self.high_memory_mb:
+            warnings.append(
+                f"💾 Mémoire résidente élevée après chargement: {rss_after:.0f} MB "
+                f"({self.load_info['rss_delta_mb']:+.0f} MB)"
+            )
+
         return pipeline, metrics, columns, warnings
+
+    def warmup(self, predictor, metrics: Optional[Dict] = None) -> List[str]:
+        """
+        Préchauffe un prédicateur avec le moteur configuré et mesure sa latence.
+
+        Les lots synthétiques de ``warmup_sizes`` sont scorés par
+        ``predictor.predict``; les mesures sont rangées dans
+        ``load_info["warmup"]``. Sans ``warmup_sizes``, rien n'est fait.
+
+        Args:
+            predictor: FraudPredictor construit sur le pipeline chargé
+            metrics: Métriques de validation (latences de référence dans
+                ``metrics["latency"]``, mesurées avec ``metrics["latency_engine"]``)
+
+        Returns:
+            Warnings de régression de latence
+        """
+        if not self.warmup_sizes:
+            self.load_info["warmup"] = {}
+            return []
+
+        warmup = benchmark_scoring(predictor.predict, predictor.expected_columns, self.warmup_sizes)
+        self.load_info["warmup"] = warmup
+
+        # Comparaison uniquement avec des références mesurées sur le même moteur
+        # (un pipeline sans arbres score tous les lots avec la forêt compilée)
+        metrics = metrics or {}
+        engine = "compiled" if getattr(predictor, "forest_only", False) else predictor.engine
+        if metrics.get("latency_engine", "sklearn") != engine:
+            return []
+        return self._latency_warnings(predictor, warmup, metrics.get("latency", {}))
+
+    def _latency_warnings(
+        self, predictor, warmup: Dict[str, Dict], reference: Dict[str, Dict]
+    ) -> List[str]:
+        """
+        Compare les latences du préchauffage à celles enregistrées à l'entraînement.
+
+        La référence est le p99; les métriques antérieures à sa mesure ne
+        contiennent que la médiane, comparée à défaut.
+
+        Args:
+            predictor: Prédicateur préchauffé (pour indiquer son moteur et son n_jobs)
+            warmup: Mesures du préchauffage (voir benchmark_scoring)
+            reference: Mesures de metrics_valid.json["latency"]
+
+        Returns:
+            Un warning par taille de lot en régression
+        """
+        n_jobs = getattr(predictor.pipeline.steps[-1][1], "n_jobs", None)
+        warnings = []
+        for size, current in warmup.items():
+            expected = reference.get(size)
+            if not expected:
+                continue
+            stat = "p99" if expected.get("p99_ms") and "p99_ms" in current else "p50"
+            if not expected.get(f"{stat}_ms"):
+                continue
+            ratio = current[f"{stat}_ms"] / expected[f"{stat}_ms"]
+            if ratio > self.latency_regression_factor:
+                other = "p50" if stat == "p99" else "max"
+                warnings.append(
+                    f"🐢 Latence en régression (taille de lot {size}): "
+                    f"{stat} {current[f'{stat}_ms']:.1f} ms (x{ratio:.1f} vs entraînement), "
+                    f"{other} {current[f'{other}_ms']:.1f} ms, "
+                    f"{current['rows_per_s']:,.0f} lignes/s "
+                    f"(moteur {predictor.engine}, n_jobs={n_jobs})"
+                )
+        return warnings
+
+    def save_pipeline_without_forest(self, pipeline) -> Path:
+        """
+        Écrit la copie sans arbres du pipeline, utilisée avec ``forest_only``.
+
+        À appeler après avoir sauvegardé ``pipeline.joblib`` et la forêt
+        compilée: le fichier enregistre l'empreinte du pipeline complet et la
+        structure de la forêt, vérifiées au chargement.
+
+        Args:
+            pipeline: Pipeline complet, tel que sauvegardé dans pipeline.joblib
+
+        Returns:
+            Chemin du fichier écrit
+        """
+        from ..models.forest import strip_forest
+
+        forest = pipeline.steps[-1][1]
+        state = {
+            "pipeline": strip_forest(pipeline),
+            "pipeline_sha256": self._file_sha256(self.pipe_path),
+            "n_trees": len(forest.estimators_),
+            "n_nodes": sum(est.tree_.node_count for est in forest.estimators_),
+            "n_features": int(forest.n_features_in_),
+        }
+        joblib.dump(state, self.noforest_path)
+        return self.noforest_path
+
+    def _load_without_forest(self):
+        """
+        Charge le pipeline sans arbres et la forêt compilée projetée.
+
+        Returns:
+            Tuple (pipeline sans arbres, CompiledForest), ou None si un fichier
+            manque ou ne correspond plus à pipeline.joblib
+        """
+        from ..models.forest import CompiledForest
+
+        if not self.noforest_path.exists():
+            return None
+        try:
+            state = joblib.load(self.noforest_path)
+        except Exception:
+            return None
+        if state.get("pipeline_sha256") != self._file_sha256(self.pipe_path):
+            return None
+
+        structure = (state["n_trees"], state["n_nodes"], state["n_features"])
+        for path in self._forest_paths():
+            if not path.exists():
+                continue
+            try:
+                forest = CompiledForest.load(path, mmap_mode=self.mmap_mode)
+            except Exception:
+                continue
+            if (forest.n_trees, forest.n_nodes, forest.n_features) == structure:
+                return state["pipeline"], forest
+        return None
+
+    def _forest_paths(self) -> Tuple[Path, ...]:
+        """Fichiers de forêt compilée acceptés, par ordre de préférence."""
+        if self.compact:
+            return (self.compact_path, self.forest_path)
+        return (self.forest_path,)
+
+    def load_compiled_forest(self, pipeline=None):
+        """
+        Charge les tableaux de la forêt compilée sauvegardés avec le modèle.
+
+        Par défaut, seule la forêt exacte (``forest_arrays.joblib``) est
+        chargée: elle donne les mêmes probabilités que sklearn, quelle que
+        soit la taille du lot. Avec ``compact``, la forêt compacte
+        (``forest_compact.joblib``) est préférée si elle existe. Avec
+        ``mmap_mode``, les tableaux sont projetés en mémoire et restent dans
+        le cache du système, partagé par les processus qui servent le même
+        modèle. Les arbres du pipeline complet restent en revanche copiés
+        dans chaque processus, sauf avec ``forest_only``.
+
+        Args:
+            pipeline: Pipeline chargé, pour vérifier que la forêt lui correspond
+
+        Returns:
+            CompiledForest, ou None si aucun fichier n'est présent, lisible et
+            cohérent avec le pipeline
+        """
+        from ..models.forest import CompiledForest, has_stripped_forest
+
+        # Pipeline sans arbres: la forêt a été chargée et vérifiée avec lui
+        if self._forest is not None and (pipeline is None or has_stripped_forest(pipeline)):
+            return self._forest
+
+        for path in self._forest_paths():
+            if not path.exists():
+                continue
+            try:
+                forest = CompiledForest.load(path, mmap_mode=self.mmap_mode)
+            except Exception:
+                continue
+            if pipeline is None or forest.matches(pipeline.steps[-1][1]):
+                return forest
+        return None
+
+    def load_global_shap(self) -> Optional[Dict]:
+        """
+        Charge le résumé SHAP global précalculé à l'entraînement.
+
+        Returns:
+            Résumé (voir FraudExplainer.global_shap_summary) ou None s'il est
+            absent ou illisible
+        """
+        if not self.shap_path.exists():
+            return None
+        try:
+            with open(self.shap_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
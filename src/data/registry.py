@@ -0,0 +1,228 @@
+"""Registre local des versions de modèles (un dossier par version sous models/)."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .loader import ArtifactLoader
+
+# Statuts possibles d'une version
+STAGES = ("champion", "challenger", "archived")
+
+# Métriques recopiées dans le manifeste pour comparer les versions sans les charger
+MANIFEST_METRICS = ("pr_auc", "roc_auc", "recall", "precision", "threshold")
+
+
+class ModelRegistry:
+    """
+    Registre de versions de modèles.
+
+    Chaque version est un dossier d'artefacts (voir ArtifactLoader) placé
+    sous la racine du registre, accompagné d'un ``manifest.json`` qui
+    décrit son statut (champion, challenger ou archivé), ses métriques de
+    validation et l'empreinte SHA-256 de ses fichiers.
+    """
+
+    manifest_name = "manifest.json"
+
+    def __init__(self, root: Path = Path("models")):
+        """
+        Initialise le registre.
+
+        Args:
+            root: Dossier racine contenant un sous-dossier par version
+        """
+        self.root = Path(root)
+
+    def _manifest_path(self, name: str) -> Path:
+        """Chemin du manifeste d'une version."""
+        return self.root / name / self.manifest_name
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        """Écrit un manifeste de façon atomique (fichier temporaire puis renommage)."""
+        path = self._manifest_path(manifest["name"])
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    def get(self, name: str) -> Optional[Dict]:
+        """
+        Lit le manifeste d'une version.
+
+        Args:
+            name: Nom de la version (nom du dossier)
+
+        Returns:
+            Manifeste, ou None si la version n'est pas enregistrée
+        """
+        path = self._manifest_path(name)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def list_versions(self) -> List[Dict]:
+        """
+        Liste les versions enregistrées.
+
+        Returns:
+            Manifestes triés par numéro de version
+        """
+        if not self.root.exists():
+            return []
+        manifests = [
+            self.get(path.name)
+            for path in self.root.iterdir()
+            if (path / self.manifest_name).exists()
+        ]
+        return sorted(manifests, key=lambda m: m["version"])
+
+    def register(
+        self, name: str, stage: str = "challenger", description: str = ""
+    ) -> Dict:
+        """
+        Enregistre (ou réenregistre) un dossier d'artefacts comme version.
+
+        Args:
+            name: Nom du dossier sous la racine du registre
+            stage: Statut initial ("champion", "challenger" ou "archived")
+            description: Description libre de la version
+
+        Returns:
+            Manifeste écrit
+
+        Raises:
+            FileNotFoundError: Si le dossier ne contient pas de pipeline
+            ValueError: Si le statut est inconnu
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Statut inconnu: {stage}. Choix possibles: {', '.join(STAGES)}")
+
+        loader = self.loader(name)
+        if not loader.pipe_path.exists():
+            raise FileNotFoundError(f"❌ Fichier modèle manquant: {loader.pipe_path}")
+
+        metrics = {}
+        if loader.metrics_path.exists():
+            with open(loader.metrics_path, "r", encoding="utf-8") as f:
+                metrics = json.load(f)
+
+        previous = self.get(name)
+        if previous is not None:
+            version = previous["version"]
+        else:
+            version = max((m["version"] for m in self.list_versions()), default=0) + 1
+
+        manifest = {
+            "name": name,
+            "version": version,
+            "stage": stage,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "description": description,
+            "metrics": {key: metrics[key] for key in MANIFEST_METRICS if key in metrics},
+            "files": {
+                filename: digest
+                for filename, digest in loader.fingerprint().items()
+                if digest is not None
+            },
+        }
+        self._write_manifest(manifest)
+        if stage == "champion":
+            self.promote(name)
+        return self.get(name)
+
+    def set_stage(self, name: str, stage: str) -> Dict:
+        """
+        Change le statut d'une version.
+
+        Args:
+            name: Nom de la version
+            stage: Nouveau statut (passer par promote pour "champion")
+
+        Returns:
+            Manifeste mis à jour
+
+        Raises:
+            KeyError: Si la version n'est pas enregistrée
+            ValueError: Si le statut est inconnu
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Statut inconnu: {stage}. Choix possibles: {', '.join(STAGES)}")
+        manifest = self.get(name)
+        if manifest is None:
+            raise KeyError(f"Version non enregistrée: {name}")
+        manifest["stage"] = stage
+        self._write_manifest(manifest)
+        return manifest
+
+    def promote(self, name: str) -> Dict:
+        """
+        Fait d'une version le champion; l'ancien champion est archivé.
+
+        Args:
+            name: Nom de la version à promouvoir
+
+        Returns:
+            Manifeste du nouveau champion
+        """
+        for manifest in self.list_versions():
+            if manifest["stage"] == "champion" and manifest["name"] != name:
+                self.set_stage(manifest["name"], "archived")
+        return self.set_stage(name, "champion")
+
+    def champion(self) -> Optional[str]:
+        """
+        Retourne le nom de la version champion.
+
+        Returns:
+            Nom du champion, ou None si aucune version n'est promue
+        """
+        for manifest in self.list_versions():
+            if manifest["stage"] == "champion":
+                return manifest["name"]
+        return None
+
+    def challengers(self) -> List[str]:
+        """
+        Retourne les noms des versions en statut challenger.
+
+        Returns:
+            Noms triés par numéro de version
+        """
+        return [m["name"] for m in self.list_versions() if m["stage"] == "challenger"]
+
+    def loader(self, name: str, mmap_mode: Optional[str] = None) -> ArtifactLoader:
+        """
+        Crée le chargeur d'artefacts d'une version.
+
+        Args:
+            name: Nom de la version
+            mmap_mode: Mode de projection en mémoire (voir ArtifactLoader)
+
+        Returns:
+            ArtifactLoader pointant sur le dossier de la version
+        """
+        return ArtifactLoader(self.root / name, mmap_mode=mmap_mode)
+
+    def verify(self, name: str) -> List[str]:
+        """
+        Compare les fichiers d'une version à l'empreinte de son manifeste.
+
+        Args:
+            name: Nom de la version
+
+        Returns:
+            Noms des fichiers modifiés, supprimés ou ajoutés depuis
+            l'enregistrement (liste vide si la version est intacte)
+
+        Raises:
+            KeyError: Si la version n'est pas enregistrée
+        """
+        manifest = self.get(name)
+        if manifest is None:
+            raise KeyError(f"Version non enregistrée: {name}")
+        current = {k: v for k, v in self.loader(name).fingerprint().items() if v is not None}
+        names = set(current) | set(manifest["files"])
+        return sorted(n for n in names if current.get(n) != manifest["files"].get(n))
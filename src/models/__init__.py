@@ -1,6 +1,25 @@
-"""Modules de modélisation et d'explication."""
+"""Modules de modélisation et d'explication (importés à la première utilisation)."""
 
-from .explainer import FraudExplainer
-from .predictor import FraudPredictor
+from typing import TYPE_CHECKING
 
-__all__ = ["FraudPredictor", "FraudExplainer"]
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .explainer import ExplanationCache, FraudExplainer
+    from .forest import CompiledForest
+    from .predictor import FraudPredictor, ScoredBatch
+    from .search import SuccessiveHalvingSearch
+    from .shadow import ShadowLog
+
+_EXPORTS = {
+    "FraudPredictor": ".predictor",
+    "FraudExplainer": ".explainer",
+    "ExplanationCache": ".explainer",
+    "CompiledForest": ".forest",
+    "ScoredBatch": ".predictor",
+    "ShadowLog": ".shadow",
+    "SuccessiveHalvingSearch": ".search",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,23 +1,300 @@
 """Module pour expliquer les prédictions avec SHAP."""
 
-from typing import Dict, List, Optional, Tuple
+import atexit
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import shap
+
+# Quantiles enregistrés pour la distribution SHAP de chaque feature (résumé global)
+SUMMARY_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Explainer chargé une seule fois dans chaque processus du pool
+_WORKER_EXPLAINER = None
+
+
+def _init_worker(pipeline) -> None:
+    """Initialise un processus du pool d'explication parallèle."""
+    global _WORKER_EXPLAINER
+    # Un seul thread par processus: le parallélisme vient du pool
+    model = pipeline.steps[-1][1]
+    if hasattr(model, "n_jobs"):
+        model.n_jobs = 1
+    _WORKER_EXPLAINER = FraudExplainer(pipeline)
+    _WORKER_EXPLAINER.warm_up(background=False)
+
+
+def _close_explainer(ref: "weakref.ref") -> None:
+    """Arrête le pool d'un explainer encore vivant à la fin de l'interpréteur."""
+    explainer = ref()
+    if explainer is not None:
+        explainer.close()
+
+
+def _explain_chunk(
+    start: int, x_transformed: np.ndarray, top_k: int
+) -> Tuple[int, Dict[str, np.ndarray]]:
+    """Explique un bloc de lignes déjà prétraitées dans un processus du pool."""
+    return start, _WORKER_EXPLAINER._top_k_reasons(x_transformed, top_k)
+
+
+def _shap_chunk(start: int, x_transformed: np.ndarray) -> Tuple[int, np.ndarray]:
+    """Calcule les valeurs SHAP d'un bloc prétraité dans un processus du pool."""
+    return start, _WORKER_EXPLAINER._shap_matrix(x_transformed)
+
+
+def _stratified_indices(
+    labels: np.ndarray, sample_size: int, rng: np.random.Generator
+) -> Dict[str, np.ndarray]:
+    """
+    Tire un échantillon stratifié par classe.
+
+    Chaque classe reçoit une part proportionnelle à sa fréquence, avec un
+    minimum de ``sample_size // (2 * n_classes)`` lignes pour que les classes
+    rares (fraudes) soient représentées.
+
+    Returns:
+        Dictionnaire {classe: indices tirés}
+    """
+    classes, counts = np.unique(labels, return_counts=True)
+    floor = sample_size // (2 * len(classes))
+    sample = {}
+    for cls, count in zip(classes, counts):
+        n_take = min(count, max(int(round(sample_size * count / len(labels))), floor))
+        members = np.flatnonzero(labels == cls)
+        sample[str(cls)] = np.sort(rng.choice(members, size=n_take, replace=False))
+    return sample
+
+
+def model_fingerprint(model) -> str:
+    """
+    Calcule une empreinte stable du modèle à partir de la structure de ses arbres.
+
+    Args:
+        model: Modèle sklearn (forêt, arbre ou autre estimateur)
+
+    Returns:
+        Empreinte hexadécimale (SHA-256)
+    """
+    digest = hashlib.sha256(type(model).__name__.encode("utf-8"))
+    estimators = getattr(model, "estimators_", [model])
+    trees = [getattr(estimator, "tree_", None) for estimator in estimators]
+
+    if any(tree is None for tree in trees):
+        # Modèle non arborescent: empreinte de sa sérialisation
+        digest.update(pickle.dumps(model))
+        return digest.hexdigest()
+
+    for tree in trees:
+        for array in (tree.feature, tree.threshold, tree.value):
+            digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+class ExplanationCache:
+    """
+    Cache LRU borné des explications SHAP, optionnellement persisté sur disque.
+
+    La clé combine le vecteur de features prétraité, l'empreinte du modèle et
+    ``top_k``: une même transaction réanalysée avec le même modèle réutilise
+    l'explication déjà calculée. ``max_entries`` borne aussi le dossier de
+    persistance: au-delà, les fichiers les moins récemment utilisés sont
+    supprimés.
+    """
+
+    def __init__(self, max_entries: int = 1024, cache_dir: Optional[Path] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            max_entries: Nombre maximal d'explications gardées en mémoire
+                et sur disque
+            cache_dir: Dossier de persistance (un fichier JSON par explication),
+                désactivé par défaut
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(x_row: np.ndarray, fingerprint: str, top_k: int) -> str:
+        """
+        Construit la clé d'une explication.
+
+        Args:
+            x_row: Vecteur de features prétraité
+            fingerprint: Empreinte du modèle
+            top_k: Nombre de features expliquées
+
+        Returns:
+            Clé hexadécimale (SHA-256)
+        """
+        digest = hashlib.sha256(f"{fingerprint}:{top_k}:".encode("utf-8"))
+        digest.update(np.ascontiguousarray(x_row, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """
+        Cherche une explication (mémoire puis disque).
+
+        Args:
+            key: Clé construite par make_key
+
+        Returns:
+            Copie de l'explication ou None si absente
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+
+        if value is None and self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            try:
+                value = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                value = None
+            if value is not None:
+                # Date de dernière utilisation, pour l'éviction du disque
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                self._remember(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return [dict(item) for item in value]
+
+    def put(self, key: str, value: List[Dict]) -> None:
+        """
+        Enregistre une explication.
+
+        Args:
+            key: Clé construite par make_key
+            value: Explication (liste de dictionnaires sérialisables en JSON)
+        """
+        value = [dict(item) for item in value]
+        self._remember(key, value)
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+                tmp_path.replace(path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                return
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Supprime les fichiers les moins récemment utilisés au-delà de max_entries."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        # Le plus récent (celui qui vient d'être écrit) est toujours conservé
+        for _, path in sorted(entries)[: max(0, len(entries) - max(1, self.max_entries))]:
+            path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, value: List[Dict]) -> None:
+        """Ajoute une entrée en mémoire en évinçant la moins récemment utilisée."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion des recherches servies par le cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Retourne les statistiques du cache.
+
+        Returns:
+            Dictionnaire {hits, misses, hit_rate, size}
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self),
+        }
+
+    def clear(self) -> None:
+        """Vide le cache mémoire et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Nombre d'explications gardées en mémoire."""
+        return len(self._entries)
 
 
 class FraudExplainer:
     """Explique les prédictions du modèle de détection de fraude."""
 
-    def __init__(self, pipeline):
+    def __init__(
+        self,
+        pipeline,
+        cache: Optional[ExplanationCache] = None,
+        global_summary: Optional[Dict] = None,
+        start_method: Optional[str] = None,
+    ):
         """
         Initialise l'explainer SHAP.
 
         Args:
             pipeline: Pipeline sklearn contenant le modèle
+            cache: Cache des explications unitaires (désactivé par défaut)
+            global_summary: Résumé SHAP global précalculé (voir global_shap_summary)
+            start_method: Méthode de démarrage des processus du pool
+                ("spawn" ou "forkserver" depuis un processus multi-thread,
+                ex: l'application), celle de multiprocessing par défaut
         """
         self.pipeline = pipeline
+        self.cache = cache
+        self.global_summary = global_summary
+        self.start_method = start_method
+        # Pool de processus créé au premier calcul parallèle et réutilisé
+        # d'un appel à l'autre (explainer construit une fois par processus)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
+        self._atexit_registered = False
+        self._fingerprint: Optional[str] = None
+        self.build_seconds: Optional[float] = None
+        self._explainer = None
+        self._build_lock = threading.Lock()
+        self._build_thread: Optional[threading.Thread] = None
         self.model = pipeline.named_steps["model"]
         self.preprocessor = pipeline.named_steps["prep"]
 
@@ -28,8 +305,129 @@ class FraudExplainer:
         except Exception:
             self.feature_names = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
 
-        # Créer l'explainer SHAP
-        self.explainer = shap.TreeExplainer(self.model)
+    @property
+    def explainer(self):
+        """
+        TreeExplainer SHAP, construit au premier accès.
+
+        La construction parcourt toute la forêt: elle est différée jusqu'à la
+        première explication (ou lancée à l'avance par warm_up).
+        """
+        if self._explainer is None:
+            with self._build_lock:
+                if self._explainer is None:
+                    # Import différé: shap (et numba, scipy...) coûte plusieurs
+                    # secondes et n'est utile qu'aux explications
+                    import shap
+
+                    start = time.perf_counter()
+                    self._explainer = shap.TreeExplainer(self.model)
+                    self.build_seconds = time.perf_counter() - start
+        return self._explainer
+
+    @property
+    def is_ready(self) -> bool:
+        """Indique si le TreeExplainer est déjà construit."""
+        return self._explainer is not None
+
+    def warm_up(self, background: bool = True) -> None:
+        """
+        Construit le TreeExplainer à l'avance.
+
+        Args:
+            background: Construire dans un thread démon (sans bloquer l'appelant)
+        """
+        if self.is_ready or self._build_thread is not None:
+            return
+        if not background:
+            self.explainer
+            return
+        self._build_thread = threading.Thread(
+            target=self._warm_up_target, name="shap-warm-up", daemon=True
+        )
+        self._build_thread.start()
+
+    def _warm_up_target(self) -> None:
+        """Construit le TreeExplainer; une erreur sera signalée par explain."""
+        try:
+            self.explainer
+        except Exception:
+            pass
+
+    def _get_pool(self, n_workers: int) -> ProcessPoolExecutor:
+        """Retourne le pool de processus (créé ou redimensionné si besoin)."""
+        with self._pool_lock:
+            if self._pool is not None and self._pool_workers != n_workers:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            if self._pool is None:
+                context = (
+                    multiprocessing.get_context(self.start_method) if self.start_method else None
+                )
+                self._pool = ProcessPoolExecutor(
+                    max_workers=n_workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.pipeline,),
+                )
+                self._pool_workers = n_workers
+                if not self._atexit_registered:
+                    atexit.register(_close_explainer, weakref.ref(self))
+                    self._atexit_registered = True
+            return self._pool
+
+    def close(self) -> None:
+        """Arrête le pool de processus (recréé au prochain calcul parallèle)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+                self._pool_workers = 0
+
+    def _run_on_pool(self, n_workers: int, submit_all: Callable) -> None:
+        """Exécute les tâches sur le pool; un pool cassé est fermé avant de relancer l'erreur."""
+        try:
+            submit_all(self._get_pool(n_workers))
+        except BrokenProcessPool:
+            self.close()
+            raise
+
+    @property
+    def fingerprint(self) -> str:
+        """Empreinte du modèle expliqué (calculée au premier accès)."""
+        if self._fingerprint is None:
+            self._fingerprint = model_fingerprint(self.model)
+        return self._fingerprint
+
+    def _transform(self, data: pd.DataFrame) -> np.ndarray:
+        """Applique le prétraitement et retourne une matrice dense."""
+        x_transformed = self.preprocessor.transform(data)
+        if hasattr(x_transformed, "toarray"):
+            return x_transformed.toarray()
+        return np.asarray(x_transformed)
+
+    def _shap_matrix(self, x_transformed: np.ndarray) -> np.ndarray:
+        """
+        Calcule les valeurs SHAP de la classe positive.
+
+        Args:
+            x_transformed: Matrice prétraitée (n_lignes, n_features)
+
+        Returns:
+            Matrice (n_lignes, n_features) des contributions à la classe fraude
+        """
+        shap_values = self.explainer.shap_values(x_transformed)
+
+        # Gérer le format de sortie de SHAP (liste par classe ou tableau 3D)
+        if isinstance(shap_values, list):
+            shap_values = shap_values[1]  # Classe positive
+
+        shap_values = np.asarray(shap_values)
+        if shap_values.ndim == 3:
+            # (n_lignes, n_features, n_classes): les classes se compensent,
+            # seule la classe positive est pertinente
+            shap_values = shap_values[:, :, 1]
+        return shap_values
 
     def explain(
         self, data: pd.DataFrame, top_k: int = 5
@@ -45,28 +443,18 @@ class FraudExplainer:
             Tuple (liste des features importantes, message d'erreur ou None)
         """
         try:
-            # Transformer les données
-            x_transformed = self.preprocessor.transform(data)
-            if hasattr(x_transformed, "toarray"):
-                x_transformed = x_transformed.toarray()
-            else:
-                x_transformed = np.asarray(x_transformed)
-
-            # Calculer les valeurs SHAP
-            shap_values = self.explainer.shap_values(x_transformed)
+            x_transformed = self._transform(data)
 
-            # Gérer le format de sortie de SHAP
-            if isinstance(shap_values, list):
-                shap_values = shap_values[1]  # Classe positive
-
-            shap_values = np.array(shap_values)
-
-            # Gérer les dimensions
-            if shap_values.ndim == 3:
-                shap_values = shap_values.sum(axis=2)
+            # Explication déjà calculée pour ce vecteur et ce modèle
+            key = None
+            if self.cache is not None:
+                key = self.cache.make_key(x_transformed[0], self.fingerprint, top_k)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached, None
 
             # Prendre la première ligne
-            sv = shap_values[0]
+            sv = self._shap_matrix(x_transformed[:1])[0]
 
             # Trier par importance absolue
             indices = np.argsort(np.abs(sv))[::-1][:top_k]
@@ -83,18 +471,325 @@ class FraudExplainer:
                     }
                 )
 
+            if key is not None:
+                self.cache.put(key, important_features)
             return important_features, None
 
         except Exception as e:
             return [], f"Erreur SHAP: {str(e)[:200]}"
 
-    def get_feature_importance(self) -> Dict[str, float]:
+    def explain_batch(
+        self, data: pd.DataFrame, top_k: int = 5
+    ) -> Tuple[Optional[Dict[str, np.ndarray]], Optional[str]]:
+        """
+        Explique toutes les lignes d'un lot en un seul passage SHAP.
+
+        Le prétraitement et le calcul SHAP sont faits une fois pour tout le
+        lot, puis les ``top_k`` features de chaque ligne sont extraites par
+        ``np.argpartition`` (sans tri complet ni boucle Python par ligne).
+
+        Args:
+            data: DataFrame à expliquer
+            top_k: Nombre de features les plus importantes par ligne
+
+        Returns:
+            Tuple (résultat en colonnes, message d'erreur ou None). Le résultat
+            contient des matrices (n_lignes, top_k) triées par importance
+            décroissante: "feature_index", "shap" et "value".
+        """
+        try:
+            return self._top_k_reasons(self._transform(data), top_k), None
+        except Exception as e:
+            return None, f"Erreur SHAP: {str(e)[:200]}"
+
+    def _top_k_reasons(self, x_transformed: np.ndarray, top_k: int) -> Dict[str, np.ndarray]:
+        """Calcule les top-k contributions de chaque ligne d'une matrice prétraitée."""
+        top_k = max(0, min(top_k, x_transformed.shape[1]))
+        if len(x_transformed) == 0:
+            return {
+                "feature_index": np.empty((0, top_k), dtype=np.intp),
+                "shap": np.empty((0, top_k)),
+                "value": np.empty((0, top_k)),
+            }
+
+        shap_values = self._shap_matrix(x_transformed)
+        indices = _top_k_indices(np.abs(shap_values), top_k)
+        return {
+            "feature_index": indices,
+            "shap": np.take_along_axis(shap_values, indices, axis=1),
+            "value": np.take_along_axis(x_transformed, indices, axis=1),
+        }
+
+    def explain_flagged(
+        self,
+        data: pd.DataFrame,
+        predictions: np.ndarray,
+        top_k: int = 3,
+        n_jobs: int = 1,
+        chunk_size: int = 256,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """
+        Explique uniquement les lignes signalées comme frauduleuses.
+
+        Prend la sortie de FraudPredictor.predict_batch: seules les lignes dont
+        la prédiction vaut 1 passent dans SHAP. Avec ``n_jobs > 1``, les blocs
+        sont répartis sur un pool de processus gardé d'un appel à l'autre:
+        l'explainer n'est construit qu'une fois par processus (voir close).
+
+        Args:
+            data: DataFrame scoré (mêmes lignes que ``predictions``)
+            predictions: Prédictions 0/1 issues de predict_batch
+            top_k: Nombre de raisons par ligne signalée
+            n_jobs: Nombre de processus (-1 pour tous les cœurs)
+            chunk_size: Nombre de lignes envoyées à chaque tâche du pool
+            progress: Fonction appelée avec (lignes expliquées, total) après
+                chaque bloc
+
+        Returns:
+            Tuple (DataFrame des raisons indexé comme les lignes signalées,
+            message d'erreur ou None)
+        """
+        try:
+            flagged = data.iloc[np.flatnonzero(np.asarray(predictions) == 1)]
+            n_rows = len(flagged)
+            n_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+
+            if n_rows == 0:
+                # Aucune alerte: colonnes de raisons vides
+                result = self._top_k_reasons(np.empty((0, len(self.feature_names))), top_k)
+            elif n_workers > 1 and n_rows > chunk_size:
+                result = self._explain_parallel(
+                    self._transform(flagged), top_k, chunk_size, progress, n_workers
+                )
+            else:
+                result = self._top_k_reasons(self._transform(flagged), top_k)
+                if progress is not None:
+                    progress(n_rows, n_rows)
+
+            return self.reasons_frame(result, index=flagged.index), None
+
+        except Exception as e:
+            return None, f"Erreur SHAP: {str(e)[:200]}"
+
+    def global_shap_summary(
+        self,
+        data: pd.DataFrame,
+        labels: Optional[np.ndarray] = None,
+        sample_size: int = 2000,
+        n_jobs: int = 1,
+        chunk_size: int = 256,
+        random_state: int = 42,
+    ) -> Dict:
+        """
+        Calcule un résumé SHAP global sur un échantillon stratifié.
+
+        L'importance globale (moyenne des |SHAP|) est pondérée par la
+        fréquence réelle de chaque classe; les distributions (quantiles,
+        moyenne signée) sont données par classe.
+
+        Args:
+            data: Données de référence (features d'origine)
+            labels: Classes réelles pour stratifier (échantillon simple si None)
+            sample_size: Taille visée de l'échantillon
+            n_jobs: Nombre de processus (-1 pour tous les cœurs)
+            chunk_size: Nombre de lignes envoyées à chaque tâche du pool
+            random_state: Graine du tirage
+
+        Returns:
+            Dictionnaire sérialisable en JSON (features, mean_abs_shap,
+            expected_value, quantiles, by_class, n_samples)
+        """
+        rng = np.random.default_rng(random_state)
+        if labels is None:
+            n_take = min(sample_size, len(data))
+            strata = {"all": np.sort(rng.choice(len(data), size=n_take, replace=False))}
+            shares = {"all": 1.0}
+        else:
+            labels = np.asarray(labels)
+            strata = _stratified_indices(labels, sample_size, rng)
+            classes, counts = np.unique(labels, return_counts=True)
+            shares = {str(cls): count / len(labels) for cls, count in zip(classes, counts)}
+
+        indices = np.concatenate(list(strata.values()))
+        x_transformed = self._transform(data.iloc[indices])
+        n_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+        if n_workers > 1 and len(indices) > chunk_size:
+            shap_values = self._shap_parallel(x_transformed, chunk_size, n_workers)
+        else:
+            shap_values = self._shap_matrix(x_transformed)
+
+        by_class = {}
+        mean_abs = np.zeros(shap_values.shape[1])
+        offset = 0
+        for cls, members in strata.items():
+            values = shap_values[offset : offset + len(members)]
+            offset += len(members)
+            class_mean_abs = np.abs(values).mean(axis=0)
+            # Pondération par la fréquence réelle de la classe
+            share = float(shares[cls])
+            mean_abs += share * class_mean_abs
+            quantiles = np.quantile(values, SUMMARY_QUANTILES, axis=0)
+            by_class[cls] = {
+                "n": int(len(members)),
+                "share": share,
+                "mean_abs_shap": dict(zip(self.feature_names, class_mean_abs.tolist())),
+                "mean_shap": dict(zip(self.feature_names, values.mean(axis=0).tolist())),
+                "quantiles": {
+                    name: quantiles[:, j].tolist() for j, name in enumerate(self.feature_names)
+                },
+            }
+
+        expected_value = np.atleast_1d(np.asarray(self.explainer.expected_value, dtype=float))
+        return {
+            "features": list(self.feature_names),
+            "mean_abs_shap": dict(zip(self.feature_names, mean_abs.tolist())),
+            "expected_value": float(expected_value[-1]),
+            "quantiles": list(SUMMARY_QUANTILES),
+            "by_class": by_class,
+            "n_samples": int(len(indices)),
+            "random_state": random_state,
+        }
+
+    def _shap_parallel(
+        self, x_transformed: np.ndarray, chunk_size: int, n_workers: int
+    ) -> np.ndarray:
+        """Calcule les valeurs SHAP par blocs sur un pool de processus."""
+        shap_values = np.empty(x_transformed.shape, dtype=np.float64)
+
+        def submit_all(pool: ProcessPoolExecutor) -> None:
+            futures = [
+                pool.submit(_shap_chunk, start, x_transformed[start : start + chunk_size])
+                for start in range(0, len(x_transformed), chunk_size)
+            ]
+            for future in as_completed(futures):
+                start, chunk = future.result()
+                shap_values[start : start + len(chunk)] = chunk
+
+        self._run_on_pool(n_workers, submit_all)
+        return shap_values
+
+    def empty_reasons(self, top_k: int = 3, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """
+        Colonnes de raisons sans explication (même schéma que explain_flagged).
+
+        Utilisé quand les explications échouent: le rapport garde les mêmes
+        colonnes et types qu'un bloc expliqué.
+
+        Args:
+            top_k: Nombre de raisons par ligne
+            index: Index des lignes (vide par défaut)
+
+        Returns:
+            DataFrame des colonnes reason_i (texte) et reason_i_shap (float64),
+            sans valeur
+        """
+        k = max(0, min(top_k, len(self.feature_names)))
+        index = index if index is not None else pd.RangeIndex(0)
+        columns = {}
+        for rank in range(1, k + 1):
+            columns[f"reason_{rank}"] = pd.Series(None, index=index, dtype=object)
+            columns[f"reason_{rank}_shap"] = pd.Series(np.nan, index=index, dtype=np.float64)
+        return pd.DataFrame(columns, index=index)
+
+    @staticmethod
+    def attach_reasons(data: pd.DataFrame, reasons: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ajoute les colonnes de raisons à un rapport complet.
+
+        Les lignes non signalées reçoivent une raison vide et une contribution
+        manquante, avec des types de colonnes stables d'un bloc à l'autre.
+
+        Args:
+            data: Rapport (toutes les lignes)
+            reasons: Résultat de explain_flagged
+
+        Returns:
+            Copie du rapport avec les colonnes reason_i et reason_i_shap
+        """
+        reasons = reasons.reindex(data.index)
+        for col in reasons.columns:
+            if col.endswith("_shap"):
+                reasons[col] = reasons[col].astype(np.float64)
+            else:
+                reasons[col] = reasons[col].fillna("").astype(str)
+        return pd.concat([data, reasons], axis=1)
+
+    def _explain_parallel(
+        self,
+        x_transformed: np.ndarray,
+        top_k: int,
+        chunk_size: int,
+        progress: Optional[Callable[[int, int], None]],
+        n_workers: int,
+    ) -> Dict[str, np.ndarray]:
+        """Répartit les blocs à expliquer sur un pool de processus."""
+        n_rows = len(x_transformed)
+        k = max(0, min(top_k, x_transformed.shape[1]))
+        result = {
+            "feature_index": np.empty((n_rows, k), dtype=np.intp),
+            "shap": np.empty((n_rows, k)),
+            "value": np.empty((n_rows, k)),
+        }
+
+        def submit_all(pool: ProcessPoolExecutor) -> None:
+            futures = [
+                pool.submit(_explain_chunk, start, x_transformed[start : start + chunk_size], top_k)
+                for start in range(0, n_rows, chunk_size)
+            ]
+            done = 0
+            for future in as_completed(futures):
+                start, chunk = future.result()
+                stop = start + len(chunk["shap"])
+                for name, values in chunk.items():
+                    result[name][start:stop] = values
+                done += stop - start
+                if progress is not None:
+                    progress(done, n_rows)
+
+        self._run_on_pool(n_workers, submit_all)
+        return result
+
+    def reasons_frame(
+        self, result: Dict[str, np.ndarray], index: Optional[pd.Index] = None
+    ) -> pd.DataFrame:
+        """
+        Met en forme le résultat de explain_batch (une colonne par raison).
+
+        Args:
+            result: Résultat de explain_batch
+            index: Index à donner au DataFrame (celui des lignes expliquées)
+
+        Returns:
+            DataFrame avec les colonnes reason_i (feature et sens de l'effet)
+            et reason_i_shap pour i = 1..top_k
+        """
+        names = np.asarray(self.feature_names, dtype=object)
+        shap_values = result["shap"]
+        columns = {}
+        for rank in range(shap_values.shape[1]):
+            features = names[result["feature_index"][:, rank]]
+            arrows = np.where(shap_values[:, rank] > 0, " ↑", " ↓")
+            columns[f"reason_{rank + 1}"] = features + arrows
+            columns[f"reason_{rank + 1}_shap"] = shap_values[:, rank]
+        return pd.DataFrame(columns, index=index)
+
+    def get_feature_importance(self, method: str = "impurity") -> Dict[str, float]:
         """
         Retourne l'importance globale des features.
 
+        Args:
+            method: "impurity" (feature_importances_ du modèle) ou "shap"
+                (moyenne des |SHAP| du résumé global précalculé)
+
         Returns:
             Dictionnaire {feature: importance}
         """
+        if method == "shap":
+            if self.global_summary is None:
+                return {}
+            return dict(self.global_summary.get("mean_abs_shap", {}))
+
         try:
             if hasattr(self.model, "feature_importances_"):
                 importances = self.model.feature_importances_
@@ -105,3 +800,25 @@ class FraudExplainer:
         except Exception:
             pass
         return {}
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Indices des ``top_k`` plus grandes valeurs de chaque ligne, triés par valeur décroissante.
+
+    Args:
+        scores: Matrice (n_lignes, n_colonnes)
+        top_k: Nombre d'indices par ligne
+
+    Returns:
+        Matrice d'indices (n_lignes, min(top_k, n_colonnes))
+    """
+    top_k = max(0, min(top_k, scores.shape[1]))
+    if top_k == 0:
+        return np.empty((scores.shape[0], 0), dtype=np.intp)
+    if top_k < scores.shape[1]:
+        candidates = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
@@ -0,0 +1,450 @@
+"""Moteur d'inférence compilé pour les forêts aléatoires."""
+
+import copy
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Valeur utilisée par sklearn pour marquer une feuille dans ``tree_.feature``
+_LEAF = -2
+
+
+def transform_features(pipeline, data) -> np.ndarray:
+    """
+    Applique les étapes de prétraitement du pipeline (sans le modèle final).
+
+    Les étapes de ré-échantillonnage (SMOTE) sont ignorées, comme le fait
+    le pipeline imblearn lors de l'inférence.
+
+    Args:
+        pipeline: Pipeline sklearn/imblearn entraîné
+        data: Données brutes (DataFrame ou ndarray)
+
+    Returns:
+        Matrice des features transformées
+    """
+    x = data
+    for _, step in pipeline.steps[:-1]:
+        if _skipped(step):
+            continue
+        x = step.transform(x)
+    if hasattr(x, "toarray"):
+        x = x.toarray()
+    return np.asarray(x)
+
+
+def _skipped(step) -> bool:
+    """Indique si une étape est ignorée à l'inférence (passthrough ou SMOTE)."""
+    return step is None or (isinstance(step, str) and step == "passthrough") or hasattr(
+        step, "fit_resample"
+    )
+
+
+def strip_forest(pipeline):
+    """
+    Copie un pipeline en retirant les arbres de sa forêt finale.
+
+    La copie garde le prétraitement et les attributs de la forêt
+    (``classes_``, ``n_features_in_``...) mais ``estimators_`` est vide: elle
+    ne peut scorer qu'avec la CompiledForest correspondante, qui porte les
+    arbres (voir ArtifactLoader, option ``forest_only``).
+
+    Args:
+        pipeline: Pipeline sklearn/imblearn dont la dernière étape est une forêt
+
+    Returns:
+        Pipeline sans arbres (le pipeline d'origine n'est pas modifié)
+    """
+    name, model = pipeline.steps[-1]
+    model = copy.copy(model)
+    model.estimators_ = []
+    stripped = copy.copy(pipeline)
+    stripped.steps = list(pipeline.steps[:-1]) + [(name, model)]
+    return stripped
+
+
+def has_stripped_forest(pipeline) -> bool:
+    """Indique si la forêt finale du pipeline a été retirée par strip_forest."""
+    estimators = getattr(pipeline.steps[-1][1], "estimators_", None)
+    return estimators is not None and len(estimators) == 0
+
+
+def _compile_scaler(scaler, n_features: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Traduit un StandardScaler entraîné en (source, offset, scale)."""
+    offset = np.zeros(n_features) if scaler.mean_ is None else np.asarray(scaler.mean_, float)
+    scale = np.ones(n_features) if scaler.scale_ is None else np.asarray(scaler.scale_, float)
+    return np.arange(n_features, dtype=np.intp), offset, scale
+
+
+def _compile_step(step, input_columns: Optional[List[str]], n_features: int):
+    """
+    Traduit une étape de prétraitement en transformation affine.
+
+    Returns:
+        Tuple (source, offset, scale) ou None si l'étape n'est pas supportée
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.preprocessing import FunctionTransformer, StandardScaler
+
+    if isinstance(step, StandardScaler):
+        return _compile_scaler(step, n_features)
+
+    if not isinstance(step, ColumnTransformer):
+        return None
+
+    sources, offsets, scales = [], [], []
+    for _, transformer, cols in step.transformers_:
+        if isinstance(transformer, str) and transformer == "drop":
+            continue
+        cols = np.atleast_1d(np.asarray(cols))
+        if cols.size == 0:
+            continue
+        if cols.dtype == bool:
+            positions = np.flatnonzero(cols)
+        elif cols.dtype.kind in "iu":
+            positions = cols.astype(np.intp)
+        elif input_columns is not None:
+            lookup = {col: i for i, col in enumerate(input_columns)}
+            if any(col not in lookup for col in cols):
+                return None
+            positions = np.asarray([lookup[col] for col in cols], dtype=np.intp)
+        else:
+            return None
+
+        # Le remainder "passthrough" est stocké comme FunctionTransformer identité
+        identity = (isinstance(transformer, str) and transformer == "passthrough") or (
+            isinstance(transformer, FunctionTransformer) and transformer.func is None
+        )
+        if identity:
+            offsets.append(np.zeros(len(positions)))
+            scales.append(np.ones(len(positions)))
+        elif isinstance(transformer, StandardScaler):
+            _, offset, scale = _compile_scaler(transformer, len(positions))
+            offsets.append(offset)
+            scales.append(scale)
+        else:
+            return None
+        sources.append(positions)
+
+    if not sources:
+        return None
+    return np.concatenate(sources), np.concatenate(offsets), np.concatenate(scales)
+
+
+class AffinePreprocessor:
+    """
+    Prétraitement compilé sous forme ``(x[:, source] - offset) / scale``.
+
+    Couvre le ColumnTransformer du projet (StandardScaler sur Amount/Time,
+    le reste en passthrough) sans passer par pandas.
+    """
+
+    def __init__(self, source: np.ndarray, offset: np.ndarray, scale: np.ndarray):
+        """
+        Initialise le prétraitement compilé.
+
+        Args:
+            source: Colonne d'entrée de chaque feature de sortie
+            offset: Valeur soustraite à chaque feature de sortie
+            scale: Diviseur de chaque feature de sortie
+        """
+        self.source = np.asarray(source, dtype=np.intp)
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+
+    @classmethod
+    def from_pipeline(
+        cls, pipeline, input_columns: List[str]
+    ) -> Optional["AffinePreprocessor"]:
+        """
+        Compile les étapes de prétraitement d'un pipeline.
+
+        Le résultat est vérifié sur quelques lignes de test contre le pipeline
+        lui-même.
+
+        Args:
+            pipeline: Pipeline sklearn/imblearn entraîné
+            input_columns: Colonnes d'entrée, dans l'ordre
+
+        Returns:
+            Prétraitement compilé, ou None si le pipeline n'est pas supporté
+        """
+        n_features = len(input_columns)
+        source = np.arange(n_features, dtype=np.intp)
+        offset = np.zeros(n_features)
+        scale = np.ones(n_features)
+
+        columns = list(input_columns)
+        for _, step in pipeline.steps[:-1]:
+            if _skipped(step):
+                continue
+            compiled = _compile_step(step, columns, len(source))
+            if compiled is None:
+                return None
+            # Composition: ((x[s1] - o1) / s1)[s2] - o2) / s2
+            step_source, step_offset, step_scale = compiled
+            offset = offset[step_source] + step_offset * scale[step_source]
+            scale = scale[step_source] * step_scale
+            source = source[step_source]
+            columns = None
+
+        compiled = cls(source, offset, scale)
+
+        # Vérification sur des lignes de test
+        try:
+            probe = np.random.default_rng(0).normal(size=(4, n_features)) * 100.0
+            expected = transform_features(pipeline, pd.DataFrame(probe, columns=input_columns))
+            if not np.allclose(compiled.transform(probe), expected, rtol=1e-9, atol=1e-9):
+                return None
+        except Exception:
+            return None
+        return compiled
+
+    def transform(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Applique le prétraitement.
+
+        Args:
+            x: Matrice alignée sur les colonnes d'entrée
+            out: Matrice de sortie optionnelle (n_rows, n_features de sortie)
+
+        Returns:
+            Matrice des features transformées
+        """
+        out = np.take(x, self.source, axis=1, out=out)
+        out -= self.offset
+        out /= self.scale
+        return out
+
+
+class CompiledForest:
+    """
+    Forêt aléatoire aplatie en tableaux NumPy contigus.
+
+    Tous les arbres sont concaténés dans des tableaux uniques (feature, seuil,
+    enfants, valeur des feuilles) et évalués de façon vectorisée sur toutes
+    les lignes, avec les mêmes comparaisons que sklearn (X en float32,
+    seuils en float64, ou float32 arrondis vers le bas pour une forêt
+    compacte, voir compact()).
+    """
+
+    # Tableaux sauvegardés par save() et relus (éventuellement en mmap) par load()
+    _ARRAYS = ("feature", "threshold", "left", "right", "value", "roots")
+
+    def __init__(self, model):
+        """
+        Compile un RandomForestClassifier entraîné.
+
+        Args:
+            model: Forêt sklearn entraînée (attribut ``estimators_``)
+
+        Raises:
+            ValueError: Si le modèle n'est pas une forêt binaire entraînée
+        """
+        estimators = getattr(model, "estimators_", None)
+        if not estimators:
+            raise ValueError("Le moteur compilé nécessite une forêt entraînée (estimators_).")
+        if getattr(model, "n_classes_", 2) != 2:
+            raise ValueError("Le moteur compilé ne supporte que la classification binaire.")
+
+        self.n_features = int(model.n_features_in_)
+        self.n_trees = len(estimators)
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for est in estimators:
+            tree = est.tree_
+            left = tree.children_left.astype(np.intp)
+            right = tree.children_right.astype(np.intp)
+            is_leaf = left == -1
+
+            # Probabilités normalisées par nœud (comme DecisionTreeClassifier.predict_proba)
+            value = tree.value[:, 0, :].astype(np.float64)
+            normalizer = value.sum(axis=1)
+            normalizer[normalizer == 0.0] = 1.0
+
+            roots.append(offset)
+            features.append(np.where(is_leaf, _LEAF, tree.feature).astype(np.intp))
+            thresholds.append(tree.threshold.astype(np.float64))
+            lefts.append(np.where(is_leaf, -1, left + offset))
+            rights.append(np.where(is_leaf, -1, right + offset))
+            values.append(value[:, 1] / normalizer)
+            offset += tree.node_count
+
+        self.feature = np.ascontiguousarray(np.concatenate(features))
+        self.threshold = np.ascontiguousarray(np.concatenate(thresholds))
+        self.left = np.ascontiguousarray(np.concatenate(lefts))
+        self.right = np.ascontiguousarray(np.concatenate(rights))
+        self.value = np.ascontiguousarray(np.concatenate(values))
+        self.roots = np.asarray(roots, dtype=np.intp)
+        # Facteur appliqué aux valeurs des feuilles (différent de 1 si quantifiées)
+        self.value_scale = 1.0
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "CompiledForest":
+        """
+        Compile le modèle final d'un pipeline.
+
+        Args:
+            pipeline: Pipeline sklearn/imblearn dont la dernière étape est une forêt
+
+        Returns:
+            Forêt compilée
+        """
+        return cls(pipeline.steps[-1][1])
+
+    def compact(self, value_bits: int = 16) -> "CompiledForest":
+        """
+        Crée une copie compacte, réservée à l'inférence.
+
+        Les seuils passent en float32, arrondis vers le bas: comme X est
+        évalué en float32, ``x <= seuil32`` donne exactement la même
+        décision que ``x <= seuil64``. Les indices sont stockés sur 16/32
+        bits et les probabilités des feuilles sont quantifiées sur
+        ``value_bits`` bits (erreur maximale 1 / (2 * (2**bits - 1))).
+
+        Args:
+            value_bits: Nombre de bits des valeurs de feuilles (8 ou 16)
+
+        Returns:
+            Forêt compacte (environ 16 octets par nœud au lieu de 40)
+
+        Raises:
+            ValueError: Si value_bits n'est pas 8 ou 16
+        """
+        if value_bits not in (8, 16):
+            raise ValueError("value_bits doit valoir 8 ou 16.")
+
+        threshold = self.threshold.astype(np.float32)
+        rounded_up = threshold.astype(np.float64) > self.threshold
+        threshold[rounded_up] = np.nextafter(threshold[rounded_up], np.float32(-np.inf))
+
+        levels = 2**value_bits - 1
+        value_dtype = np.uint8 if value_bits == 8 else np.uint16
+        is_leaf = self.feature == _LEAF
+        value = np.where(is_leaf, np.rint(self.value * levels), 0).astype(value_dtype)
+
+        index_dtype = np.int32 if self.n_nodes < 2**31 else np.intp
+        feature_dtype = np.int16 if self.n_features < 2**15 else np.intp
+
+        forest = CompiledForest.__new__(CompiledForest)
+        forest.n_features = self.n_features
+        forest.n_trees = self.n_trees
+        forest.feature = self.feature.astype(feature_dtype)
+        forest.threshold = threshold
+        forest.left = self.left.astype(index_dtype)
+        forest.right = self.right.astype(index_dtype)
+        forest.value = value
+        forest.roots = self.roots.astype(index_dtype)
+        forest.value_scale = 1.0 / levels
+        return forest
+
+    @property
+    def nbytes(self) -> int:
+        """Taille des tableaux de la forêt en octets."""
+        return sum(getattr(self, name).nbytes for name in self._ARRAYS)
+
+    def save(self, path: Path) -> None:
+        """
+        Sauvegarde les tableaux de la forêt.
+
+        Les tableaux sont écrits sans compression: load() peut les projeter
+        en mémoire (mmap), et plusieurs processus partagent alors les mêmes
+        pages via le cache du système.
+
+        Args:
+            path: Chemin du fichier (.joblib)
+        """
+        state = {name: getattr(self, name) for name in self._ARRAYS}
+        state.update(
+            n_features=self.n_features, n_trees=self.n_trees, value_scale=self.value_scale
+        )
+        joblib.dump(state, path)
+
+    @classmethod
+    def load(cls, path: Path, mmap_mode: Optional[str] = "r") -> "CompiledForest":
+        """
+        Recharge une forêt sauvegardée par save().
+
+        Args:
+            path: Chemin du fichier
+            mmap_mode: Mode de projection en mémoire ("r" par défaut, None pour
+                une copie privée)
+
+        Returns:
+            Forêt compilée (tableaux en lecture seule si projetés)
+        """
+        state = joblib.load(path, mmap_mode=mmap_mode)
+        forest = cls.__new__(cls)
+        for name in cls._ARRAYS:
+            setattr(forest, name, state[name])
+        forest.n_features = int(state["n_features"])
+        forest.n_trees = int(state["n_trees"])
+        forest.value_scale = float(state.get("value_scale", 1.0))
+        return forest
+
+    def matches(self, model) -> bool:
+        """
+        Vérifie que la forêt correspond à un modèle (nombre d'arbres, de nœuds et de features).
+
+        Args:
+            model: Forêt sklearn entraînée
+
+        Returns:
+            True si la structure est identique
+        """
+        estimators = getattr(model, "estimators_", None) or []
+        return (
+            len(estimators) == self.n_trees
+            and int(getattr(model, "n_features_in_", -1)) == self.n_features
+            and sum(est.tree_.node_count for est in estimators) == self.n_nodes
+        )
+
+    @property
+    def n_nodes(self) -> int:
+        """Nombre total de nœuds de la forêt."""
+        return int(self.feature.shape[0])
+
+    def predict_proba(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Calcule la probabilité de la classe positive.
+
+        Args:
+            x: Matrice des features transformées (n_rows, n_features)
+            out: Tableau de sortie optionnel de taille n_rows
+
+        Returns:
+            Probabilités de fraude (moyenne des arbres)
+        """
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        if x.ndim != 2 or x.shape[1] != self.n_features:
+            raise ValueError(
+                f"Dimensions invalides: {x.shape}, {self.n_features} features attendues."
+            )
+        n_rows = x.shape[0]
+        flat_x = x.ravel()
+
+        # Un parcours par couple (arbre, ligne), arbre en axe majeur
+        node = np.repeat(self.roots, n_rows)
+        row_offset = np.tile(np.arange(n_rows, dtype=np.intp) * self.n_features, self.n_trees)
+
+        active = np.flatnonzero(self.feature[node] != _LEAF)
+        while active.size:
+            cur = node[active]
+            go_left = flat_x[row_offset[active] + self.feature[cur]] <= self.threshold[cur]
+            nxt = np.where(go_left, self.left[cur], self.right[cur])
+            node[active] = nxt
+            active = active[self.feature[nxt] != _LEAF]
+
+        # Somme dans l'ordre des arbres, comme RandomForestClassifier
+        leaf_values = self.value[node].reshape(self.n_trees, n_rows)
+        if out is None:
+            out = np.empty(n_rows, dtype=np.float64)
+        np.sum(leaf_values, axis=0, out=out, dtype=np.float64)
+        out /= self.n_trees
+        if self.value_scale != 1.0:
+            out *= self.value_scale
+        return out
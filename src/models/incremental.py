@@ -0,0 +1,93 @@
+"""Ré-entraînement incrémental d'une forêt entraînée (warm start)."""
+
+from typing import Dict, Optional
+
+import numpy as np
+from sklearn.base import clone
+
+from .forest import transform_features
+
+
+def warm_start_forest(
+    pipeline,
+    X_new,
+    y_new,
+    n_new_trees: int,
+    max_trees: Optional[int] = None,
+    random_state: Optional[int] = None,
+    resample_cache=None,
+) -> Dict:
+    """
+    Ajoute à la forêt d'un pipeline entraîné des arbres appris sur une
+    nouvelle fenêtre de données.
+
+    Le prétraitement déjà entraîné est conservé tel quel (les anciens arbres
+    restent valides); SMOTE est appliqué à la nouvelle fenêtre seulement,
+    puis ``n_new_trees`` arbres sont ajoutés par ``warm_start``. Avec
+    ``max_trees``, les arbres les plus anciens sont retirés pour garder une
+    forêt de taille fixe. Le pipeline est modifié en place.
+
+    Args:
+        pipeline: Pipeline imblearn entraîné (prétraitement → SMOTE → forêt)
+        X_new: Features de la nouvelle fenêtre (colonnes brutes)
+        y_new: Cible de la nouvelle fenêtre
+        n_new_trees: Nombre d'arbres à ajouter
+        max_trees: Taille maximale de la forêt (None pour tout conserver)
+        random_state: Graine des nouveaux arbres (None pour garder celle de la forêt)
+        resample_cache: ResampleCache optionnel pour le ré-échantillonnage SMOTE
+
+    Returns:
+        Rapport: arbres avant/ajoutés/retirés/après et lignes utilisées
+
+    Raises:
+        ValueError: Si n_new_trees < 1, si max_trees < n_new_trees ou si la
+            fenêtre ne contient pas les classes connues de la forêt
+    """
+    if n_new_trees < 1:
+        raise ValueError("n_new_trees doit être supérieur ou égal à 1.")
+    if max_trees is not None and max_trees < n_new_trees:
+        raise ValueError("max_trees doit être supérieur ou égal à n_new_trees.")
+
+    forest = pipeline.steps[-1][1]
+    classes = np.unique(np.asarray(y_new))
+    # warm_start recalcule classes_: une fenêtre sans fraude casserait les anciens arbres
+    if not np.array_equal(classes, forest.classes_):
+        raise ValueError(
+            f"La fenêtre doit contenir les classes {forest.classes_.tolist()} "
+            f"(trouvé: {classes.tolist()})."
+        )
+
+    # Prétraitement existant appliqué sans ré-entraînement
+    x = transform_features(pipeline, X_new)
+    y = np.asarray(y_new)
+
+    sampler = next((step for _, step in pipeline.steps if hasattr(step, "fit_resample")), None)
+    if sampler is not None:
+        sampler = clone(sampler)
+        if resample_cache is not None:
+            x, y = resample_cache.fit_resample(sampler, x, y)
+        else:
+            x, y = sampler.fit_resample(x, y)
+
+    n_before = len(forest.estimators_)
+    params = {"warm_start": True, "n_estimators": n_before + n_new_trees}
+    if random_state is not None:
+        params["random_state"] = random_state
+    forest.set_params(**params)
+    forest.fit(x, y)
+
+    # Les nouveaux arbres sont ajoutés en fin de liste: les plus anciens sont en tête
+    n_retired = 0
+    if max_trees is not None and len(forest.estimators_) > max_trees:
+        n_retired = len(forest.estimators_) - max_trees
+        forest.estimators_ = forest.estimators_[n_retired:]
+
+    forest.set_params(warm_start=False, n_estimators=len(forest.estimators_))
+    return {
+        "n_trees_before": n_before,
+        "n_trees_added": n_new_trees,
+        "n_trees_retired": n_retired,
+        "n_trees_after": len(forest.estimators_),
+        "n_rows": int(len(X_new)),
+        "n_rows_resampled": int(len(y)),
+    }
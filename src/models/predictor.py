@@ -1,15 +1,153 @@
 """Module pour effectuer des prédictions de fraude."""
 
-from typing import List, Tuple
+import atexit
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .forest import AffinePreprocessor, CompiledForest, has_stripped_forest, transform_features
+from .shadow import ShadowLog, shares_preprocessing
+
+# Moteurs d'inférence disponibles
+ENGINES = ("sklearn", "compiled", "auto")
+
+# Niveaux de risque et bornes inférieures par défaut des niveaux supérieurs
+RISK_LABELS = ("FAIBLE", "MODÉRÉ", "ÉLEVÉ", "CRITIQUE")
+DEFAULT_RISK_BANDS = (0.3, 0.5, 0.8)
+
+# Prédicateur chargé une seule fois dans chaque processus du pool
+_WORKER_PREDICTOR = None
+
+# Segment de mémoire partagée ouvert par le processus (réutilisé entre les chunks)
+_WORKER_SHM = None
+
+
+def _init_worker(
+    pipeline, expected_columns: List[str], engine: str, forest: Optional[CompiledForest]
+) -> None:
+    """Initialise un processus du pool de scoring parallèle."""
+    global _WORKER_PREDICTOR
+    # Un seul thread par processus: le parallélisme vient du pool
+    model = pipeline.steps[-1][1]
+    if hasattr(model, "n_jobs"):
+        model.n_jobs = 1
+    # Prédicateur minimal: les challengers restent dans le processus principal
+    _WORKER_PREDICTOR = FraudPredictor(pipeline, expected_columns, engine=engine, forest=forest)
+
+
+def _attach_shared(shm_name: str) -> shared_memory.SharedMemory:
+    """Ouvre le segment partagé du processus principal (une fois par segment)."""
+    global _WORKER_SHM
+    if _WORKER_SHM is None or _WORKER_SHM.name != shm_name:
+        if _WORKER_SHM is not None:
+            _WORKER_SHM.close()
+        _WORKER_SHM = shared_memory.SharedMemory(name=shm_name)
+    return _WORKER_SHM
+
+
+def _score_shared_chunk(
+    shm_name: str, shape: Tuple[int, int], start: int, stop: int
+) -> Tuple[int, int, np.ndarray]:
+    """Score les lignes [start, stop) de la matrice placée en mémoire partagée."""
+    shm = _attach_shared(shm_name)
+    matrix = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+    try:
+        probabilities = _WORKER_PREDICTOR._predict_proba(matrix[start:stop])
+    finally:
+        # Aucune vue ne doit survivre au segment (fermé au changement de segment)
+        del matrix
+    return start, stop, probabilities
+
+
+def _close_predictor(ref: "weakref.ref") -> None:
+    """Arrête le pool d'un prédicateur encore vivant à la fin de l'interpréteur."""
+    predictor = ref()
+    if predictor is not None:
+        predictor.close()
+
+
+class ScoredBatch:
+    """
+    Probabilités d'un lot déjà scoré.
+
+    Les sorties qui dépendent du seuil (prédictions, nombre d'alertes) sont
+    recalculées à partir des probabilités mémorisées, sans nouveau passage
+    dans la forêt. Le comptage d'alertes utilise les probabilités triées
+    (recherche dichotomique).
+    """
+
+    def __init__(self, probabilities: np.ndarray):
+        """
+        Initialise le lot scoré.
+
+        Args:
+            probabilities: Probabilités de fraude, dans l'ordre des lignes
+        """
+        self.probabilities = np.asarray(probabilities, dtype=np.float64)
+        self.sorted_probabilities = np.sort(self.probabilities)
+
+    def __len__(self) -> int:
+        """Nombre de lignes du lot."""
+        return len(self.probabilities)
+
+    def predictions(self, threshold: float) -> np.ndarray:
+        """
+        Applique un seuil de décision.
+
+        Args:
+            threshold: Seuil de décision
+
+        Returns:
+            Prédictions (0/1) dans l'ordre des lignes
+        """
+        return (self.probabilities >= threshold).astype(int)
+
+    def alert_count(self, threshold: float) -> int:
+        """
+        Compte les transactions au-dessus du seuil.
+
+        Args:
+            threshold: Seuil de décision
+
+        Returns:
+            Nombre d'alertes
+        """
+        return len(self) - int(np.searchsorted(self.sorted_probabilities, threshold, side="left"))
+
 
 class FraudPredictor:
     """Prédicateur de fraude utilisant le pipeline ML."""
 
-    def __init__(self, pipeline, expected_columns: List[str], threshold: float = 0.5):
+    # En mode "auto", taille de lot maximale évaluée par le moteur compilé
+    # (au-delà, la boucle Cython de sklearn reste plus rapide)
+    auto_max_rows = 128
+
+    # Nombre maximal de lots en attente de scoring fantôme (au-delà, les
+    # nouveaux lots ne sont pas comparés plutôt que de ralentir le champion)
+    shadow_max_pending = 8
+
+    # Nombre minimal de lignes pour répartir un lot sur le pool de processus
+    # (en dessous, le scoring direct est plus rapide que l'envoi aux processus)
+    parallel_min_rows = 20000
+
+    def __init__(
+        self,
+        pipeline,
+        expected_columns: List[str],
+        threshold: float = 0.5,
+        engine: str = "sklearn",
+        risk_bands: Sequence[float] = DEFAULT_RISK_BANDS,
+        forest: Optional[CompiledForest] = None,
+    ):
         """
         Initialise le prédicateur.
 
@@ -17,10 +155,153 @@ class FraudPredictor:
             pipeline: Pipeline sklearn entraîné
             expected_columns: Liste des colonnes attendues
             threshold: Seuil de décision pour la classification
+            engine: Moteur d'inférence ("sklearn", "compiled" ou "auto")
+            risk_bands: Bornes croissantes des niveaux MODÉRÉ, ÉLEVÉ et CRITIQUE
+            forest: Forêt déjà compilée (ex: projetée en mémoire par
+                ArtifactLoader.load_compiled_forest), compilée depuis le
+                pipeline si absente; obligatoire si le pipeline n'a plus ses
+                arbres (ArtifactLoader, option forest_only), qui est alors
+                scoré uniquement avec elle
+
+        Raises:
+            ValueError: Si le moteur est inconnu ou incompatible avec le modèle,
+                ou si les bornes de risque sont invalides
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu: {engine}. Choix possibles: {', '.join(ENGINES)}")
+
+        # Pipeline sans arbres: tous les lots passent par la forêt compilée
+        self.forest_only = has_stripped_forest(pipeline)
+        if self.forest_only and (engine == "sklearn" or forest is None):
+            raise ValueError(
+                "Un pipeline sans arbres nécessite une forêt compilée (moteur compiled ou auto)."
+            )
+
+        bands = np.asarray(risk_bands, dtype=np.float64)
+        if bands.shape != (len(RISK_LABELS) - 1,) or np.any(np.diff(bands) <= 0):
+            raise ValueError(
+                f"risk_bands doit contenir {len(RISK_LABELS) - 1} bornes strictement croissantes."
+            )
+
         self.pipeline = pipeline
         self.expected_columns = expected_columns
         self.threshold = threshold
+        self.engine = engine
+        self.risk_bands = bands
+
+        # La forêt (et si possible le prétraitement) est compilée une seule fois, au chargement
+        self.forest = None
+        self.preprocessor = None
+        if engine != "sklearn":
+            self.forest = forest if forest is not None else CompiledForest.from_pipeline(pipeline)
+            self.preprocessor = AffinePreprocessor.from_pipeline(pipeline, expected_columns)
+
+        # Plan d'alignement des colonnes: position de chaque colonne attendue
+        self._column_index = {col: i for i, col in enumerate(expected_columns)}
+        self._plan_cache = (None, None)
+
+        # Tampons préalloués de predict_single (un jeu par thread)
+        self._local = threading.local()
+
+        # Scoring fantôme: challengers évalués hors du chemin critique
+        self.champion_name = "champion"
+        self.challengers: Dict[str, Dict] = {}
+        self.shadow_log: Optional[ShadowLog] = None
+        self.shadow_stats = {"batches": 0, "rows": 0, "dropped": 0, "errors": 0}
+        self._init_shadow_state()
+        self._init_pool_state()
+
+    def _init_shadow_state(self) -> None:
+        """Crée le verrou et la file (paresseuse) du scoring fantôme."""
+        self._shadow_lock = threading.Lock()
+        self._shadow_pool = None
+        self._shadow_pending = set()
+
+    def _init_pool_state(self) -> None:
+        """Crée l'état (paresseux) du pool de scoring parallèle."""
+        self._pool_lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._atexit_registered = False
+
+    def __getstate__(self) -> dict:
+        """Prépare le prédicateur pour la sérialisation (pool de processus)."""
+        state = self.__dict__.copy()
+        for key in (
+            "_local",
+            "_shadow_lock",
+            "_shadow_pool",
+            "_shadow_pending",
+            "_pool_lock",
+            "_pool",
+            "_pool_workers",
+            "_shm",
+            "_atexit_registered",
+        ):
+            del state[key]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restaure le prédicateur et recrée les tampons par thread."""
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._init_shadow_state()
+        self._init_pool_state()
+
+    def _column_plan(self, columns: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcule (et mémorise) le plan de copie des colonnes d'un DataFrame.
+
+        Args:
+            columns: Colonnes du DataFrame d'entrée
+
+        Returns:
+            Tuple (positions source, positions destination) des colonnes attendues
+        """
+        key = tuple(columns)
+        cached_key, plan = self._plan_cache
+        if cached_key == key:
+            return plan
+
+        src, dst = [], []
+        for src_pos, col in enumerate(key):
+            dst_pos = self._column_index.get(col)
+            if dst_pos is not None:
+                src.append(src_pos)
+                dst.append(dst_pos)
+        plan = (np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp))
+        self._plan_cache = (key, plan)
+        return plan
+
+    def to_matrix(self, data: pd.DataFrame, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Aligne les colonnes d'un DataFrame dans une matrice float préallouée.
+
+        Les colonnes manquantes et les valeurs manquantes valent 0.0, sans
+        DataFrame intermédiaire. La matrice est en ordre colonne (Fortran)
+        pour que chaque colonne soit copiée de façon contiguë.
+
+        Args:
+            data: DataFrame à aligner
+            out: Matrice de sortie optionnelle (n_rows, n_colonnes attendues)
+
+        Returns:
+            Matrice float64 dans l'ordre de expected_columns
+        """
+        shape = (len(data), len(self.expected_columns))
+        if out is None:
+            out = np.zeros(shape, dtype=np.float64, order="F")
+        else:
+            out = out[: shape[0]]
+            out.fill(0.0)
+
+        src, dst = self._column_plan(data.columns)
+        for src_pos, dst_pos in zip(src, dst):
+            out[:, dst_pos] = data.iloc[:, src_pos].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        np.copyto(out, 0.0, where=np.isnan(out))
+        return out
 
     def ensure_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -32,11 +313,9 @@ class FraudPredictor:
         Returns:
             DataFrame avec toutes les colonnes requises
         """
-        df = data.copy()
-        for col in self.expected_columns:
-            if col not in df.columns:
-                df[col] = 0.0
-        return df[self.expected_columns].fillna(0.0)
+        return pd.DataFrame(
+            self.to_matrix(data), columns=self.expected_columns, index=data.index, copy=False
+        )
 
     def predict_single(
         self, transaction: dict, threshold: float = None
@@ -51,10 +330,61 @@ class FraudPredictor:
         Returns:
             Tuple (probabilité, prédiction)
         """
-        df = pd.DataFrame([transaction])
-        df = self.ensure_columns(df)
-        proba, pred = self.predict(df, threshold)
-        return float(proba[0]), int(pred[0])
+        if self.preprocessor is None:
+            df = pd.DataFrame([transaction])
+            proba, pred = self.predict(df, threshold)
+            return float(proba[0]), int(pred[0])
+
+        # Chemin rapide: dictionnaire -> tampon NumPy, sans pandas
+        thr = self.threshold if threshold is None else threshold
+        row, features = self._row_buffers()
+        self._fill_rows(row, [transaction])
+
+        probabilities = self.forest.predict_proba(self.preprocessor.transform(row, out=features))
+        if self.challengers:
+            self._submit_shadow(row, features, probabilities)
+        proba = float(probabilities[0])
+        return proba, int(proba >= thr)
+
+    def predict_records(
+        self, records: List[dict], threshold: float = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prédit sur une liste de transactions (dictionnaires) en un seul appel.
+
+        Args:
+            records: Liste de dictionnaires de features
+            threshold: Seuil de décision (optionnel)
+
+        Returns:
+            Tuple (probabilités, prédictions)
+        """
+        thr = self.threshold if threshold is None else threshold
+        x = np.zeros((len(records), len(self.expected_columns)), dtype=np.float64)
+        self._fill_rows(x, records)
+        probabilities = self._predict_proba(x)
+        return probabilities, (probabilities >= thr).astype(int)
+
+    def _fill_rows(self, x: np.ndarray, records: List[dict]) -> None:
+        """Copie des dictionnaires de features dans une matrice alignée."""
+        x.fill(0.0)
+        for i, record in enumerate(records):
+            for col, value in record.items():
+                pos = self._column_index.get(col)
+                if pos is not None and value is not None:
+                    x[i, pos] = value
+        np.copyto(x, 0.0, where=np.isnan(x))
+
+    def _row_buffers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retourne les tampons (ligne brute, ligne transformée) du thread courant."""
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = (
+                np.zeros((1, len(self.expected_columns)), dtype=np.float64),
+                np.zeros((1, len(self.preprocessor.source)), dtype=np.float64),
+            )
+            self._local.buffers = buffers
+        return buffers
 
     def predict(
         self, data: pd.DataFrame, threshold: float = None
@@ -70,18 +400,214 @@ class FraudPredictor:
             Tuple (probabilités, prédictions)
         """
         thr = self.threshold if threshold is None else threshold
-        df = self.ensure_columns(data)
+        x = self.to_matrix(data)
 
         # Prédire les probabilités
-        probabilities = self.pipeline.predict_proba(df)[:, 1]
+        probabilities = self._predict_proba(x)
 
         # Appliquer le seuil
         predictions = (probabilities >= thr).astype(int)
 
         return probabilities, predictions
 
-    def predict_batch(
+    def _predict_proba(self, x: np.ndarray) -> np.ndarray:
+        """
+        Calcule les probabilités de fraude avec le moteur configuré.
+
+        Args:
+            x: Matrice alignée sur les colonnes attendues (voir to_matrix)
+
+        Returns:
+            Probabilités de la classe positive
+        """
+        use_compiled = (
+            self.forest_only
+            or self.engine == "compiled"
+            or (self.engine == "auto" and len(x) <= self.auto_max_rows)
+        )
+        if use_compiled and self.preprocessor is not None:
+            features = self.preprocessor.transform(x)
+        else:
+            # Vue DataFrame sans copie: le ColumnTransformer sélectionne par nom
+            df = pd.DataFrame(x, columns=self.expected_columns, copy=False)
+            if not use_compiled and not self.challengers:
+                return self.pipeline.predict_proba(df)[:, 1]
+            features = transform_features(self.pipeline, df)
+
+        if use_compiled:
+            probabilities = self.forest.predict_proba(features)
+        else:
+            probabilities = self.pipeline.steps[-1][1].predict_proba(features)[:, 1]
+
+        # Les features transformées du champion sont réutilisées par les challengers
+        if self.challengers:
+            self._submit_shadow(x, features, probabilities)
+        return probabilities
+
+    def add_challenger(self, name: str, pipeline, threshold: float = None) -> bool:
+        """
+        Ajoute un modèle challenger évalué en fantôme sur le même trafic.
+
+        Les scores du challenger ne sont jamais renvoyés à l'appelant: ils
+        sont calculés dans un thread dédié, après la réponse du champion, et
+        écrits dans shadow_log. Si son prétraitement est identique à celui du
+        champion, seul son modèle final est appliqué aux features déjà
+        transformées; sinon son pipeline complet est utilisé.
+
+        Args:
+            name: Nom du challenger (ex: nom de version du registre)
+            pipeline: Pipeline sklearn/imblearn entraîné du challenger
+            threshold: Seuil de décision du challenger (seuil du champion
+                par défaut)
+
+        Returns:
+            True si le prétraitement du champion est partagé
+        """
+        shared = shares_preprocessing(self.pipeline, pipeline, self.expected_columns)
+        self.challengers[name] = {
+            "pipeline": pipeline,
+            "model": pipeline.steps[-1][1],
+            "shared": shared,
+            "threshold": self.threshold if threshold is None else threshold,
+        }
+        return shared
+
+    def remove_challenger(self, name: str) -> None:
+        """
+        Retire un challenger (les lots déjà soumis sont tout de même journalisés).
+
+        Args:
+            name: Nom du challenger
+        """
+        self.challengers.pop(name, None)
+
+    def _submit_shadow(
+        self, x: np.ndarray, features: np.ndarray, probabilities: np.ndarray
+    ) -> None:
+        """Soumet un lot au thread de scoring fantôme (copie des tampons réutilisés)."""
+        challengers = dict(self.challengers)
+        with self._shadow_lock:
+            self._shadow_pending = {f for f in self._shadow_pending if not f.done()}
+            if len(self._shadow_pending) >= self.shadow_max_pending:
+                self.shadow_stats["dropped"] += 1
+                return
+            if self._shadow_pool is None:
+                self._shadow_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shadow")
+
+            needs_raw = any(not c["shared"] for c in challengers.values())
+            future = self._shadow_pool.submit(
+                self._score_shadow,
+                np.array(x, copy=True) if needs_raw else None,
+                np.array(features, copy=True),
+                np.array(probabilities, dtype=np.float64, copy=True),
+                challengers,
+            )
+            self._shadow_pending.add(future)
+
+    def _score_shadow(
+        self,
+        x: Optional[np.ndarray],
+        features: np.ndarray,
+        champion: np.ndarray,
+        challengers: Dict[str, Dict],
+    ) -> Dict:
+        """
+        Score un lot avec chaque challenger et journalise la comparaison.
+
+        Returns:
+            Enregistrement écrit dans le journal fantôme
+        """
+        record = {
+            "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+            "champion": self.champion_name,
+            "n_rows": len(champion),
+            "threshold": self.threshold,
+            "champion_proba": np.round(champion, 6).tolist(),
+            "challengers": {},
+        }
+        errors = 0
+        for name, challenger in challengers.items():
+            start = time.perf_counter()
+            try:
+                if challenger["shared"]:
+                    proba = challenger["model"].predict_proba(features)[:, 1]
+                else:
+                    df = pd.DataFrame(x, columns=self.expected_columns)
+                    proba = challenger["pipeline"].predict_proba(df)[:, 1]
+            except Exception as e:
+                errors += 1
+                record["challengers"][name] = {"error": str(e)[:200]}
+                continue
+
+            thr = challenger["threshold"]
+            record["challengers"][name] = {
+                "proba": np.round(proba, 6).tolist(),
+                "threshold": thr,
+                "agreement": float(np.mean((proba >= thr) == (champion >= self.threshold))),
+                "mean_abs_diff": float(np.mean(np.abs(proba - champion))),
+                "shared_preprocessing": challenger["shared"],
+                "ms": round((time.perf_counter() - start) * 1000, 3),
+            }
+
+        with self._shadow_lock:
+            self.shadow_stats["batches"] += 1
+            self.shadow_stats["rows"] += len(champion)
+            self.shadow_stats["errors"] += errors
+        if self.shadow_log is not None:
+            self.shadow_log.write(record)
+        return record
+
+    def wait_shadow(self, timeout: float = None) -> bool:
+        """
+        Attend la fin des scorings fantômes en cours (tests, fin de traitement).
+
+        Args:
+            timeout: Délai maximal en secondes (None: sans limite)
+
+        Returns:
+            True si plus aucun lot n'est en attente
+        """
+        with self._shadow_lock:
+            pending = set(self._shadow_pending)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def predict_iter(
         self, data: pd.DataFrame, chunk_size: int = 5000, threshold: float = None
+    ) -> Iterator[Tuple[int, int, np.ndarray, np.ndarray]]:
+        """
+        Prédit chunk par chunk, en rendant la main après chaque chunk.
+
+        La matrice d'entrée est allouée une seule fois et réutilisée pour
+        tous les chunks.
+
+        Args:
+            data: DataFrame contenant les transactions
+            chunk_size: Taille des chunks
+            threshold: Seuil de décision (optionnel)
+
+        Yields:
+            Tuple (début, fin, probabilités, prédictions) pour chaque chunk
+        """
+        thr = self.threshold if threshold is None else threshold
+        n_rows = len(data)
+        buffer = np.empty(
+            (min(chunk_size, n_rows), len(self.expected_columns)), dtype=np.float64, order="F"
+        )
+
+        for start in range(0, n_rows, chunk_size):
+            stop = min(start + chunk_size, n_rows)
+            x = self.to_matrix(data.iloc[start:stop], out=buffer)
+            probabilities = self._predict_proba(x)
+            yield start, stop, probabilities, (probabilities >= thr).astype(int)
+
+    def predict_batch(
+        self,
+        data: pd.DataFrame,
+        chunk_size: int = 5000,
+        threshold: float = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+        n_jobs: int = 1,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Prédit sur un grand ensemble de transactions par chunks.
@@ -90,25 +616,128 @@ class FraudPredictor:
             data: DataFrame contenant les transactions
             chunk_size: Taille des chunks pour le traitement par batch
             threshold: Seuil de décision (optionnel)
+            progress: Callback optionnel appelé après chaque chunk
+                avec (lignes traitées, total)
+            n_jobs: Nombre de processus (-1 pour tous les cœurs), utilisés à
+                partir de ``parallel_min_rows`` lignes
 
         Returns:
             Tuple (probabilités, prédictions)
         """
         n_rows = len(data)
+        n_workers = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs)
+
+        if n_workers > 1 and n_rows > chunk_size and n_rows >= self.parallel_min_rows:
+            return self._predict_batch_parallel(data, chunk_size, threshold, progress, n_workers)
+        all_proba = np.empty(n_rows, dtype=np.float64)
+        all_pred = np.empty(n_rows, dtype=int)
+
+        for start, stop, chunk_proba, chunk_pred in self.predict_iter(
+            data, chunk_size, threshold
+        ):
+            all_proba[start:stop] = chunk_proba
+            all_pred[start:stop] = chunk_pred
+            if progress is not None:
+                progress(stop, n_rows)
+
+        return all_proba, all_pred
+
+    def _predict_batch_parallel(
+        self,
+        data: pd.DataFrame,
+        chunk_size: int,
+        threshold: Optional[float],
+        progress: Optional[Callable[[int, int], None]],
+        n_workers: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Répartit les chunks sur un pool de processus.
+
+        La matrice d'entrée est écrite une seule fois en mémoire partagée; les
+        processus n'en reçoivent que le nom et les bornes de leur chunk. Les
+        résultats sont replacés à leur position, dans l'ordre d'entrée.
+        Le pool et le segment partagé sont créés au premier lot et réutilisés
+        par les suivants (voir close). Ces lots ne sont pas évalués par les
+        challengers.
+        """
+        thr = self.threshold if threshold is None else threshold
+        n_rows = len(data)
+        shape = (n_rows, len(self.expected_columns))
+        all_proba = np.empty(n_rows, dtype=np.float64)
+
+        # Un lot parallèle à la fois: le segment partagé est réutilisé
+        with self._pool_lock:
+            shm = self._shared_buffer(n_rows * shape[1] * 8)
+            matrix = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+            self.to_matrix(data, out=matrix)
+            del matrix
 
-        if n_rows <= chunk_size:
-            return self.predict(data, threshold)
+            pool = self._get_pool(n_workers)
+            try:
+                futures = [
+                    pool.submit(
+                        _score_shared_chunk, shm.name, shape, start, min(start + chunk_size, n_rows)
+                    )
+                    for start in range(0, n_rows, chunk_size)
+                ]
+                done = 0
+                for future in as_completed(futures):
+                    start, stop, chunk_proba = future.result()
+                    all_proba[start:stop] = chunk_proba
+                    done += stop - start
+                    if progress is not None:
+                        progress(done, n_rows)
+            except BrokenProcessPool:
+                # Processus perdu: le pool est recréé au prochain lot
+                self._shutdown_pool()
+                raise
 
-        all_proba = []
-        all_pred = []
+        return all_proba, (all_proba >= thr).astype(int)
 
-        for i in range(0, n_rows, chunk_size):
-            chunk = data.iloc[i : i + chunk_size]
-            chunk_proba, chunk_pred = self.predict(chunk, threshold)
-            all_proba.extend(chunk_proba)
-            all_pred.extend(chunk_pred)
+    def _get_pool(self, n_workers: int) -> ProcessPoolExecutor:
+        """Retourne le pool de processus (créé ou redimensionné si besoin)."""
+        if self._pool is not None and self._pool_workers != n_workers:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_worker,
+                initargs=(self.pipeline, self.expected_columns, self.engine, self.forest),
+            )
+            self._pool_workers = n_workers
+            if not self._atexit_registered:
+                atexit.register(_close_predictor, weakref.ref(self))
+                self._atexit_registered = True
+        return self._pool
 
-        return np.array(all_proba), np.array(all_pred)
+    def _shared_buffer(self, size: int) -> shared_memory.SharedMemory:
+        """Retourne le segment partagé, agrandi si le lot ne tient pas."""
+        if self._shm is not None and self._shm.size < size:
+            self._release_shared()
+        if self._shm is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        return self._shm
+
+    def _release_shared(self) -> None:
+        """Ferme et supprime le segment partagé."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def _shutdown_pool(self) -> None:
+        """Arrête le pool de processus."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._pool_workers = 0
+
+    def close(self) -> None:
+        """Arrête le pool de scoring parallèle et libère le segment partagé."""
+        with self._pool_lock:
+            self._shutdown_pool()
+            self._release_shared()
 
     def get_risk_level(self, probability: float) -> str:
         """
@@ -120,11 +749,27 @@ class FraudPredictor:
         Returns:
             Niveau de risque (FAIBLE, MODÉRÉ, ÉLEVÉ, CRITIQUE)
         """
-        if probability >= 0.8:
+        low, high, critical = self.risk_bands
+        if probability >= critical:
             return "CRITIQUE"
-        elif probability >= 0.5:
+        elif probability >= high:
             return "ÉLEVÉ"
-        elif probability >= 0.3:
+        elif probability >= low:
             return "MODÉRÉ"
         else:
             return "FAIBLE"
+
+    def get_risk_levels(self, probabilities: np.ndarray) -> pd.Categorical:
+        """
+        Détermine le niveau de risque de tout un lot en une seule recherche.
+
+        Args:
+            probabilities: Probabilités de fraude
+
+        Returns:
+            Catégorielle ordonnée (FAIBLE < MODÉRÉ < ÉLEVÉ < CRITIQUE)
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        codes = np.searchsorted(self.risk_bands, probabilities, side="right").astype(np.int8)
+        codes[np.isnan(probabilities)] = 0
+        return pd.Categorical.from_codes(codes, categories=list(RISK_LABELS), ordered=True)
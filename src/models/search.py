@@ -0,0 +1,255 @@
+"""Recherche d'hyperparamètres par divisions successives (successive halving)."""
+
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.metrics import average_precision_score
+
+# Grille par défaut: forêt et stratégie SMOTE
+DEFAULT_PARAM_GRID = {
+    "n_estimators": [100, 300, 500],
+    "max_depth": [None, 12, 24],
+    "max_features": ["sqrt", 0.3],
+    "smote_strategy": [0.1, 0.2, 0.5],
+}
+
+# Données et constructeur de pipeline chargés une seule fois dans chaque processus du pool
+_WORKER_STATE = None
+
+
+def _init_worker(
+    build_pipeline: Callable, X_train, y_train, X_valid, y_valid, resample_cache=None
+) -> None:
+    """Initialise un processus du pool de recherche."""
+    global _WORKER_STATE
+    _WORKER_STATE = (
+        build_pipeline,
+        X_train,
+        np.asarray(y_train),
+        X_valid,
+        np.asarray(y_valid),
+        resample_cache,
+    )
+
+
+def _evaluate(candidate_id: int, params: Dict, rows: np.ndarray) -> Tuple[int, Dict]:
+    """Entraîne un candidat sur les lignes ``rows`` et calcule sa PR-AUC de validation."""
+    build_pipeline, X_train, y_train, X_valid, y_valid, resample_cache = _WORKER_STATE
+    start = time.perf_counter()
+    result = {}
+    try:
+        pipeline = build_pipeline(**params)
+        if resample_cache is None:
+            pipeline.fit(X_train.iloc[rows], y_train[rows])
+        else:
+            hits = resample_cache.stats["hits"]
+            resample_cache.fit_pipeline(pipeline, X_train.iloc[rows], y_train[rows])
+            result["resample_cache_hit"] = resample_cache.stats["hits"] > hits
+    except ValueError as e:
+        # Configuration invalide (ex: stratégie SMOTE inférieure au ratio existant)
+        return candidate_id, {"pr_auc": None, "error": str(e)[:200]}
+    result["fit_seconds"] = time.perf_counter() - start
+    score = average_precision_score(y_valid, pipeline.predict_proba(X_valid)[:, 1])
+    return candidate_id, {"pr_auc": float(score), **result}
+
+
+def expand_grid(param_grid: Dict[str, List]) -> List[Dict]:
+    """
+    Énumère toutes les combinaisons d'une grille de paramètres.
+
+    Args:
+        param_grid: Dictionnaire {paramètre: valeurs possibles}
+
+    Returns:
+        Liste des combinaisons, dans l'ordre de la grille
+    """
+    names = list(param_grid)
+    return [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+
+
+class SuccessiveHalvingSearch:
+    """
+    Recherche d'hyperparamètres par divisions successives.
+
+    Tous les candidats sont d'abord entraînés sur un petit échantillon du
+    train set; seul le meilleur tiers (``factor`` = 3) passe au tour suivant,
+    entraîné sur trois fois plus de données, jusqu'au train set complet.
+    Les échantillons sont stratifiés: le taux de fraude, et donc l'effet de
+    la stratégie SMOTE, est le même à chaque tour. Les candidats d'un tour
+    sont évalués en parallèle (pool de processus, un thread par modèle) et
+    classés par PR-AUC sur le validation set; un candidat dont
+    l'entraînement échoue est classé dernier, avec son erreur dans la trace.
+    Avec un ``resample_cache``, les candidats d'un même tour qui partagent
+    la stratégie SMOTE réutilisent le même ré-échantillonnage.
+    """
+
+    def __init__(
+        self,
+        build_pipeline: Callable[..., object],
+        param_grid: Dict[str, List] = None,
+        factor: int = 3,
+        n_jobs: int = -1,
+        random_state: int = 42,
+        resample_cache=None,
+    ):
+        """
+        Initialise la recherche.
+
+        Args:
+            build_pipeline: Fonction (picklable) qui construit un pipeline
+                non entraîné à partir des paramètres d'un candidat, avec un
+                seul thread par modèle
+            param_grid: Grille {paramètre: valeurs} (DEFAULT_PARAM_GRID par défaut)
+            factor: Facteur de réduction du nombre de candidats par tour
+            n_jobs: Nombre de processus (-1 pour tous les cœurs)
+            random_state: Graine des échantillons de chaque tour
+            resample_cache: ResampleCache optionnel partagé par les processus
+
+        Raises:
+            ValueError: Si factor < 2 ou si la grille est vide
+        """
+        if factor < 2:
+            raise ValueError("factor doit être supérieur ou égal à 2.")
+        self.build_pipeline = build_pipeline
+        self.param_grid = param_grid or DEFAULT_PARAM_GRID
+        self.candidates = expand_grid(self.param_grid)
+        if not self.candidates:
+            raise ValueError("La grille de paramètres est vide.")
+        self.factor = factor
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.resample_cache = resample_cache
+        self.rounds: List[Dict] = []
+        self.best_params: Optional[Dict] = None
+        self.best_score: Optional[float] = None
+        self.elapsed_seconds: Optional[float] = None
+
+    @property
+    def n_rounds(self) -> int:
+        """Nombre de tours: le dernier départage au plus ``factor`` candidats sur tout le train set."""
+        return max(1, math.ceil(math.log(len(self.candidates), self.factor) - 1e-9))
+
+    @staticmethod
+    def _round_rows(y_train: np.ndarray, fraction: float, rng) -> np.ndarray:
+        """Échantillon stratifié (même fraction de chaque classe) du train set."""
+        rows = []
+        for label in np.unique(y_train):
+            indices = np.flatnonzero(y_train == label)
+            size = max(1, int(round(len(indices) * fraction)))
+            if size < len(indices):
+                indices = rng.choice(indices, size=size, replace=False)
+            rows.append(indices)
+        return np.sort(np.concatenate(rows))
+
+    def fit(
+        self,
+        X_train,
+        y_train,
+        X_valid,
+        y_valid,
+        progress: Optional[Callable[[Dict], None]] = None,
+    ) -> Dict:
+        """
+        Lance la recherche.
+
+        Args:
+            X_train: Features d'entraînement (DataFrame)
+            y_train: Cible d'entraînement
+            X_valid: Features de validation
+            y_valid: Cible de validation
+            progress: Callback optionnel appelé à la fin de chaque tour avec
+                l'entrée correspondante de ``rounds``
+
+        Returns:
+            Paramètres du meilleur candidat
+
+        Raises:
+            RuntimeError: Si aucun candidat n'a pu être entraîné
+        """
+        start = time.perf_counter()
+        y_array = np.asarray(y_train)
+        rng = np.random.default_rng(self.random_state)
+        n_workers = (os.cpu_count() or 1) if self.n_jobs == -1 else max(1, self.n_jobs)
+        n_rounds = self.n_rounds
+
+        alive = list(range(len(self.candidates)))
+        self.rounds = []
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(
+                self.build_pipeline,
+                X_train,
+                y_array,
+                X_valid,
+                y_valid,
+                self.resample_cache,
+            ),
+        ) as pool:
+            for round_index in range(n_rounds):
+                fraction = float(self.factor ** (round_index - n_rounds + 1))
+                rows = self._round_rows(y_array, fraction, rng)
+
+                round_start = time.perf_counter()
+                futures = [
+                    pool.submit(_evaluate, cid, self.candidates[cid], rows) for cid in alive
+                ]
+                results = {}
+                for future in as_completed(futures):
+                    cid, result = future.result()
+                    results[cid] = result
+
+                # Classement stable: à score égal, l'ordre de la grille départage
+                ranked = sorted(
+                    alive,
+                    key=lambda cid: -results[cid]["pr_auc"]
+                    if results[cid]["pr_auc"] is not None
+                    else np.inf,
+                )
+                entry = {
+                    "round": round_index + 1,
+                    "fraction": fraction,
+                    "n_rows": int(len(rows)),
+                    "n_candidates": len(alive),
+                    "seconds": time.perf_counter() - round_start,
+                    "results": [
+                        {"params": self.candidates[cid], **results[cid]} for cid in ranked
+                    ],
+                }
+                self.rounds.append(entry)
+                if progress is not None:
+                    progress(entry)
+
+                alive = ranked[: max(1, math.ceil(len(ranked) / self.factor))]
+
+        best = self.rounds[-1]["results"][0]
+        if best["pr_auc"] is None:
+            raise RuntimeError(f"Aucun candidat n'a pu être entraîné: {best['error']}")
+        self.best_params = dict(best["params"])
+        self.best_score = best["pr_auc"]
+        self.elapsed_seconds = time.perf_counter() - start
+        return self.best_params
+
+    def to_dict(self) -> Dict:
+        """
+        Résume la recherche (trace complète) pour metrics_valid.json.
+
+        Returns:
+            Dictionnaire sérialisable en JSON
+        """
+        return {
+            "strategy": "successive_halving",
+            "scoring": "pr_auc_valid",
+            "factor": self.factor,
+            "param_grid": self.param_grid,
+            "n_candidates": len(self.candidates),
+            "best_params": self.best_params,
+            "best_score": self.best_score,
+            "elapsed_seconds": self.elapsed_seconds,
+            "rounds": self.rounds,
+        }
@@ -0,0 +1,85 @@
+"""Scoring fantôme (challengers) et journal de comparaison hors ligne."""
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .forest import transform_features
+
+
+def shares_preprocessing(pipeline, other, columns: List[str], n_probe: int = 64) -> bool:
+    """
+    Vérifie que deux pipelines produisent les mêmes features transformées.
+
+    Les deux prétraitements sont appliqués à des lignes de test (valeurs
+    aléatoires, zéros et grandes valeurs) et comparés à tolérance numérique.
+
+    Args:
+        pipeline: Pipeline de référence (champion)
+        other: Pipeline à comparer (challenger)
+        columns: Colonnes d'entrée attendues
+        n_probe: Nombre de lignes aléatoires testées
+
+    Returns:
+        True si le prétraitement du champion peut être réutilisé tel quel
+    """
+    rng = np.random.default_rng(0)
+    probe = np.vstack(
+        [
+            rng.normal(scale=100.0, size=(n_probe, len(columns))),
+            np.zeros((1, len(columns))),
+            np.full((1, len(columns)), 1e5),
+        ]
+    )
+    df = pd.DataFrame(probe, columns=columns)
+    try:
+        reference = transform_features(pipeline, df)
+        candidate = transform_features(other, df)
+    except Exception:
+        return False
+    return reference.shape == candidate.shape and np.allclose(
+        reference, candidate, rtol=1e-12, atol=1e-12
+    )
+
+
+class ShadowLog:
+    """Journal JSON Lines des scores champion/challengers (un lot par ligne)."""
+
+    def __init__(self, path: Path):
+        """
+        Initialise le journal.
+
+        Args:
+            path: Fichier .jsonl (créé avec son dossier si besoin)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict) -> None:
+        """
+        Ajoute un enregistrement au journal.
+
+        Args:
+            record: Dictionnaire sérialisable en JSON
+        """
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def read(self) -> List[Dict]:
+        """
+        Relit tous les enregistrements (analyse hors ligne).
+
+        Returns:
+            Liste des enregistrements, dans l'ordre d'écriture
+        """
+        if not self.path.exists():
+            return []
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
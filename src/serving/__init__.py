@@ -0,0 +1,21 @@
+"""Module de service de scoring (importé à la première utilisation)."""
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import ScoringClient
+    from .reloader import ModelReloader, ModelVersion
+    from .server import MicroBatcher, ScoringServer
+
+_EXPORTS = {
+    "MicroBatcher": ".server",
+    "ScoringServer": ".server",
+    "ModelReloader": ".reloader",
+    "ModelVersion": ".reloader",
+    "ScoringClient": ".client",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
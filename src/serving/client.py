@@ -0,0 +1,124 @@
+"""Client du démon de scoring (socket Unix), sans dépendance lourde."""
+
+import getpass
+import json
+import socket
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Socket par défaut du démon (une par utilisateur)
+DEFAULT_SOCKET = Path(tempfile.gettempdir()) / f"fraud-scoring-{getpass.getuser()}.sock"
+
+
+class ScoringClient:
+    """
+    Client HTTP/1.1 minimal vers un ScoringServer en mode démon.
+
+    N'importe que la bibliothèque standard: un appel en mode client ne paie
+    ni le chargement du modèle ni l'import de pandas/sklearn côté démon.
+    """
+
+    def __init__(self, socket_path: Path = DEFAULT_SOCKET, timeout: float = 5.0):
+        """
+        Initialise le client.
+
+        Args:
+            socket_path: Chemin de la socket Unix du démon
+            timeout: Délai maximal (s) de connexion et de réponse
+        """
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, payload: Optional[Dict] = None) -> Tuple[int, Dict]:
+        """
+        Envoie une requête et lit la réponse complète.
+
+        Returns:
+            Tuple (code HTTP, corps JSON)
+
+        Raises:
+            OSError: Si le démon est injoignable (socket absente, refus, délai)
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            "Host: localhost\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        )
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(str(self.socket_path))
+            sock.sendall(head.encode("latin-1") + body)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+
+        raw_head, _, raw_body = b"".join(chunks).partition(b"\r\n\r\n")
+        try:
+            status = int(raw_head.split(b" ", 2)[1])
+            return status, json.loads(raw_body or b"{}")
+        except (IndexError, ValueError) as e:
+            raise ConnectionError(f"Réponse invalide du démon: {e}") from e
+
+    def health(self) -> Dict:
+        """
+        Interroge l'état du démon.
+
+        Returns:
+            Réponse de /health (dossier du modèle servi, statistiques)
+
+        Raises:
+            OSError: Si le démon est injoignable
+        """
+        return self._request("GET", "/health")[1]
+
+    def serves(self, model_dir: Path, options: Optional[Dict] = None) -> bool:
+        """
+        Vérifie qu'un démon joignable sert bien le modèle demandé.
+
+        Args:
+            model_dir: Dossier du modèle attendu
+            options: Options de chargement exigées (ex: {"engine": "compiled"}),
+                comparées aux métadonnées publiées par le démon dans /health
+
+        Returns:
+            False si aucun démon ne répond, s'il sert un autre modèle ou avec
+            d'autres options
+        """
+        if not self.socket_path.exists():
+            return False
+        try:
+            health = self.health()
+        except OSError:
+            return False
+        served = health.get("model_dir")
+        if served is None or Path(served) != Path(model_dir).resolve():
+            return False
+        return all(health.get(name) == value for name, value in (options or {}).items())
+
+    def predict(self, transaction: Dict) -> Dict:
+        """
+        Score une transaction avec le modèle chargé par le démon.
+
+        Args:
+            transaction: Dictionnaire contenant les features de la transaction
+
+        Returns:
+            Dictionnaire {fraud_proba, fraud_pred, risk_level}
+
+        Raises:
+            OSError: Si le démon est injoignable
+            ValueError: Si le démon rejette la transaction
+        """
+        status, payload = self._request("POST", "/predict", transaction)
+        if status != 200:
+            raise ValueError(payload.get("error", f"Erreur HTTP {status}"))
+        return payload
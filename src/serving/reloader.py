@@ -0,0 +1,199 @@
+"""Rechargement à chaud des artefacts du modèle, avec bascule atomique."""
+
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..data.loader import ArtifactLoader
+from ..models.predictor import FraudPredictor
+
+
+class ModelVersion:
+    """Version chargée du modèle: artefacts, prédicateur prêt et empreinte."""
+
+    def __init__(
+        self,
+        pipeline,
+        metrics: Dict,
+        columns: Dict,
+        warnings: List[str],
+        predictor: FraudPredictor,
+        fingerprint: Dict[str, Optional[str]],
+        load_info: Dict,
+    ):
+        """
+        Initialise la version.
+
+        Args:
+            pipeline: Pipeline chargé
+            metrics: Métriques de validation
+            columns: Métadonnées des colonnes
+            warnings: Warnings du chargement
+            predictor: Prédicateur construit et préchauffé
+            fingerprint: Empreinte des artefacts chargés
+            load_info: Mesures du chargement (voir ArtifactLoader.load_info)
+        """
+        self.pipeline = pipeline
+        self.metrics = metrics
+        self.columns = columns
+        self.warnings = warnings
+        self.predictor = predictor
+        self.fingerprint = fingerprint
+        self.load_info = load_info
+        self.loaded_at = datetime.now()
+
+    @property
+    def version_id(self) -> str:
+        """Identifiant court de la version (empreinte combinée des artefacts)."""
+        digest = hashlib.sha256()
+        for name in sorted(self.fingerprint):
+            digest.update(f"{name}={self.fingerprint[name]};".encode("utf-8"))
+        return digest.hexdigest()[:12]
+
+
+class ModelReloader:
+    """
+    Surveille les artefacts d'un modèle et recharge les nouvelles versions.
+
+    Un changement est pris en compte quand la même nouvelle empreinte est
+    observée deux fois de suite (fichiers en cours de copie ignorés). La
+    nouvelle version est chargée et préchauffée à côté de l'ancienne, puis
+    ``current`` est remplacé en une seule affectation: les prédictions en
+    cours terminent avec l'ancienne version, les suivantes utilisent la
+    nouvelle. Un échec de chargement conserve la version en service.
+    """
+
+    def __init__(
+        self,
+        model_dir: Path,
+        engine: str = "auto",
+        threshold: Optional[float] = None,
+        mmap_mode: Optional[str] = None,
+        interval: float = 5.0,
+        on_swap: Optional[Callable[[ModelVersion], None]] = None,
+        warmup_sizes: Sequence[int] = (),
+        forest_only: bool = False,
+        compact: bool = False,
+    ):
+        """
+        Charge la version initiale.
+
+        Args:
+            model_dir: Dossier des artefacts du modèle
+            engine: Moteur d'inférence du prédicateur
+            threshold: Seuil imposé (celui des métriques de chaque version sinon)
+            mmap_mode: Mode de projection en mémoire (voir ArtifactLoader)
+            interval: Intervalle de vérification en secondes
+            on_swap: Fonction appelée avec chaque nouvelle version en service
+            warmup_sizes: Tailles des lots du préchauffage mesuré de chaque
+                version (voir ArtifactLoader.warmup, désactivé par défaut)
+            forest_only: Avec mmap_mode, scorer uniquement avec la forêt
+                projetée, sans charger les arbres du pipeline (voir ArtifactLoader)
+            compact: Scorer avec la forêt compacte (voir ArtifactLoader)
+
+        Raises:
+            FileNotFoundError: Si le pipeline initial est manquant
+        """
+        self.loader = ArtifactLoader(
+            model_dir,
+            mmap_mode=mmap_mode,
+            warmup_sizes=warmup_sizes,
+            forest_only=forest_only,
+            compact=compact,
+        )
+        self.engine = engine
+        self.threshold = threshold
+        self.interval = interval
+        self.on_swap = on_swap
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+        self._pending: Optional[Dict[str, Optional[str]]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.current = self._load(self.loader.fingerprint())
+
+    def _load(self, fingerprint: Dict[str, Optional[str]]) -> ModelVersion:
+        """Charge et préchauffe une version complète, sans toucher à celle en service."""
+        pipeline, metrics, columns, warnings = self.loader.load_artifacts()
+        forest = self.loader.load_compiled_forest(pipeline) if self.engine != "sklearn" else None
+        threshold = self.threshold if self.threshold is not None else metrics.get("threshold", 0.5)
+        predictor = FraudPredictor(
+            pipeline, columns["all_cols"], threshold, engine=self.engine, forest=forest
+        )
+
+        # Préchauffage: premier appel de chaque chemin avant la mise en service
+        warm_rows = pd.DataFrame(
+            np.zeros((predictor.auto_max_rows + 1, len(columns["all_cols"]))),
+            columns=columns["all_cols"],
+        )
+        predictor.predict(warm_rows.iloc[:1])
+        predictor.predict(warm_rows)
+        warnings = warnings + self.loader.warmup(predictor, metrics)
+
+        return ModelVersion(
+            pipeline, metrics, columns, warnings, predictor, fingerprint, dict(self.loader.load_info)
+        )
+
+    def check_for_update(self) -> bool:
+        """
+        Vérifie les artefacts et bascule vers une nouvelle version si besoin.
+
+        Returns:
+            True si une nouvelle version a été mise en service
+        """
+        with self._lock:
+            fingerprint = self.loader.fingerprint()
+            if fingerprint == self.current.fingerprint:
+                self._pending = None
+                return False
+
+            # Attendre que les fichiers soient stables (copie terminée)
+            if fingerprint != self._pending:
+                self._pending = fingerprint
+                return False
+
+            try:
+                version = self._load(fingerprint)
+            except Exception as e:
+                self.last_error = f"Rechargement impossible: {str(e)[:200]}"
+                return False
+
+            self._pending = None
+            self.last_error = None
+            previous, self.current = self.current, version
+            self.reloads += 1
+
+        # Pool de scoring de l'ancienne version: arrêté après le lot en cours
+        previous.predictor.close()
+        if self.on_swap is not None:
+            self.on_swap(version)
+        return True
+
+    def start(self) -> None:
+        """Démarre la surveillance dans un thread en arrière-plan."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="model-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Arrête la surveillance."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self) -> None:
+        """Boucle de surveillance."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check_for_update()
+            except Exception as e:
+                self.last_error = f"Surveillance des artefacts: {str(e)[:200]}"
@@ -0,0 +1,362 @@
+"""Service HTTP local de scoring avec regroupement en micro-lots."""
+
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..models.predictor import FraudPredictor
+from ..utils.validation import DataValidator
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+class MicroBatcher:
+    """
+    Regroupe les requêtes unitaires concurrentes en micro-lots.
+
+    Un lot est fermé dès qu'il atteint ``max_batch_size`` transactions ou que
+    ``max_wait_ms`` s'est écoulé depuis la première transaction du lot. Chaque
+    lot est évalué par un seul appel vectorisé au prédicateur, dans un thread
+    séparé pour ne pas bloquer la boucle asyncio.
+    """
+
+    def __init__(
+        self,
+        predictor: FraudPredictor,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ):
+        """
+        Initialise le regroupeur.
+
+        Args:
+            predictor: Prédicateur utilisé pour chaque lot
+            max_batch_size: Taille maximale d'un lot
+            max_wait_ms: Attente maximale (ms) avant de fermer un lot
+        """
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.stats = {"requests": 0, "batches": 0, "max_batch": 0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Démarre la tâche de traitement des lots."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Arrête la tâche de traitement des lots."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, transaction: dict) -> Tuple[float, int]:
+        """
+        Soumet une transaction et attend son résultat.
+
+        Args:
+            transaction: Dictionnaire contenant les features de la transaction
+
+        Returns:
+            Tuple (probabilité, prédiction)
+        """
+        proba, pred, _ = await self.score(transaction)
+        return proba, pred
+
+    async def score(self, transaction: dict) -> Tuple[float, int, str]:
+        """
+        Soumet une transaction et attend son résultat complet.
+
+        Le niveau de risque est calculé dans le lot, par le prédicateur qui a
+        évalué la transaction: une bascule en cours de lot ne mélange pas
+        deux modèles dans une même réponse.
+
+        Args:
+            transaction: Dictionnaire contenant les features de la transaction
+
+        Returns:
+            Tuple (probabilité, prédiction, niveau de risque)
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((transaction, future))
+        return await future
+
+    async def _collect(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        """
+        Attend une première transaction puis complète le lot.
+
+        Le lot est rempli en place: si la collecte échoue, la boucle
+        principale connaît encore les transactions déjà retirées de la file.
+        """
+        loop = asyncio.get_running_loop()
+        batch.append(await self._queue.get())
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def _run(self) -> None:
+        """Boucle principale: un lot après l'autre, sans laisser de requête en attente."""
+        while True:
+            batch: List[Tuple[dict, asyncio.Future]] = []
+            try:
+                await self._collect(batch)
+                await self._process(batch)
+            except asyncio.CancelledError:
+                # Arrêt du regroupeur: les requêtes en attente sont annulées
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                # Erreur inattendue: le lot échoue, le service continue
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _process(self, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        """Évalue un lot par un appel vectorisé, puis répartit les résultats."""
+        loop = asyncio.get_running_loop()
+        records = [transaction for transaction, _ in batch]
+
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += 1
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+
+        # Prédicateur lu une fois par lot: une bascule n'affecte que les lots suivants
+        predictor = self.predictor
+        try:
+            results = await loop.run_in_executor(None, self._score_batch, predictor, records)
+        except Exception:
+            # Une transaction invalide ne doit pas faire échouer tout le lot
+            results = await loop.run_in_executor(None, self._score_each, predictor, records)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _score_batch(predictor: FraudPredictor, records: List[dict]) -> List:
+        """Évalue le lot en un appel (probabilité, prédiction, niveau de risque)."""
+        probas, preds = predictor.predict_records(records)
+        levels = predictor.get_risk_levels(probas)
+        return [
+            (float(proba), int(pred), str(level))
+            for proba, pred, level in zip(probas, preds, levels)
+        ]
+
+    @staticmethod
+    def _score_each(predictor: FraudPredictor, records: List[dict]) -> List:
+        """Évalue les transactions une par une (résultat ou exception pour chacune)."""
+        results = []
+        for record in records:
+            try:
+                probas, preds = predictor.predict_records([record])
+                proba = float(probas[0])
+                results.append((proba, int(preds[0]), predictor.get_risk_level(proba)))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class ScoringServer:
+    """
+    Serveur HTTP minimal (asyncio) exposant un FraudPredictor.
+
+    Écoute en TCP (host/port) ou, en mode démon, sur une socket Unix
+    (``unix_socket``) réservée aux processus locaux de l'utilisateur.
+
+    Routes:
+        GET  /health  -> état du service et statistiques de regroupement
+        POST /predict -> JSON d'une transaction, renvoie probabilité,
+                         prédiction et niveau de risque
+    """
+
+    def __init__(
+        self,
+        predictor: FraudPredictor,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        unix_socket: Optional[Path] = None,
+        metadata: Optional[Dict] = None,
+    ):
+        """
+        Initialise le serveur.
+
+        Args:
+            predictor: Prédicateur à exposer
+            host: Adresse d'écoute
+            port: Port d'écoute (0 pour un port libre)
+            max_batch_size: Taille maximale d'un micro-lot
+            max_wait_ms: Attente maximale (ms) avant de fermer un micro-lot
+            unix_socket: Chemin d'une socket Unix (remplace host/port)
+            metadata: Informations ajoutées à la réponse de /health
+                (ex: dossier du modèle servi)
+        """
+        self.predictor = predictor
+        self.host = host
+        self.port = port
+        self.unix_socket = Path(unix_socket) if unix_socket is not None else None
+        self.metadata = dict(metadata or {})
+        self.batcher = MicroBatcher(predictor, max_batch_size, max_wait_ms)
+        self.validator = DataValidator(predictor.expected_columns)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def set_predictor(self, predictor: FraudPredictor) -> None:
+        """
+        Met un nouveau prédicateur en service (rechargement à chaud).
+
+        Les lots déjà partis terminent avec l'ancien prédicateur; les
+        suivants utilisent le nouveau.
+
+        Args:
+            predictor: Nouveau prédicateur, déjà préchauffé
+        """
+        self.validator = DataValidator(predictor.expected_columns)
+        self.predictor = predictor
+        self.batcher.predictor = predictor
+
+    async def start(self) -> None:
+        """
+        Démarre l'écoute et le regroupeur.
+
+        Raises:
+            OSError: Si la socket Unix est déjà utilisée par un autre démon
+        """
+        await self.batcher.start()
+        if self.unix_socket is None:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+            return
+
+        self._remove_stale_socket()
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.unix_socket))
+        # Socket réservée à l'utilisateur courant
+        os.chmod(self.unix_socket, 0o600)
+
+    def _remove_stale_socket(self) -> None:
+        """Supprime le fichier d'une socket Unix laissée par un démon arrêté."""
+        if not self.unix_socket.exists():
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.unix_socket))
+        except OSError:
+            self.unix_socket.unlink()
+        else:
+            raise OSError(f"Un démon écoute déjà sur {self.unix_socket}")
+        finally:
+            probe.close()
+
+    async def stop(self) -> None:
+        """Arrête l'écoute et le regroupeur."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self.unix_socket is not None and self.unix_socket.exists():
+                self.unix_socket.unlink()
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        """Démarre le serveur et le laisse tourner jusqu'à interruption."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Traite les requêtes d'une connexion (keep-alive HTTP/1.1)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._route(method, path, body)
+                self._write_response(writer, status, payload)
+                await writer.drain()
+
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        """Dispatche une requête vers la route correspondante."""
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok", **self.metadata, **self.batcher.stats}
+
+        if method != "POST" or path != "/predict":
+            return 404, {"error": f"Route inconnue: {method} {path}"}
+
+        try:
+            transaction = json.loads(body or b"{}")
+        except json.JSONDecodeError as e:
+            return 400, {"error": f"JSON invalide: {e}"}
+        if not isinstance(transaction, dict):
+            return 400, {"error": "Le corps doit être un objet JSON (une transaction)."}
+
+        is_valid, errors = self.validator.validate_transaction(transaction)
+        if not is_valid:
+            return 400, {"error": " ".join(errors)}
+
+        try:
+            proba, pred, risk_level = await self.batcher.score(transaction)
+        except Exception as e:
+            return 500, {"error": str(e)[:200]}
+
+        return 200, {"fraud_proba": proba, "fraud_pred": pred, "risk_level": risk_level}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict) -> None:
+        """Écrit une réponse HTTP JSON."""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
@@ -1,5 +1,13 @@
-"""Modules utilitaires."""
+"""Modules utilitaires (importés à la première utilisation)."""
 
-from .validation import DataValidator
+from typing import TYPE_CHECKING
 
-__all__ = ["DataValidator"]
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .validation import DataValidator
+
+_EXPORTS = {"DataValidator": ".validation"}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
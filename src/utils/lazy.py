@@ -0,0 +1,37 @@
+"""Exports paresseux des packages (PEP 562)."""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Crée les fonctions ``__getattr__`` et ``__dir__`` d'un package.
+
+    Chaque nom exporté n'est importé depuis son sous-module qu'au premier
+    accès (``from src.models import FraudPredictor``). Importer un module
+    précis (``src.models.predictor``) ne charge donc pas les dépendances
+    lourdes des autres modules du package (shap, plotly...).
+
+    Args:
+        package: Nom du package (``__name__`` dans son __init__)
+        exports: Dictionnaire {nom exporté: sous-module relatif, ex: ".predictor"}
+
+    Returns:
+        Tuple (__getattr__, __dir__) à affecter dans le __init__ du package
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Mémorisé dans le package: les accès suivants ne passent plus par ici
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
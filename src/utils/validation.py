@@ -91,6 +91,17 @@ class DataValidator:
         elif not isinstance(transaction["Time"], (int, float)):
             errors.append("Le champ 'Time' doit être numérique.")
 
+        # Autres features attendues: absentes ou nulles autorisées (remplacées par 0)
+        non_numeric = [
+            col
+            for col in self.expected_columns
+            if col not in ("Amount", "Time")
+            and transaction.get(col) is not None
+            and not isinstance(transaction[col], (int, float))
+        ]
+        if non_numeric:
+            errors.append(f"Features non numériques: {', '.join(non_numeric)}")
+
         return len(errors) == 0, errors
 
     def sanitize_dataframe(self, data: pd.DataFrame) -> pd.DataFrame:
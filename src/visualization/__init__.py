@@ -1,5 +1,13 @@
-"""Module de visualisation."""
+"""Module de visualisation (plotly importé à la première utilisation)."""
 
-from .plots import FraudVisualizer
+from typing import TYPE_CHECKING
 
-__all__ = ["FraudVisualizer"]
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .plots import FraudVisualizer
+
+_EXPORTS = {"FraudVisualizer": ".plots"}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -168,6 +168,46 @@ class FraudVisualizer:
 
         return fig
 
+    @staticmethod
+    def create_global_importance(importance: Dict[str, float], top_n: int = 10) -> go.Figure:
+        """
+        Crée un graphique en barres de l'importance globale (moyenne des |SHAP|).
+
+        Args:
+            importance: Dictionnaire {feature: importance}
+            top_n: Nombre de features affichées
+
+        Returns:
+            Figure Plotly
+        """
+        top = sorted(importance.items(), key=lambda item: item[1], reverse=True)[:top_n]
+        # Feature la plus importante en haut
+        feature_names = [name for name, _ in reversed(top)]
+        values = [value for _, value in reversed(top)]
+
+        fig = go.Figure()
+
+        fig.add_trace(
+            go.Bar(
+                y=feature_names,
+                x=values,
+                orientation="h",
+                marker=dict(color=FraudVisualizer.COLOR_PRIMARY),
+                hovertemplate="<b>%{y}</b><br>Moyenne |SHAP|: %{x:.4e}<extra></extra>",
+            )
+        )
+
+        fig.update_layout(
+            title="Importance globale (moyenne des |SHAP|)",
+            xaxis_title="Impact moyen sur la prédiction",
+            height=max(300, 30 * len(top)),
+            paper_bgcolor="white",
+            plot_bgcolor=FraudVisualizer.COLOR_BG,
+            font=dict(color=FraudVisualizer.COLOR_TEXT),
+        )
+
+        return fig
+
     @staticmethod
     def create_histogram(probabilities, threshold: float) -> go.Figure:
         """
@@ -0,0 +1,91 @@
+"""Tests pour le cache des ré-échantillonnages SMOTE."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from src.data.cache import ResampleCache
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+
+@pytest.fixture
+def training_data():
+    """Crée des données fictives déséquilibrées."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(400, 30)), columns=COLUMNS)
+    y = pd.Series((X["V1"] + rng.normal(scale=0.5, size=400) > 1.2).astype(int))
+    return X, y
+
+
+def make_pipeline(smote_strategy=0.5):
+    """Crée un pipeline identique à celui de l'entraînement (version réduite)."""
+    preprocessor = ColumnTransformer(
+        transformers=[("scale_amt_time", StandardScaler(), ["Amount", "Time"])],
+        remainder="passthrough",
+    )
+    return ImbPipeline(
+        steps=[
+            ("prep", preprocessor),
+            ("smote", SMOTE(sampling_strategy=smote_strategy, random_state=42, k_neighbors=5)),
+            ("model", RandomForestClassifier(n_estimators=20, random_state=42)),
+        ]
+    )
+
+
+def test_fit_pipeline_matches_pipeline_fit(training_data, tmp_path):
+    """Test que l'entraînement via le cache donne le même modèle, avec ou sans hit."""
+    X, y = training_data
+    reference = make_pipeline().fit(X, y).predict_proba(X)
+    cache = ResampleCache(tmp_path)
+
+    first = cache.fit_pipeline(make_pipeline(), X, y)
+    second = cache.fit_pipeline(make_pipeline(), X, y)
+
+    assert cache.stats == {"hits": 1, "misses": 1}
+    np.testing.assert_array_equal(first.predict_proba(X), reference)
+    np.testing.assert_array_equal(second.predict_proba(X), reference)
+
+
+def test_key_depends_on_data_and_sampler_params(training_data, tmp_path):
+    """Test que la clé change avec les données et les paramètres SMOTE."""
+    X, y = training_data
+    cache = ResampleCache(tmp_path)
+    base = cache.key(SMOTE(sampling_strategy=0.5, random_state=42), X, y)
+
+    assert base == cache.key(SMOTE(sampling_strategy=0.5, random_state=42), X, y)
+    assert base != cache.key(SMOTE(sampling_strategy=0.3, random_state=42), X, y)
+    assert base != cache.key(SMOTE(sampling_strategy=0.5, random_state=0), X, y)
+    assert base != cache.key(SMOTE(sampling_strategy=0.5, random_state=42, k_neighbors=3), X, y)
+    assert base != cache.key(SMOTE(sampling_strategy=0.5, random_state=42), X.iloc[1:], y.iloc[1:])
+
+
+def test_corrupted_entry_is_recomputed(training_data, tmp_path):
+    """Test qu'une entrée illisible est recalculée au lieu de faire échouer l'entraînement."""
+    X, y = training_data
+    cache = ResampleCache(tmp_path)
+    sampler = SMOTE(sampling_strategy=0.5, random_state=42)
+    cache.path(cache.key(sampler, X, y)).parent.mkdir(parents=True, exist_ok=True)
+    cache.path(cache.key(sampler, X, y)).write_bytes(b"corrompu")
+
+    X_res, y_res = cache.fit_resample(sampler, X, y)
+
+    assert cache.stats["misses"] == 1
+    assert len(X_res) == len(y_res) > len(X)
+
+
+def test_prune_keeps_cache_under_budget(training_data, tmp_path):
+    """Test l'éviction des entrées les plus anciennes au-delà de la taille maximale."""
+    X, y = training_data
+    cache = ResampleCache(tmp_path, max_size_mb=1e-6)
+
+    for strategy in (0.3, 0.4, 0.5):
+        cache.fit_resample(SMOTE(sampling_strategy=strategy, random_state=42), X, y)
+
+    entries = list(tmp_path.glob("*.npz"))
+    assert entries == [cache.path(cache.key(SMOTE(sampling_strategy=0.5, random_state=42), X, y))]
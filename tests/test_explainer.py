@@ -0,0 +1,306 @@
+"""Tests pour le module explainer."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.models.explainer import (
+    ExplanationCache,
+    FraudExplainer,
+    _top_k_indices,
+    model_fingerprint,
+)
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+
+@pytest.fixture
+def data():
+    """Crée des transactions fictives."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.normal(size=(60, 30)), columns=COLUMNS)
+
+
+@pytest.fixture
+def explainer(data):
+    """Crée un FraudExplainer sur un pipeline simple."""
+    y = (data["V1"] + data["V2"] > 0).astype(int)
+    pipeline = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("model", RandomForestClassifier(n_estimators=10, random_state=42)),
+        ]
+    )
+    pipeline.fit(data, y)
+    return FraudExplainer(pipeline)
+
+
+def test_top_k_indices_sorted_descending():
+    """Test l'extraction des top-k indices par ligne."""
+    scores = np.array([[0.1, 0.9, 0.5, 0.3], [0.7, 0.2, 0.8, 0.0]])
+
+    assert _top_k_indices(scores, 2).tolist() == [[1, 2], [2, 0]]
+    assert _top_k_indices(scores, 10).tolist() == [[1, 2, 3, 0], [2, 0, 1, 3]]
+
+
+def test_explain_uses_positive_class(explainer, data):
+    """Test que les contributions SHAP ne s'annulent pas entre classes."""
+    reasons, error = explainer.explain(data.iloc[[0]], top_k=3)
+
+    assert error is None
+    assert len(reasons) == 3
+    assert abs(reasons[0]["shap"]) > 1e-6
+    assert reasons[0]["feature"] in {"V1", "V2"}
+
+
+def test_explain_batch_matches_explain(explainer, data):
+    """Test que explain_batch donne les mêmes raisons que explain ligne par ligne."""
+    result, error = explainer.explain_batch(data, top_k=4)
+
+    assert error is None
+    assert result["feature_index"].shape == (len(data), 4)
+    for i in [0, 17, 59]:
+        reasons, _ = explainer.explain(data.iloc[[i]], top_k=4)
+        assert [explainer.feature_names[j] for j in result["feature_index"][i]] == [
+            r["feature"] for r in reasons
+        ]
+        assert result["shap"][i] == pytest.approx([r["shap"] for r in reasons])
+        assert result["value"][i] == pytest.approx([r["value"] for r in reasons])
+
+
+def test_reasons_frame(explainer, data):
+    """Test la mise en forme des raisons en colonnes."""
+    subset = data.iloc[[3, 8]]
+    result, _ = explainer.explain_batch(subset, top_k=2)
+    frame = explainer.reasons_frame(result, index=subset.index)
+
+    assert list(frame.columns) == ["reason_1", "reason_1_shap", "reason_2", "reason_2_shap"]
+    assert list(frame.index) == [3, 8]
+    assert frame["reason_1"].str.match(r"^\w+ [↑↓]$").all()
+
+
+def test_explain_batch_error(explainer):
+    """Test qu'une entrée invalide renvoie un message d'erreur."""
+    result, error = explainer.explain_batch(pd.DataFrame({"Amount": [1.0]}))
+
+    assert result is None
+    assert error.startswith("Erreur SHAP")
+
+
+def test_explanation_cache_lru_eviction():
+    """Test l'éviction de l'entrée la moins récemment utilisée."""
+    cache = ExplanationCache(max_entries=2)
+    cache.put("a", [{"feature": "V1"}])
+    cache.put("b", [{"feature": "V2"}])
+    cache.get("a")
+    cache.put("c", [{"feature": "V3"}])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [{"feature": "V1"}]
+    assert len(cache) == 2
+    assert cache.stats()["hits"] == 2
+    assert cache.hit_rate == pytest.approx(2 / 3)
+
+
+def test_explanation_cache_disk(tmp_path):
+    """Test la persistance sur disque entre deux instances."""
+    ExplanationCache(cache_dir=tmp_path).put("k", [{"feature": "V1", "shap": 0.5}])
+    cache = ExplanationCache(cache_dir=tmp_path)
+
+    assert cache.get("k") == [{"feature": "V1", "shap": 0.5}]
+    assert cache.hits == 1
+
+
+def test_explanation_cache_disk_bounded(tmp_path):
+    """Test que le dossier de persistance garde au plus max_entries fichiers."""
+    cache = ExplanationCache(max_entries=2, cache_dir=tmp_path)
+    for age, key in enumerate(["a", "b"]):
+        cache.put(key, [{"feature": key}])
+        os.utime(tmp_path / f"{key}.json", (1000 + age, 1000 + age))
+    # Relire "a" depuis le disque le marque comme récemment utilisé
+    ExplanationCache(cache_dir=tmp_path).get("a")
+    cache.put("c", [{"feature": "c"}])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.json", "c.json"]
+
+
+def test_explain_uses_cache(explainer, data):
+    """Test qu'une transaction réanalysée est servie par le cache."""
+    explainer.cache = ExplanationCache()
+    first, _ = explainer.explain(data.iloc[[5]], top_k=3)
+    first[0]["feature"] = "modifié"
+    second, _ = explainer.explain(data.iloc[[5]], top_k=3)
+    other_k, _ = explainer.explain(data.iloc[[5]], top_k=2)
+
+    assert second[0]["feature"] != "modifié"
+    assert explainer.cache.hits == 1
+    assert explainer.cache.misses == 2
+    assert len(other_k) == 2
+
+
+def test_model_fingerprint(explainer, data):
+    """Test que l'empreinte dépend des arbres du modèle."""
+    other = RandomForestClassifier(n_estimators=10, random_state=1)
+    other.fit(data, data["V3"] > 0)
+
+    assert model_fingerprint(explainer.model) == explainer.fingerprint
+    assert model_fingerprint(other) != explainer.fingerprint
+
+
+def test_explainer_built_lazily(explainer, data):
+    """Test que le TreeExplainer n'est construit qu'au premier usage."""
+    assert not explainer.is_ready
+    assert explainer.build_seconds is None
+
+    explainer.explain(data.iloc[[0]])
+
+    assert explainer.is_ready
+    assert explainer.build_seconds >= 0.0
+
+
+def test_explainer_warm_up_background(explainer):
+    """Test la construction en arrière-plan."""
+    explainer.warm_up(background=True)
+    explainer._build_thread.join(timeout=30)
+
+    assert explainer.is_ready
+
+
+def test_explain_flagged_only_explains_alerts(explainer, data):
+    """Test que seules les lignes signalées sont expliquées."""
+    predictions = np.zeros(len(data), dtype=int)
+    predictions[[2, 10, 41]] = 1
+
+    reasons, error = explainer.explain_flagged(data, predictions, top_k=2)
+    expected, _ = explainer.explain_batch(data.iloc[[2, 10, 41]], top_k=2)
+
+    assert error is None
+    assert list(reasons.index) == [2, 10, 41]
+    assert reasons["reason_1_shap"].to_numpy() == pytest.approx(expected["shap"][:, 0])
+
+
+def test_explain_flagged_parallel_matches_serial(explainer, data):
+    """Test que le pool de processus donne les mêmes raisons que le calcul direct."""
+    predictions = (np.arange(len(data)) % 3 == 0).astype(int)
+    calls = []
+
+    serial, _ = explainer.explain_flagged(data, predictions, top_k=3)
+    parallel, error = explainer.explain_flagged(
+        data,
+        predictions,
+        top_k=3,
+        n_jobs=2,
+        chunk_size=5,
+        progress=lambda done, total: calls.append((done, total)),
+    )
+
+    assert error is None
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert calls[-1] == (20, 20)
+
+
+def test_explain_flagged_reuses_pool(explainer, data):
+    """Test que le pool de processus est gardé entre deux appels puis fermé par close."""
+    predictions = (np.arange(len(data)) % 3 == 0).astype(int)
+
+    first, _ = explainer.explain_flagged(data, predictions, top_k=2, n_jobs=2, chunk_size=5)
+    pool = explainer._pool
+    second, _ = explainer.explain_flagged(data, predictions, top_k=2, n_jobs=2, chunk_size=5)
+
+    assert pool is not None
+    assert explainer._pool is pool
+    pd.testing.assert_frame_equal(first, second)
+
+    explainer.close()
+    assert explainer._pool is None
+
+
+def test_empty_reasons_match_explained_schema(explainer, data):
+    """Test que les raisons vides (échec SHAP) ont les colonnes et types du cas normal."""
+    report = data.head(4).copy()
+    reasons, _ = explainer.explain_flagged(report, np.array([0, 1, 0, 0]), top_k=2)
+
+    merged = FraudExplainer.attach_reasons(report, reasons)
+    empty = FraudExplainer.attach_reasons(report, explainer.empty_reasons(2))
+
+    assert list(empty.columns) == list(merged.columns)
+    assert empty.dtypes.equals(merged.dtypes)
+    assert empty["reason_1_shap"].isna().all()
+
+
+def test_attach_reasons(explainer, data):
+    """Test l'ajout des raisons au rapport complet."""
+    report = data.head(4).copy()
+    report["fraud_pred"] = [0, 1, 0, 0]
+    reasons, _ = explainer.explain_flagged(report[COLUMNS], report["fraud_pred"], top_k=1)
+    no_alert, _ = explainer.explain_flagged(report[COLUMNS], np.zeros(4, dtype=int), top_k=1)
+
+    merged = FraudExplainer.attach_reasons(report, reasons)
+
+    assert merged["reason_1"].tolist()[0] == ""
+    assert merged["reason_1"].tolist()[1] != ""
+    assert np.isnan(merged["reason_1_shap"].iloc[0])
+    assert list(FraudExplainer.attach_reasons(report, no_alert).columns)[-2:] == [
+        "reason_1",
+        "reason_1_shap",
+    ]
+
+
+def test_global_shap_summary(explainer, data):
+    """Test le résumé SHAP global sur un échantillon stratifié."""
+    labels = np.zeros(len(data), dtype=int)
+    labels[:6] = 1
+
+    summary = explainer.global_shap_summary(data, labels, sample_size=20)
+
+    assert summary["by_class"]["1"]["n"] == 5  # minimum par classe: 20 // 4
+    assert summary["by_class"]["0"]["n"] == 18
+    assert summary["n_samples"] == 23
+    assert set(summary["mean_abs_shap"]) == set(explainer.feature_names)
+    assert len(summary["by_class"]["1"]["quantiles"]["V1"]) == len(summary["quantiles"])
+    assert max(summary["mean_abs_shap"], key=summary["mean_abs_shap"].get) in {"V1", "V2"}
+
+
+def test_global_shap_summary_parallel_matches_serial(explainer, data):
+    """Test que le calcul parallèle du résumé donne le même résultat."""
+    serial = explainer.global_shap_summary(data, sample_size=30)
+    parallel = explainer.global_shap_summary(data, sample_size=30, n_jobs=2, chunk_size=8)
+
+    assert parallel["by_class"]["all"]["n"] == 30
+    assert [parallel["mean_abs_shap"][name] for name in COLUMNS] == pytest.approx(
+        [serial["mean_abs_shap"][name] for name in COLUMNS]
+    )
+
+
+def test_feature_importance_from_global_summary(explainer, data):
+    """Test l'importance globale SHAP issue du résumé précalculé."""
+    assert explainer.get_feature_importance(method="shap") == {}
+
+    explainer.global_summary = explainer.global_shap_summary(data, sample_size=10)
+
+    assert explainer.get_feature_importance(method="shap") == explainer.global_summary[
+        "mean_abs_shap"
+    ]
+    assert len(explainer.get_feature_importance()) == 30
+
+
+def test_shap_matrix_pins_positive_class_contributions(explainer, data):
+    """Test que les contributions expliquent la probabilité de fraude (classe 1)."""
+    x = explainer._transform(data.iloc[:5])
+    shap_values = explainer._shap_matrix(x)
+    expected_value = np.atleast_1d(explainer.explainer.expected_value)[1]
+    proba = explainer.pipeline.predict_proba(data.iloc[:5])[:, 1]
+
+    # Additivité SHAP: base + contributions = probabilité de la classe positive
+    assert shap_values.shape == (5, len(COLUMNS))
+    np.testing.assert_allclose(expected_value + shap_values.sum(axis=1), proba, atol=1e-6)
+
+    reasons, error = explainer.explain(data.iloc[[0]], top_k=1)
+    assert error is None
+    top = COLUMNS.index(reasons[0]["feature"])
+    assert reasons[0]["shap"] == pytest.approx(shap_values[0, top])
@@ -0,0 +1,158 @@
+"""Tests pour le moteur d'inférence compilé."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.decomposition import PCA
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.models.forest import AffinePreprocessor, CompiledForest, transform_features
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+
+@pytest.fixture
+def training_data():
+    """Crée des données fictives déséquilibrées."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(400, 30)), columns=COLUMNS)
+    y = (X["V1"] + rng.normal(scale=0.5, size=400) > 1.2).astype(int)
+    return X, y
+
+
+@pytest.fixture
+def smote_pipeline(training_data):
+    """Crée un pipeline identique à celui de l'entraînement (version réduite)."""
+    X, y = training_data
+    preprocessor = ColumnTransformer(
+        transformers=[("scale_amt_time", StandardScaler(), ["Amount", "Time"])],
+        remainder="passthrough",
+    )
+    pipeline = ImbPipeline(
+        steps=[
+            ("prep", preprocessor),
+            ("smote", SMOTE(sampling_strategy=0.5, random_state=42)),
+            ("model", RandomForestClassifier(n_estimators=25, random_state=42)),
+        ]
+    )
+    pipeline.fit(X, y)
+    return pipeline
+
+
+def test_compiled_forest_matches_sklearn(smote_pipeline, training_data):
+    """Test que les probabilités sont identiques à celles de sklearn."""
+    X, _ = training_data
+    forest = CompiledForest.from_pipeline(smote_pipeline)
+
+    expected = smote_pipeline.predict_proba(X)[:, 1]
+    result = forest.predict_proba(transform_features(smote_pipeline, X))
+
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_compiled_forest_structure(smote_pipeline):
+    """Test que tous les arbres sont aplatis dans des tableaux contigus."""
+    forest = CompiledForest.from_pipeline(smote_pipeline)
+    model = smote_pipeline.named_steps["model"]
+
+    assert forest.n_trees == 25
+    assert forest.n_nodes == sum(est.tree_.node_count for est in model.estimators_)
+    assert forest.feature.flags["C_CONTIGUOUS"]
+    assert forest.value.shape == (forest.n_nodes,)
+
+
+def test_compiled_forest_single_leaf_trees():
+    """Test une forêt dont les arbres se réduisent à une feuille."""
+    X = np.zeros((10, 3))
+    y = np.array([0, 1] * 5)
+    model = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+
+    forest = CompiledForest(model)
+
+    np.testing.assert_allclose(forest.predict_proba(X), model.predict_proba(X)[:, 1])
+
+
+def test_compiled_forest_rejects_non_forest():
+    """Test qu'un modèle non arborescent est refusé."""
+    model = LogisticRegression().fit(np.random.rand(20, 3), [0, 1] * 10)
+
+    with pytest.raises(ValueError):
+        CompiledForest(model)
+
+
+def test_compiled_forest_wrong_shape(smote_pipeline):
+    """Test qu'une matrice de mauvaise dimension est refusée."""
+    forest = CompiledForest.from_pipeline(smote_pipeline)
+
+    with pytest.raises(ValueError):
+        forest.predict_proba(np.zeros((2, 5)))
+
+
+def test_affine_preprocessor_matches_pipeline(smote_pipeline, training_data):
+    """Test que le prétraitement compilé reproduit le ColumnTransformer."""
+    X, _ = training_data
+    preprocessor = AffinePreprocessor.from_pipeline(smote_pipeline, COLUMNS)
+
+    assert preprocessor is not None
+    np.testing.assert_array_equal(
+        preprocessor.transform(X.to_numpy()), transform_features(smote_pipeline, X)
+    )
+
+
+def test_affine_preprocessor_unsupported_step(training_data):
+    """Test qu'une étape non affine désactive le prétraitement compilé."""
+    X, y = training_data
+    pipeline = Pipeline(
+        [("prep", PCA(n_components=5)), ("model", RandomForestClassifier(n_estimators=3))]
+    ).fit(X, y)
+
+    assert AffinePreprocessor.from_pipeline(pipeline, COLUMNS) is None
+
+
+@pytest.mark.parametrize("value_bits", [8, 16])
+def test_compact_forest_within_quantization_error(training_data, value_bits, tmp_path):
+    """Test que la forêt compacte reste dans la borne d'erreur de quantification."""
+    X, y = training_data
+    model = RandomForestClassifier(n_estimators=20, min_samples_leaf=7, random_state=0)
+    model.fit(X.to_numpy(), y)
+    full = CompiledForest(model)
+    compact = full.compact(value_bits=value_bits)
+
+    expected = model.predict_proba(X.to_numpy())[:, 1]
+    result = compact.predict_proba(X.to_numpy())
+
+    bound = 1.0 / (2 * (2**value_bits - 1))
+    assert np.abs(result - expected).max() <= bound + 1e-12
+    assert compact.threshold.dtype == np.float32
+    assert compact.nbytes < full.nbytes / 2
+
+    compact.save(tmp_path / "compact.joblib")
+    reloaded = CompiledForest.load(tmp_path / "compact.joblib")
+    np.testing.assert_array_equal(reloaded.predict_proba(X.to_numpy()), result)
+
+
+def test_compact_forest_float32_thresholds_route_identically():
+    """Test l'arrondi vers le bas des seuils float32 (valeurs float32 adjacentes)."""
+    a = np.nextafter(np.float32(1024.0), np.float32(2048.0))
+    b = np.nextafter(a, np.float32(2048.0))
+    x = np.array([[a], [b], [a], [b]], dtype=np.float32)
+    model = RandomForestClassifier(n_estimators=1, bootstrap=False, random_state=0)
+    model.fit(x, [0, 1, 0, 1])
+
+    # Le point milieu (float64) s'arrondirait à b avec une simple conversion
+    assert np.float32(model.estimators_[0].tree_.threshold[0]) == b
+
+    compact = CompiledForest(model).compact()
+    np.testing.assert_array_equal(compact.predict_proba(x), [0.0, 1.0, 0.0, 1.0])
+
+
+def test_compact_forest_invalid_bits(smote_pipeline):
+    """Test le refus d'une quantification non supportée."""
+    with pytest.raises(ValueError):
+        CompiledForest.from_pipeline(smote_pipeline).compact(value_bits=4)
@@ -0,0 +1,110 @@
+"""Tests pour le ré-entraînement incrémental (warm start)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from src.data.cache import ResampleCache
+from src.models.forest import CompiledForest, transform_features
+from src.models.incremental import warm_start_forest
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+
+def make_data(seed, n=400):
+    """Crée des données fictives déséquilibrées."""
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 30)), columns=COLUMNS)
+    y = pd.Series((X["V1"] + rng.normal(scale=0.5, size=n) > 1.2).astype(int))
+    return X, y
+
+
+@pytest.fixture
+def fitted_pipeline():
+    """Crée un pipeline entraîné identique à celui de l'entraînement (version réduite)."""
+    X, y = make_data(0)
+    preprocessor = ColumnTransformer(
+        transformers=[("scale_amt_time", StandardScaler(), ["Amount", "Time"])],
+        remainder="passthrough",
+    )
+    pipeline = ImbPipeline(
+        steps=[
+            ("prep", preprocessor),
+            ("smote", SMOTE(sampling_strategy=0.5, random_state=42)),
+            ("model", RandomForestClassifier(n_estimators=20, random_state=42)),
+        ]
+    )
+    return pipeline.fit(X, y)
+
+
+def test_warm_start_adds_trees_and_retires_oldest(fitted_pipeline):
+    """Test l'ajout d'arbres et le retrait des plus anciens."""
+    forest = fitted_pipeline.steps[-1][1]
+    old_trees = list(forest.estimators_)
+    scaler_mean = fitted_pipeline.named_steps["prep"].transformers_[0][1].mean_.copy()
+    X_new, y_new = make_data(1)
+
+    report = warm_start_forest(fitted_pipeline, X_new, y_new, n_new_trees=5, max_trees=20)
+
+    assert report["n_trees_before"] == 20
+    assert report["n_trees_retired"] == 5
+    assert report["n_trees_after"] == len(forest.estimators_) == forest.n_estimators == 20
+    assert forest.estimators_[:15] == old_trees[5:]
+    assert not any(tree in old_trees for tree in forest.estimators_[15:])
+    assert forest.warm_start is False
+    # Le prétraitement existant n'est pas ré-entraîné
+    np.testing.assert_array_equal(
+        fitted_pipeline.named_steps["prep"].transformers_[0][1].mean_, scaler_mean
+    )
+
+
+def test_warm_start_without_limit_keeps_all_trees(fitted_pipeline, tmp_path):
+    """Test que la forêt grandit sans max_trees, avec SMOTE via le cache."""
+    X_new, y_new = make_data(1)
+    cache = ResampleCache(tmp_path)
+
+    report = warm_start_forest(fitted_pipeline, X_new, y_new, n_new_trees=5, resample_cache=cache)
+
+    assert report["n_trees_after"] == 25
+    assert report["n_rows_resampled"] > report["n_rows"]
+    assert cache.stats["misses"] == 1
+
+
+def test_updated_pipeline_matches_compiled_forest(fitted_pipeline):
+    """Test que le pipeline mis à jour reste cohérent avec le moteur compilé."""
+    X_new, y_new = make_data(1)
+    warm_start_forest(fitted_pipeline, X_new, y_new, n_new_trees=5, max_trees=20)
+
+    compiled = CompiledForest.from_pipeline(fitted_pipeline)
+    np.testing.assert_allclose(
+        compiled.predict_proba(transform_features(fitted_pipeline, X_new)),
+        fitted_pipeline.predict_proba(X_new)[:, 1],
+        atol=1e-12,
+    )
+
+
+def test_warm_start_rejects_window_without_fraud(fitted_pipeline):
+    """Test le refus d'une fenêtre sans fraude, sans modifier la forêt."""
+    X_new, y_new = make_data(1)
+    forest = fitted_pipeline.steps[-1][1]
+    old_trees = list(forest.estimators_)
+
+    with pytest.raises(ValueError):
+        warm_start_forest(fitted_pipeline, X_new, y_new * 0, n_new_trees=5)
+
+    assert forest.estimators_ == old_trees
+
+
+def test_warm_start_validates_tree_counts(fitted_pipeline):
+    """Test la validation du nombre d'arbres."""
+    X_new, y_new = make_data(1)
+
+    with pytest.raises(ValueError):
+        warm_start_forest(fitted_pipeline, X_new, y_new, n_new_trees=0)
+    with pytest.raises(ValueError):
+        warm_start_forest(fitted_pipeline, X_new, y_new, n_new_trees=10, max_trees=5)
@@ -0,0 +1,133 @@
+"""Tests pour le module io (CSV, Parquet, Arrow)."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.io import (
+    TableWriter,
+    find_table,
+    iter_table,
+    read_table,
+    table_columns,
+    table_format,
+    write_table,
+)
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def sample_df():
+    """Crée un petit DataFrame de transactions."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "Time": rng.random(25) * 1000,
+            "V1": rng.normal(size=25),
+            "Amount": rng.random(25) * 100,
+            "Class": rng.integers(0, 2, 25),
+        }
+    )
+
+
+def test_table_format():
+    """Test la détection du format par extension."""
+    assert table_format("a.csv") == "csv"
+    assert table_format("a.PARQUET") == "parquet"
+    assert table_format("a.arrow") == "arrow"
+    assert table_format("a.feather") == "arrow"
+    assert table_format("a.txt") == "csv"
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_roundtrip(tmp_path, sample_df, suffix):
+    """Test l'écriture puis la relecture dans chaque format."""
+    path = tmp_path / f"data{suffix}"
+
+    write_table(sample_df, path)
+    result = read_table(path)
+
+    assert table_columns(path) == list(sample_df.columns)
+    pd.testing.assert_frame_equal(result, sample_df, check_exact=False)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_projection_and_float32(tmp_path, sample_df, suffix):
+    """Test la projection de colonnes et la conversion en float32."""
+    path = tmp_path / f"data{suffix}"
+    write_table(sample_df, path)
+
+    result = read_table(path, columns=["Amount", "Time"], float32=True)
+
+    assert list(result.columns) == ["Amount", "Time"]
+    assert (result.dtypes == np.float32).all()
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_streaming_write_and_read(tmp_path, sample_df, suffix):
+    """Test l'écriture incrémentale et la lecture par blocs."""
+    path = tmp_path / f"data{suffix}"
+
+    with TableWriter(path) as writer:
+        for start in range(0, 25, 10):
+            writer.write(sample_df.iloc[start : start + 10])
+
+    chunks = list(iter_table(path, batch_rows=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), sample_df, check_exact=False
+    )
+
+
+def test_find_table(tmp_path, sample_df):
+    """Test que find_table préfère les formats colonnes au CSV."""
+    assert find_table(tmp_path, "X_test") is None
+
+    write_table(sample_df, tmp_path / "X_test.csv")
+    assert find_table(tmp_path, "X_test") == tmp_path / "X_test.csv"
+
+    write_table(sample_df, tmp_path / "X_test.parquet")
+    assert find_table(tmp_path, "X_test") == tmp_path / "X_test.parquet"
+
+
+def test_find_table_skips_stale_parquet(tmp_path, sample_df):
+    """Test qu'un CSV plus récent que le Parquet est préféré (Parquet périmé)."""
+    write_table(sample_df, tmp_path / "X_test.parquet")
+    write_table(sample_df, tmp_path / "X_test.csv")
+    os.utime(tmp_path / "X_test.parquet", (1000, 1000))
+    os.utime(tmp_path / "X_test.csv", (2000, 2000))
+    assert find_table(tmp_path, "X_test") == tmp_path / "X_test.csv"
+
+    # À date égale, le format colonnes reste prioritaire
+    os.utime(tmp_path / "X_test.parquet", (2000, 2000))
+    assert find_table(tmp_path, "X_test") == tmp_path / "X_test.parquet"
+
+
+def test_csv_chunks_keep_first_chunk_schema(tmp_path):
+    """Test qu'un bloc CSV entier suivi de flottants s'écrit en Parquet."""
+    source = tmp_path / "data.csv"
+    source.write_text("Amount,Class\n1,0\n2,1\n3.5,0\n4.25,1\n")
+    # Inférence bloc par bloc: Amount est entier dans le premier bloc seulement
+    assert [str(c["Amount"].dtype) for c in iter_table(source, batch_rows=2)] == [
+        "int64",
+        "float64",
+    ]
+
+    output = tmp_path / "out.parquet"
+    with TableWriter(output) as writer:
+        for chunk in iter_table(source, batch_rows=2, dtype={"Amount": np.float64}):
+            writer.write(chunk)
+
+    result = read_table(output)
+    assert result["Amount"].tolist() == [1.0, 2.0, 3.5, 4.25]
+    assert result["Class"].dtype == np.int64
+
+    with TableWriter(tmp_path / "bad.parquet") as writer:
+        chunks = iter_table(source, batch_rows=2)
+        writer.write(next(chunks))
+        with pytest.raises(ValueError, match="schéma"):
+            writer.write(next(chunks))
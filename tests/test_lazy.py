@@ -0,0 +1,42 @@
+"""Tests pour le module lazy."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.models
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_lazy_exports_resolve():
+    """Test que les noms exportés restent importables depuis le package."""
+    from src.models import FraudPredictor
+    from src.models.predictor import FraudPredictor as direct
+
+    assert FraudPredictor is direct
+    assert "FraudExplainer" in dir(src.models)
+    assert set(src.models.__all__) <= set(dir(src.models))
+
+
+def test_lazy_exports_unknown_name():
+    """Test l'erreur pour un nom non exporté."""
+    with pytest.raises(AttributeError):
+        src.models.Inconnu
+
+
+def test_scoring_modules_do_not_import_shap():
+    """Test que le scoring (CLI, service) ne charge ni shap ni plotly."""
+    code = (
+        "import sys\n"
+        "import src.models, src.data, src.serving\n"
+        "import src.models.predictor, src.data.loader, src.serving.server\n"
+        "print(','.join(m for m in ('shap', 'plotly') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
@@ -3,6 +3,7 @@
 import json
 from pathlib import Path
 import numpy as np
+import pandas as pd
 import joblib
 import pytest
 from sklearn.ensemble import RandomForestClassifier
@@ -105,4 +106,239 @@ def test_load_artifacts_complete(temp_model_dir):
     assert len(columns["all_cols"]) == 2  # 2 colonnes, pas 3
 
     # Pas de warnings si tout est cohérent
-    assert len(warnings) == 0
\ No newline at end of file
+    assert len(warnings) == 0
+
+
+def test_load_global_shap(temp_model_dir):
+    """Test le chargement du résumé SHAP global."""
+    loader = ArtifactLoader(temp_model_dir)
+    assert loader.load_global_shap() is None
+
+    summary = {"features": ["Amount"], "mean_abs_shap": {"Amount": 0.1}, "n_samples": 10}
+    with open(temp_model_dir / "global_shap.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f)
+
+    assert loader.load_global_shap() == summary
+
+
+def test_load_info_and_slow_load_warning(temp_model_dir, monkeypatch):
+    """Test les mesures de chargement et le warning de chargement lent."""
+    joblib.dump(create_simple_pipeline(), temp_model_dir / "pipeline.joblib")
+    with open(temp_model_dir / "columns.json", "w") as f:
+        json.dump({"all_cols": ["Amount", "Time"]}, f)
+    with open(temp_model_dir / "metrics_valid.json", "w") as f:
+        json.dump({"threshold": 0.5}, f)
+
+    loader = ArtifactLoader(temp_model_dir)
+    _, _, _, warnings = loader.load_artifacts()
+    assert warnings == []
+    assert loader.load_info["load_seconds"] >= 0.0
+    assert loader.load_info["pipeline_mb"] > 0.0
+
+    monkeypatch.setattr(ArtifactLoader, "slow_load_seconds", -1.0)
+    _, _, _, warnings = loader.load_artifacts()
+    assert any("Chargement lent" in warning for warning in warnings)
+
+
+def test_load_compiled_forest_mmap(temp_model_dir):
+    """Test le chargement projeté en mémoire de la forêt compilée."""
+    from src.models.forest import CompiledForest
+
+    pipeline = create_simple_pipeline()
+    joblib.dump(pipeline, temp_model_dir / "pipeline.joblib")
+    loader = ArtifactLoader(temp_model_dir, mmap_mode="r")
+    assert loader.load_compiled_forest(pipeline) is None
+
+    CompiledForest.from_pipeline(pipeline).save(loader.forest_path)
+    forest = loader.load_compiled_forest(pipeline)
+
+    assert isinstance(forest.threshold, np.memmap)
+    x = np.array([[1.0, 2.0], [6.0, 7.0]])
+    expected = pipeline.predict_proba(x)[:, 1]
+    assert forest.predict_proba(pipeline[:-1].transform(x)) == pytest.approx(expected)
+
+    other = ImbPipeline([("classifier", RandomForestClassifier(n_estimators=3))])
+    other.fit(np.array([[1, 2], [3, 4], [5, 6], [7, 8]]), np.array([0, 0, 1, 1]))
+    assert loader.load_compiled_forest(other) is None
+
+
+def test_warmup_benchmark_recorded(temp_model_dir):
+    """Test les latences du préchauffage, mesurées avec le moteur du prédicateur."""
+    from src.models.predictor import FraudPredictor
+
+    joblib.dump(create_simple_pipeline(), temp_model_dir / "pipeline.joblib")
+    with open(temp_model_dir / "columns.json", "w") as f:
+        json.dump({"all_cols": ["Amount", "Time"]}, f)
+
+    # Désactivé par défaut: le chargement seul ne score aucun lot synthétique
+    default = ArtifactLoader(temp_model_dir)
+    pipeline, metrics, columns, _ = default.load_artifacts()
+    predictor = FraudPredictor(pipeline, columns["all_cols"], engine="compiled")
+    assert default.warmup(predictor, metrics) == []
+    assert default.load_info["warmup"] == {}
+
+    loader = ArtifactLoader(temp_model_dir, warmup_sizes=(1, 64))
+    loader.load_artifacts()
+    calls = []
+    original = predictor.predict
+    predictor.predict = lambda data: calls.append(len(data)) or original(data)
+    loader.warmup(predictor, metrics)
+    warmup = loader.load_info["warmup"]
+
+    assert list(warmup) == ["1", "64"]
+    assert warmup["1"]["repeats"] == 200
+    assert warmup["64"]["repeats"] == 156
+    assert 0.0 < warmup["1"]["p50_ms"] <= warmup["1"]["p99_ms"] <= warmup["1"]["max_ms"]
+    assert warmup["64"]["rows_per_s"] > 0.0
+    assert set(calls) == {1, 64}
+
+
+def test_warmup_latency_regression_warning(temp_model_dir):
+    """Test le warning de régression par rapport aux latences d'entraînement."""
+    from src.models.predictor import FraudPredictor
+
+    joblib.dump(create_simple_pipeline(), temp_model_dir / "pipeline.joblib")
+    with open(temp_model_dir / "columns.json", "w") as f:
+        json.dump({"all_cols": ["Amount", "Time"]}, f)
+    latency = {"1": {"p50_ms": 1e-6, "max_ms": 1e-6}, "64": {"p50_ms": 1e6, "max_ms": 1e6}}
+    with open(temp_model_dir / "metrics_valid.json", "w") as f:
+        json.dump({"threshold": 0.5, "latency": latency, "latency_engine": "auto"}, f)
+
+    loader = ArtifactLoader(temp_model_dir, warmup_sizes=(1, 64))
+    pipeline, metrics, columns, _ = loader.load_artifacts()
+    warnings = loader.warmup(FraudPredictor(pipeline, columns["all_cols"], engine="auto"), metrics)
+
+    regressions = [w for w in warnings if "régression" in w]
+    assert len(regressions) == 1
+    assert "taille de lot 1)" in regressions[0]
+    assert "moteur auto" in regressions[0]
+
+    # Références mesurées sur un autre moteur: pas de comparaison
+    other = FraudPredictor(pipeline, columns["all_cols"], engine="sklearn")
+    assert loader.warmup(other, metrics) == []
+
+
+def test_warmup_latency_regression_uses_p99(temp_model_dir):
+    """Test que le p99 d'entraînement sert de référence quand il est enregistré."""
+    from src.models.predictor import FraudPredictor
+
+    joblib.dump(create_simple_pipeline(), temp_model_dir / "pipeline.joblib")
+    with open(temp_model_dir / "columns.json", "w") as f:
+        json.dump({"all_cols": ["Amount", "Time"]}, f)
+    # Médiane de référence très lente, mais p99 de référence très rapide
+    latency = {"1": {"p50_ms": 1e6, "p99_ms": 1e-6, "max_ms": 1e6}}
+    with open(temp_model_dir / "metrics_valid.json", "w") as f:
+        json.dump({"threshold": 0.5, "latency": latency, "latency_engine": "auto"}, f)
+
+    loader = ArtifactLoader(temp_model_dir, warmup_sizes=(1,))
+    pipeline, metrics, columns, _ = loader.load_artifacts()
+    warnings = loader.warmup(FraudPredictor(pipeline, columns["all_cols"], engine="auto"), metrics)
+
+    regressions = [w for w in warnings if "régression" in w]
+    assert len(regressions) == 1
+    assert "): p99 " in regressions[0]
+
+
+def test_load_compiled_forest_compact_opt_in(temp_model_dir):
+    """Test que la forêt compacte n'est utilisée qu'avec compact=True."""
+    from src.models.forest import CompiledForest
+
+    pipeline = create_simple_pipeline()
+    loader = ArtifactLoader(temp_model_dir)
+    full = CompiledForest.from_pipeline(pipeline)
+    full.save(loader.forest_path)
+    full.compact(value_bits=8).save(loader.compact_path)
+
+    assert loader.load_compiled_forest(pipeline).value.dtype == np.float64
+    compact = ArtifactLoader(temp_model_dir, compact=True).load_compiled_forest(pipeline)
+    assert compact.value.dtype == np.uint8
+    assert "forest_compact.joblib" in loader.fingerprint()
+
+
+def test_auto_engine_same_probability_across_batch_sizes(temp_model_dir):
+    """Test qu'avec le moteur auto, une ligne a le même score quelle que soit la taille du lot."""
+    from src.models.forest import CompiledForest
+    from src.models.predictor import FraudPredictor
+
+    # Feuilles impures: probabilités non triviales, modifiées par la quantification
+    rng = np.random.default_rng(0)
+    x_train = rng.uniform(0, 8, size=(400, 2))
+    y_train = (x_train[:, 0] + rng.normal(0, 2, 400) > 4).astype(int)
+    pipeline = ImbPipeline([
+        ("scaler", StandardScaler()),
+        ("classifier", RandomForestClassifier(n_estimators=10, min_samples_leaf=7, random_state=0)),
+    ]).fit(x_train, y_train)
+
+    loader = ArtifactLoader(temp_model_dir)
+    full = CompiledForest.from_pipeline(pipeline)
+    full.save(loader.forest_path)
+    full.compact(value_bits=8).save(loader.compact_path)
+
+    predictor = FraudPredictor(
+        pipeline, ["a", "b"], engine="auto", forest=loader.load_compiled_forest(pipeline)
+    )
+    x = np.random.default_rng(1).uniform(0, 8, size=(predictor.auto_max_rows + 72, 2))
+    df = pd.DataFrame(x, columns=["a", "b"])
+
+    # Petit lot: forêt compilée; grand lot: sklearn
+    single = np.concatenate([predictor.predict(df.iloc[[i]])[0] for i in range(len(df))])
+    batch, _ = predictor.predict(df)
+
+    np.testing.assert_allclose(single, batch, rtol=0, atol=1e-12)
+
+
+def test_forest_only_does_not_load_trees(temp_model_dir):
+    """Test que forest_only score avec la forêt projetée, sans recopier les arbres."""
+    from src.models.forest import CompiledForest
+    from src.models.predictor import FraudPredictor
+
+    pipeline = create_simple_pipeline()
+    joblib.dump(pipeline, temp_model_dir / "pipeline.joblib")
+    writer = ArtifactLoader(temp_model_dir)
+    CompiledForest.from_pipeline(pipeline).save(writer.forest_path)
+    writer.save_pipeline_without_forest(pipeline)
+    with open(writer.cols_path, "w") as f:
+        json.dump({"all_cols": ["a", "b"]}, f)
+
+    loader = ArtifactLoader(temp_model_dir, mmap_mode="r", forest_only=True)
+    loaded, _, columns, warnings = loader.load_artifacts()
+    forest = loader.load_compiled_forest(loaded)
+
+    # Aucun arbre sklearn (tableaux privés au processus): seulement la forêt projetée
+    assert loaded.steps[-1][1].estimators_ == []
+    assert all(isinstance(getattr(forest, name), np.memmap) for name in CompiledForest._ARRAYS)
+    assert loader.load_info["forest_only"] is True
+    assert "pipeline_noforest.joblib" in loader.fingerprint()
+    assert not any("Divergence" in w for w in warnings)
+
+    # Les grands lots (au-delà de auto_max_rows) passent aussi par la forêt projetée
+    predictor = FraudPredictor(loaded, columns["all_cols"], engine="auto", forest=forest)
+    x = np.random.default_rng(0).uniform(0, 8, size=(predictor.auto_max_rows + 50, 2))
+    df = pd.DataFrame(x, columns=columns["all_cols"])
+    probas, _ = predictor.predict(df)
+    assert probas == pytest.approx(pipeline.predict_proba(x)[:, 1])
+
+    with pytest.raises(ValueError, match="sans arbres"):
+        FraudPredictor(loaded, columns["all_cols"], engine="sklearn")
+
+
+def test_forest_only_falls_back_when_stale(temp_model_dir):
+    """Test le chargement complet si pipeline.joblib a changé depuis l'export."""
+    from src.models.forest import CompiledForest
+
+    pipeline = create_simple_pipeline()
+    joblib.dump(pipeline, temp_model_dir / "pipeline.joblib")
+    writer = ArtifactLoader(temp_model_dir)
+    CompiledForest.from_pipeline(pipeline).save(writer.forest_path)
+    writer.save_pipeline_without_forest(pipeline)
+
+    retrained = create_simple_pipeline().set_params(classifier__n_estimators=5)
+    retrained.fit(np.array([[1, 2], [3, 4], [5, 6], [7, 8]]), np.array([0, 0, 1, 1]))
+    joblib.dump(retrained, temp_model_dir / "pipeline.joblib")
+
+    loader = ArtifactLoader(temp_model_dir, mmap_mode="r", forest_only=True)
+    loaded, _, _, warnings = loader.load_artifacts()
+
+    assert len(loaded.steps[-1][1].estimators_) == 5
+    assert loader.load_info["forest_only"] is False
+    assert any("pipeline_noforest.joblib" in w for w in warnings)
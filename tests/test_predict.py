@@ -0,0 +1,90 @@
+"""Tests pour le scoring par blocs du script predict.py."""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.models.predictor import FraudPredictor
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+_spec = importlib.util.spec_from_file_location(
+    "predict_script", Path(__file__).parent.parent / "scripts" / "predict.py"
+)
+predict_script = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(predict_script)
+
+
+@pytest.fixture
+def predictor():
+    """Crée un FraudPredictor sur un pipeline simple."""
+    rng = np.random.default_rng(0)
+    pipeline = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("model", RandomForestClassifier(n_estimators=10, random_state=42)),
+        ]
+    )
+    pipeline.fit(rng.random((100, 30)), rng.integers(0, 2, 100))
+    return FraudPredictor(pipeline, COLUMNS, threshold=0.3, engine="sklearn")
+
+
+@pytest.fixture
+def transactions():
+    """Crée 25 transactions avec un identifiant croissant."""
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.random((25, 30)), columns=COLUMNS)
+    df.insert(0, "tx_id", np.arange(25))
+    return df
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_score_stream_multi_chunk(tmp_path, predictor, transactions, suffix):
+    """Test le scoring par blocs: sortie complète, ordonnée et résumé cumulé."""
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / f"scored{suffix}"
+    transactions.to_csv(input_path, index=False)
+
+    summary = predict_script.score_stream(
+        predictor, input_path, output_path, stream_rows=10, chunk_size=4, n_jobs=1
+    )
+
+    scored = pd.read_csv(output_path) if suffix == ".csv" else pd.read_parquet(output_path)
+    probas, preds = predictor.predict_batch(transactions)
+
+    assert len(scored) == 25
+    assert scored["tx_id"].tolist() == list(range(25))
+    assert scored["fraud_proba"].to_numpy() == pytest.approx(probas)
+    assert scored["fraud_pred"].tolist() == preds.tolist()
+
+    assert summary["total"] == 25
+    assert summary["fraudes"] == int(preds.sum())
+    assert summary["proba_sum"] == pytest.approx(float(probas.sum()))
+    assert summary["preview"]["tx_id"].tolist() == list(range(10))
+
+
+def test_score_stream_empty_input(tmp_path, predictor, transactions):
+    """Test qu'une entrée sans ligne donne un résumé vide et une sortie à en-tête seul."""
+    pytest.importorskip("pyarrow")
+    input_path = tmp_path / "input.parquet"
+    output_path = tmp_path / "scored.csv"
+    transactions.head(0).to_parquet(input_path)
+
+    summary = predict_script.score_stream(
+        predictor, input_path, output_path, stream_rows=10, chunk_size=4, n_jobs=1
+    )
+
+    assert summary["total"] == 0
+    assert summary["fraudes"] == 0
+    assert summary["preview"] is not None and summary["preview"].empty
+    scored = pd.read_csv(output_path)
+    assert scored.empty
+    assert list(scored.columns[-3:]) == ["fraud_proba", "fraud_pred", "risk_level"]
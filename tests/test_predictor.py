@@ -7,7 +7,7 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from src.models.predictor import FraudPredictor
+from src.models.predictor import FraudPredictor, ScoredBatch
 
 
 @pytest.fixture
@@ -122,3 +122,284 @@ def test_custom_threshold(predictor):
     # Mais les prédictions peuvent différer selon le seuil
     assert isinstance(pred1, int)
     assert isinstance(pred2, int)
+
+
+@pytest.mark.parametrize("engine", ["compiled", "auto"])
+def test_engines_match_sklearn(mock_pipeline, engine):
+    """Test que les moteurs compilés donnent les mêmes probabilités."""
+    expected_cols = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+    reference = FraudPredictor(mock_pipeline, expected_cols)
+    fast = FraudPredictor(mock_pipeline, expected_cols, engine=engine)
+
+    df = pd.DataFrame(np.random.rand(300, 30), columns=expected_cols)
+    ref_proba, ref_pred = reference.predict(df)
+    proba, pred = fast.predict(df)
+
+    np.testing.assert_allclose(proba, ref_proba, atol=1e-12)
+    np.testing.assert_array_equal(pred, ref_pred)
+
+
+def test_unknown_engine(mock_pipeline):
+    """Test qu'un moteur inconnu est refusé."""
+    with pytest.raises(ValueError):
+        FraudPredictor(mock_pipeline, ["Amount", "Time"], engine="gpu")
+
+
+def test_to_matrix_alignment(predictor):
+    """Test l'alignement des colonnes dans une matrice sans DataFrame intermédiaire."""
+    df = pd.DataFrame({"V2": [1.0, np.nan], "extra": ["a", "b"], "Amount": [10, 20]})
+
+    matrix = predictor.to_matrix(df)
+
+    assert matrix.shape == (2, 30)
+    assert matrix.dtype == np.float64
+    np.testing.assert_array_equal(matrix[:, 0], [10.0, 20.0])
+    np.testing.assert_array_equal(matrix[:, 3], [1.0, 0.0])
+    assert matrix[:, 1].sum() == 0.0
+
+
+def test_to_matrix_reuses_buffer(predictor):
+    """Test l'écriture dans une matrice préallouée."""
+    buffer = np.full((5, 30), 7.0, order="F")
+    df = pd.DataFrame({"Amount": [1.0, 2.0], "Time": [3.0, 4.0]})
+
+    matrix = predictor.to_matrix(df, out=buffer)
+
+    assert matrix.shape == (2, 30)
+    assert np.shares_memory(matrix, buffer)
+    assert matrix[:, 2:].sum() == 0.0
+    np.testing.assert_array_equal(matrix[:, 1], [3.0, 4.0])
+
+
+def test_ensure_columns_keeps_index(predictor):
+    """Test que ensure_columns conserve l'index d'origine."""
+    df = pd.DataFrame({"Amount": [1.0, 2.0]}, index=[10, 20])
+
+    result = predictor.ensure_columns(df)
+
+    assert list(result.index) == [10, 20]
+    assert list(result.columns) == predictor.expected_columns
+
+
+def test_predict_iter_chunks(predictor):
+    """Test que predict_iter rend un résultat par chunk, dans l'ordre."""
+    df = pd.DataFrame({"Amount": np.random.rand(10), "Time": np.random.rand(10)})
+
+    chunks = list(predictor.predict_iter(df, chunk_size=4))
+
+    assert [(start, stop) for start, stop, _, _ in chunks] == [(0, 4), (4, 8), (8, 10)]
+    assert all(len(proba) == stop - start for start, stop, proba, _ in chunks)
+
+
+def test_predict_batch_progress(predictor):
+    """Test que le callback de progression est appelé après chaque chunk."""
+    df = pd.DataFrame({"Amount": np.random.rand(10), "Time": np.random.rand(10)})
+    calls = []
+
+    probas, _ = predictor.predict_batch(
+        df, chunk_size=3, progress=lambda done, total: calls.append((done, total))
+    )
+
+    assert calls == [(3, 10), (6, 10), (9, 10), (10, 10)]
+    expected, _ = predictor.predict(df)
+    np.testing.assert_allclose(probas, expected)
+
+
+def test_predict_batch_parallel(predictor):
+    """Test que le scoring multi-processus conserve l'ordre et les valeurs."""
+    predictor.parallel_min_rows = 0
+    df = pd.DataFrame(np.random.rand(50, 30), columns=predictor.expected_columns)
+    calls = []
+
+    probas, preds = predictor.predict_batch(
+        df, chunk_size=7, n_jobs=2, progress=lambda done, total: calls.append(done)
+    )
+    expected_probas, expected_preds = predictor.predict(df)
+
+    np.testing.assert_allclose(probas, expected_probas)
+    np.testing.assert_array_equal(preds, expected_preds)
+    assert calls[-1] == 50
+    assert len(calls) == 8
+    predictor.close()
+
+
+def test_predict_batch_parallel_reuses_pool(predictor):
+    """Test que le pool et le segment partagé sont gardés d'un lot à l'autre."""
+    predictor.parallel_min_rows = 0
+    df = pd.DataFrame(np.random.rand(40, 30), columns=predictor.expected_columns)
+
+    first, _ = predictor.predict_batch(df, chunk_size=7, n_jobs=2)
+    pool, shm = predictor._pool, predictor._shm
+    second, _ = predictor.predict_batch(df.head(30), chunk_size=7, n_jobs=2)
+
+    assert predictor._pool is pool
+    assert predictor._shm is shm
+    np.testing.assert_allclose(second, first[:30])
+
+    predictor.close()
+    assert predictor._pool is None
+    assert predictor._shm is None
+
+
+def test_parallel_workers_receive_model_only(predictor, mock_pipeline):
+    """Test que le pool ne reçoit que le modèle et les colonnes, pas les challengers."""
+    predictor.parallel_min_rows = 0
+    predictor.add_challenger("v2", mock_pipeline)
+    df = pd.DataFrame(np.random.rand(30, 30), columns=predictor.expected_columns)
+
+    probas, _ = predictor.predict_batch(df, chunk_size=7, n_jobs=2)
+    initargs = predictor._pool._initargs
+
+    assert not any(isinstance(arg, FraudPredictor) for arg in initargs)
+    assert initargs[1] == predictor.expected_columns
+    np.testing.assert_allclose(probas, predictor.pipeline.predict_proba(df)[:, 1])
+    predictor.close()
+
+
+def test_predict_batch_small_lot_stays_serial(predictor):
+    """Test qu'un lot sous parallel_min_rows est scoré sans pool de processus."""
+    df = pd.DataFrame(np.random.rand(50, 30), columns=predictor.expected_columns)
+
+    predictor.predict_batch(df, chunk_size=7, n_jobs=2)
+
+    assert predictor._pool is None
+
+
+def test_predict_single_fast_path(mock_pipeline):
+    """Test que le chemin rapide sans pandas donne le même résultat."""
+    expected_cols = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+    reference = FraudPredictor(mock_pipeline, expected_cols)
+    fast = FraudPredictor(mock_pipeline, expected_cols, engine="auto")
+    transaction = {"Amount": 0.3, "Time": 0.7, "V3": 0.1, "V4": None, "unknown": 5.0}
+
+    assert fast.preprocessor is not None
+    for _ in range(2):  # le second appel réutilise les tampons
+        proba, pred = fast.predict_single(transaction, threshold=0.5)
+        ref_proba, ref_pred = reference.predict_single(transaction, threshold=0.5)
+        assert isinstance(proba, float)
+        assert proba == pytest.approx(ref_proba, abs=1e-12)
+        assert pred == ref_pred
+
+
+def test_predictor_pickle_roundtrip(mock_pipeline):
+    """Test que le prédicateur reste sérialisable (pool de processus)."""
+    import pickle
+
+    expected_cols = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+    predictor = FraudPredictor(mock_pipeline, expected_cols, engine="auto")
+    transaction = {"Amount": 0.5, "Time": 0.2}
+    predictor.predict_single(transaction)
+
+    restored = pickle.loads(pickle.dumps(predictor))
+
+    assert restored.predict_single(transaction) == predictor.predict_single(transaction)
+
+
+def test_predict_records(predictor):
+    """Test la prédiction sur une liste de dictionnaires."""
+    records = [{"Amount": 100.0, "Time": 500.0}, {"Amount": 5.0, "V1": None}]
+
+    probas, preds = predictor.predict_records(records)
+    expected, _ = predictor.predict(pd.DataFrame(records))
+
+    np.testing.assert_allclose(probas, expected)
+    assert len(preds) == 2
+
+
+def test_get_risk_levels_vectorized(predictor):
+    """Test que la version vectorisée concorde avec get_risk_level."""
+    probas = np.array([0.0, 0.29, 0.3, 0.49, 0.5, 0.79, 0.8, 1.0])
+
+    levels = predictor.get_risk_levels(probas)
+
+    assert isinstance(levels, pd.Categorical)
+    assert list(levels) == [predictor.get_risk_level(p) for p in probas]
+    assert list(levels.categories) == ["FAIBLE", "MODÉRÉ", "ÉLEVÉ", "CRITIQUE"]
+
+
+def test_custom_risk_bands(mock_pipeline):
+    """Test des bornes de risque configurables."""
+    predictor = FraudPredictor(mock_pipeline, ["Amount"], risk_bands=(0.1, 0.2, 0.4))
+
+    assert predictor.get_risk_level(0.15) == "MODÉRÉ"
+    assert list(predictor.get_risk_levels([0.05, 0.25, 0.4])) == ["FAIBLE", "ÉLEVÉ", "CRITIQUE"]
+
+    with pytest.raises(ValueError):
+        FraudPredictor(mock_pipeline, ["Amount"], risk_bands=(0.5, 0.3, 0.8))
+
+
+def test_scored_batch_threshold_outputs():
+    """Test que les sorties dépendant du seuil sont recalculées sans re-scoring."""
+    scored = ScoredBatch(np.array([0.9, 0.1, 0.5, 0.3, 0.5]))
+
+    assert len(scored) == 5
+    np.testing.assert_array_equal(scored.predictions(0.5), [1, 0, 1, 0, 1])
+    assert scored.alert_count(0.5) == 3
+    assert scored.alert_count(0.0) == 5
+    assert scored.alert_count(0.95) == 0
+
+
+def test_predictor_uses_given_forest(mock_pipeline, tmp_path):
+    """Test que le prédicateur réutilise une forêt déjà compilée (mmap)."""
+    from src.models.forest import CompiledForest
+
+    expected_cols = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+    CompiledForest.from_pipeline(mock_pipeline).save(tmp_path / "forest.joblib")
+    forest = CompiledForest.load(tmp_path / "forest.joblib", mmap_mode="r")
+
+    predictor = FraudPredictor(mock_pipeline, expected_cols, engine="compiled", forest=forest)
+    reference = FraudPredictor(mock_pipeline, expected_cols, engine="sklearn")
+    data = pd.DataFrame(np.random.rand(20, 30), columns=expected_cols)
+
+    assert predictor.forest is forest
+    assert predictor.predict(data)[0] == pytest.approx(reference.predict(data)[0])
+
+
+def test_shadow_challenger_shares_preprocessing(mock_pipeline, tmp_path):
+    """Test le scoring fantôme d'un challenger sur les features du champion."""
+    from sklearn.base import clone
+
+    from src.models.shadow import ShadowLog
+
+    cols = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+    challenger = Pipeline(
+        [("prep", mock_pipeline.named_steps["prep"]), ("model", clone(mock_pipeline[-1]))]
+    )
+    challenger[-1].set_params(random_state=7).fit(np.random.rand(50, 30), np.arange(50) % 2)
+    other_prep = Pipeline([("prep", StandardScaler()), ("model", challenger[-1])])
+    other_prep[0].fit(np.random.rand(20, 30) * 10)
+
+    predictor = FraudPredictor(mock_pipeline, cols, threshold=0.5, engine="auto")
+    predictor.shadow_log = ShadowLog(tmp_path / "shadow.jsonl")
+    assert predictor.add_challenger("v2", challenger, threshold=0.4) is True
+    assert predictor.add_challenger("v3", other_prep) is False
+
+    df = pd.DataFrame(np.random.rand(300, 30), columns=cols)
+    proba, _ = predictor.predict(df)
+    predictor.predict_single(df.iloc[0].to_dict())
+    assert predictor.wait_shadow(timeout=30)
+
+    records = predictor.shadow_log.read()
+    assert [r["n_rows"] for r in records] == [300, 1]
+    assert predictor.shadow_stats["rows"] == 301
+    assert records[0]["champion_proba"] == pytest.approx(proba, abs=1e-6)
+    assert records[0]["challengers"]["v2"]["proba"] == pytest.approx(
+        challenger.predict_proba(df.to_numpy())[:, 1], abs=1e-6
+    )
+    assert records[0]["challengers"]["v3"]["proba"] == pytest.approx(
+        other_prep.predict_proba(df.to_numpy())[:, 1], abs=1e-6
+    )
+    assert records[0]["challengers"]["v2"]["threshold"] == 0.4
+    assert 0.0 <= records[1]["challengers"]["v3"]["agreement"] <= 1.0
+
+
+def test_shadow_drops_batches_when_saturated(predictor):
+    """Test que les lots sont ignorés plutôt que d'attendre les challengers."""
+    predictor.add_challenger("v2", predictor.pipeline)
+    predictor.shadow_max_pending = 0
+    df = pd.DataFrame(np.random.rand(5, 30), columns=predictor.expected_columns)
+
+    predictor.predict(df)
+
+    assert predictor.shadow_stats["dropped"] == 1
+    assert predictor.shadow_stats["batches"] == 0
@@ -0,0 +1,87 @@
+"""Tests pour le module registry."""
+
+import json
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.data.registry import ModelRegistry
+
+
+def save_version(root, name, pr_auc):
+    """Crée un dossier d'artefacts minimal."""
+    model_dir = root / name
+    model_dir.mkdir()
+    pipeline = Pipeline(
+        [("scaler", StandardScaler()), ("model", RandomForestClassifier(n_estimators=3))]
+    )
+    pipeline.fit(np.array([[1, 2], [3, 4], [5, 6], [7, 8]]), np.array([0, 0, 1, 1]))
+    joblib.dump(pipeline, model_dir / "pipeline.joblib")
+    with open(model_dir / "metrics_valid.json", "w") as f:
+        json.dump({"pr_auc": pr_auc, "threshold": 0.3, "confusion_matrix": [[1]]}, f)
+
+
+def test_register_and_list(tmp_path):
+    """Test l'enregistrement de versions et leur manifeste."""
+    save_version(tmp_path, "v1", 0.8)
+    save_version(tmp_path, "v2", 0.85)
+    (tmp_path / "README.md").write_text("non versionné")
+    registry = ModelRegistry(tmp_path)
+
+    first = registry.register("v1", stage="champion", description="baseline")
+    second = registry.register("v2")
+
+    assert first["version"] == 1 and second["version"] == 2
+    assert first["metrics"] == {"pr_auc": 0.8, "threshold": 0.3}
+    assert set(first["files"]) == {"pipeline.joblib", "metrics_valid.json"}
+    assert [m["name"] for m in registry.list_versions()] == ["v1", "v2"]
+    assert registry.champion() == "v1"
+    assert registry.challengers() == ["v2"]
+    assert registry.loader("v2").model_dir == tmp_path / "v2"
+
+
+def test_promote_archives_previous_champion(tmp_path):
+    """Test la promotion d'un challenger."""
+    save_version(tmp_path, "v1", 0.8)
+    save_version(tmp_path, "v2", 0.85)
+    registry = ModelRegistry(tmp_path)
+    registry.register("v1", stage="champion")
+    registry.register("v2")
+
+    registry.promote("v2")
+
+    assert registry.champion() == "v2"
+    assert registry.get("v1")["stage"] == "archived"
+    assert registry.challengers() == []
+
+
+def test_register_errors(tmp_path):
+    """Test les erreurs d'enregistrement."""
+    (tmp_path / "vide").mkdir()
+    registry = ModelRegistry(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        registry.register("vide")
+    with pytest.raises(ValueError):
+        registry.register("vide", stage="production")
+    with pytest.raises(KeyError):
+        registry.set_stage("absent", "archived")
+    assert ModelRegistry(tmp_path / "absent").list_versions() == []
+
+
+def test_verify_detects_modified_files(tmp_path):
+    """Test la vérification des empreintes du manifeste."""
+    save_version(tmp_path, "v1", 0.8)
+    registry = ModelRegistry(tmp_path)
+    registry.register("v1")
+    assert registry.verify("v1") == []
+
+    with open(tmp_path / "v1" / "metrics_valid.json", "w") as f:
+        json.dump({"pr_auc": 0.1}, f)
+    (tmp_path / "v1" / "columns.json").write_text("{}")
+
+    assert registry.verify("v1") == ["columns.json", "metrics_valid.json"]
@@ -0,0 +1,111 @@
+"""Tests pour le rechargement à chaud des artefacts."""
+
+import json
+import os
+import time
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.serving.reloader import ModelReloader
+
+COLUMNS = ["Amount", "Time"]
+
+
+def write_model(model_dir, seed: int, threshold: float = 0.5) -> None:
+    """Écrit un jeu d'artefacts complet dans model_dir."""
+    rng = np.random.default_rng(seed)
+    pipeline = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("model", RandomForestClassifier(n_estimators=5, random_state=seed)),
+        ]
+    )
+    pipeline.fit(rng.normal(size=(50, 2)), rng.integers(0, 2, 50))
+    joblib.dump(pipeline, model_dir / "pipeline.joblib")
+    with open(model_dir / "metrics_valid.json", "w", encoding="utf-8") as f:
+        json.dump({"threshold": threshold}, f)
+    with open(model_dir / "columns.json", "w", encoding="utf-8") as f:
+        json.dump({"all_cols": COLUMNS}, f)
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    """Crée un dossier de modèle avec une première version."""
+    write_model(tmp_path, seed=0, threshold=0.4)
+    return tmp_path
+
+
+def test_initial_load(model_dir):
+    """Test le chargement de la version initiale."""
+    reloader = ModelReloader(model_dir)
+
+    assert reloader.current.predictor.threshold == 0.4
+    assert reloader.current.fingerprint["pipeline.joblib"] is not None
+    assert reloader.current.fingerprint["global_shap.json"] is None
+    assert reloader.check_for_update() is False
+
+
+def test_swap_after_stable_change(model_dir):
+    """Test la bascule vers une nouvelle version une fois les fichiers stables."""
+    swapped = []
+    reloader = ModelReloader(model_dir, on_swap=swapped.append)
+    old_version = reloader.current
+    in_flight = old_version.predictor
+
+    write_model(model_dir, seed=1, threshold=0.6)
+
+    assert reloader.check_for_update() is False  # changement observé une première fois
+    assert reloader.current is old_version
+    assert reloader.check_for_update() is True
+
+    assert reloader.current.predictor.threshold == 0.6
+    assert reloader.current.version_id != old_version.version_id
+    assert swapped == [reloader.current]
+    assert reloader.reloads == 1
+    # Une prédiction commencée avec l'ancienne version reste utilisable
+    assert in_flight.predict_single({"Amount": 1.0, "Time": 2.0})[1] in (0, 1)
+
+
+def test_touch_without_change_does_not_reload(model_dir):
+    """Test qu'un fichier touché sans changement de contenu ne recharge pas."""
+    reloader = ModelReloader(model_dir)
+    path = model_dir / "metrics_valid.json"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert reloader.check_for_update() is False
+    assert reloader.check_for_update() is False
+    assert reloader.reloads == 0
+
+
+def test_failed_reload_keeps_current_version(model_dir):
+    """Test qu'un artefact invalide conserve la version en service."""
+    reloader = ModelReloader(model_dir)
+    old_version = reloader.current
+    (model_dir / "pipeline.joblib").write_bytes(b"pas un pickle")
+
+    reloader.check_for_update()
+    assert reloader.check_for_update() is False
+
+    assert reloader.current is old_version
+    assert reloader.last_error.startswith("Rechargement impossible")
+
+
+def test_background_watch(model_dir):
+    """Test la surveillance en arrière-plan."""
+    reloader = ModelReloader(model_dir, interval=0.02)
+    reloader.start()
+    try:
+        write_model(model_dir, seed=2, threshold=0.7)
+        deadline = time.monotonic() + 10
+        while reloader.reloads == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        reloader.stop()
+
+    assert reloader.current.predictor.threshold == 0.7
@@ -0,0 +1,101 @@
+"""Tests pour la recherche d'hyperparamètres par divisions successives."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline as ImbPipeline
+from sklearn.ensemble import RandomForestClassifier
+
+from src.models.search import SuccessiveHalvingSearch, expand_grid
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+
+def build_small_pipeline(n_estimators=10, max_depth=None, smote_strategy=0.5):
+    """Construit un pipeline réduit (fonction de module, donc picklable)."""
+    return ImbPipeline(
+        steps=[
+            ("smote", SMOTE(sampling_strategy=smote_strategy, random_state=0)),
+            (
+                "model",
+                RandomForestClassifier(
+                    n_estimators=n_estimators, max_depth=max_depth, n_jobs=1, random_state=0
+                ),
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def splits():
+    """Crée des splits train/valid fictifs déséquilibrés."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(900, 30)), columns=COLUMNS)
+    y = pd.Series((X["V1"] + rng.normal(scale=0.5, size=900) > 1.2).astype(int))
+    return X.iloc[:600], y.iloc[:600], X.iloc[600:], y.iloc[600:]
+
+
+def test_expand_grid_enumerates_all_combinations():
+    """Test l'énumération de la grille dans l'ordre."""
+    candidates = expand_grid({"a": [1, 2], "b": ["x", "y", "z"]})
+
+    assert len(candidates) == 6
+    assert candidates[0] == {"a": 1, "b": "x"}
+    assert candidates[-1] == {"a": 2, "b": "z"}
+
+
+def test_search_halves_candidates_until_full_train_set(splits):
+    """Test que chaque tour garde les meilleurs candidats sur plus de données."""
+    X_train, y_train, X_valid, y_valid = splits
+    grid = {"n_estimators": [5, 20], "max_depth": [2, None], "smote_strategy": [0.5]}
+    search = SuccessiveHalvingSearch(build_small_pipeline, grid, factor=2, n_jobs=2)
+
+    best = search.fit(X_train, y_train, X_valid, y_valid)
+
+    assert [r["n_candidates"] for r in search.rounds] == [4, 2]
+    assert search.rounds[-1]["n_rows"] == len(X_train)
+    assert search.rounds[0]["n_rows"] < len(X_train)
+    # Les survivants sont les meilleurs du tour précédent
+    survivors = [r["params"] for r in search.rounds[0]["results"][:2]]
+    assert sorted(map(str, survivors)) == sorted(
+        str(r["params"]) for r in search.rounds[1]["results"]
+    )
+    assert best in expand_grid(grid)
+    assert search.best_score == search.rounds[-1]["results"][0]["pr_auc"]
+
+    summary = json.loads(json.dumps(search.to_dict()))
+    assert summary["best_params"] == best
+    assert summary["n_candidates"] == 4
+
+
+def test_search_rounds_are_stratified(splits):
+    """Test que le taux de fraude est conservé dans les échantillons."""
+    _, y_train, _, _ = splits
+    y = y_train.to_numpy()
+    rows = SuccessiveHalvingSearch._round_rows(y, 0.25, np.random.default_rng(0))
+
+    assert abs(y[rows].mean() - y.mean()) < 0.01
+
+
+def test_search_ranks_failed_candidates_last(splits):
+    """Test qu'un candidat invalide est classé dernier avec son erreur."""
+    X_train, y_train, X_valid, y_valid = splits
+    # Stratégie SMOTE inférieure au ratio existant: SMOTE refuse
+    grid = {"smote_strategy": [0.01, 0.5]}
+    search = SuccessiveHalvingSearch(build_small_pipeline, grid, factor=2, n_jobs=1)
+
+    best = search.fit(X_train, y_train, X_valid, y_valid)
+
+    assert best == {"smote_strategy": 0.5}
+    failed = search.rounds[0]["results"][-1]
+    assert failed["pr_auc"] is None
+    assert "error" in failed
+
+
+def test_search_rejects_invalid_factor():
+    """Test la validation du facteur de réduction."""
+    with pytest.raises(ValueError):
+        SuccessiveHalvingSearch(build_small_pipeline, {"n_estimators": [5]}, factor=1)
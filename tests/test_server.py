@@ -0,0 +1,274 @@
+"""Tests pour le service de scoring en micro-lots."""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.models.predictor import FraudPredictor
+from src.serving.server import MicroBatcher, ScoringServer
+
+COLUMNS = ["Amount", "Time"] + [f"V{i}" for i in range(1, 29)]
+
+
+@pytest.fixture
+def predictor():
+    """Crée un FraudPredictor sur un pipeline simple."""
+    pipeline = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("model", RandomForestClassifier(n_estimators=10, random_state=42)),
+        ]
+    )
+    pipeline.fit(np.random.rand(100, 30), np.random.randint(0, 2, 100))
+    return FraudPredictor(pipeline, COLUMNS, threshold=0.5, engine="auto")
+
+
+async def _http(port: int, method: str, path: str, payload=None):
+    """Envoie une requête HTTP minimale et retourne (statut, JSON)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    raw = await reader.read()
+    writer.close()
+    return int(status_line.split()[1]), json.loads(raw.split(b"\r\n\r\n", 1)[1])
+
+
+def test_micro_batcher_groups_concurrent_requests(predictor):
+    """Test que les requêtes concurrentes sont évaluées en un seul lot."""
+    transactions = [{"Amount": float(i), "Time": float(i)} for i in range(20)]
+
+    async def scenario():
+        batcher = MicroBatcher(predictor, max_batch_size=64, max_wait_ms=50)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit(tx) for tx in transactions))
+        finally:
+            await batcher.stop()
+        return results, batcher.stats
+
+    results, stats = asyncio.run(scenario())
+
+    expected = [predictor.predict_single(tx) for tx in transactions]
+    assert [proba for proba, _ in results] == pytest.approx([proba for proba, _ in expected])
+    assert stats["requests"] == 20
+    assert stats["batches"] == 1
+
+
+def test_micro_batcher_respects_max_batch_size(predictor):
+    """Test qu'un lot ne dépasse pas max_batch_size."""
+    transactions = [{"Amount": 1.0, "Time": float(i)} for i in range(10)]
+
+    async def scenario():
+        batcher = MicroBatcher(predictor, max_batch_size=4, max_wait_ms=50)
+        await batcher.start()
+        try:
+            await asyncio.gather(*(batcher.submit(tx) for tx in transactions))
+        finally:
+            await batcher.stop()
+        return batcher.stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats["max_batch"] == 4
+    assert stats["batches"] == 3
+
+
+def test_server_predict_and_health(predictor):
+    """Test les routes HTTP du serveur."""
+
+    async def scenario():
+        server = ScoringServer(predictor, port=0, max_wait_ms=1)
+        await server.start()
+        try:
+            predict = await _http(server.port, "POST", "/predict", {"Amount": 10.0, "Time": 5.0})
+            invalid = await _http(server.port, "POST", "/predict", {"Time": 5.0})
+            health = await _http(server.port, "GET", "/health")
+            missing = await _http(server.port, "GET", "/nope")
+        finally:
+            await server.stop()
+        return predict, invalid, health, missing
+
+    predict, invalid, health, missing = asyncio.run(scenario())
+
+    status, payload = predict
+    assert status == 200
+    assert 0.0 <= payload["fraud_proba"] <= 1.0
+    assert payload["fraud_pred"] in [0, 1]
+    assert payload["risk_level"] in ["FAIBLE", "MODÉRÉ", "ÉLEVÉ", "CRITIQUE"]
+
+    assert invalid[0] == 400
+    assert health == (200, {"status": "ok", "requests": 1, "batches": 1, "max_batch": 1})
+    assert missing[0] == 404
+
+
+def test_bad_request_does_not_fail_its_micro_batch(predictor):
+    """Test qu'une transaction invalide n'échoue que pour elle-même."""
+    good = [{"Amount": float(i), "Time": float(i)} for i in range(3)]
+    bad = {"Amount": 1.0, "Time": 1.0, "V1": "abc"}
+
+    async def scenario():
+        # Serveur: la transaction invalide est refusée avant le regroupement
+        server = ScoringServer(predictor, port=0, max_wait_ms=50)
+        await server.start()
+        try:
+            responses = await asyncio.gather(
+                *(_http(server.port, "POST", "/predict", tx) for tx in good + [bad])
+            )
+        finally:
+            await server.stop()
+
+        # Regroupeur seul: un lot en échec est ré-évalué transaction par transaction
+        batcher = MicroBatcher(predictor, max_batch_size=64, max_wait_ms=50)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(
+                *(batcher.submit(tx) for tx in good + [bad]), return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+        return responses, results
+
+    responses, results = asyncio.run(scenario())
+
+    assert [status for status, _ in responses] == [200, 200, 200, 400]
+    assert "V1" in responses[-1][1]["error"]
+    assert all(isinstance(result, tuple) for result in results[:3])
+    assert isinstance(results[-1], ValueError)
+    expected = [predictor.predict_single(tx)[0] for tx in good]
+    assert [proba for proba, _ in results[:3]] == pytest.approx(expected)
+
+
+def test_server_set_predictor_swaps_model(predictor):
+    """Test la mise en service d'un nouveau prédicateur sans redémarrage."""
+    never = FraudPredictor(predictor.pipeline, COLUMNS, threshold=1.1)
+    always = FraudPredictor(predictor.pipeline, COLUMNS, threshold=0.0)
+    transaction = {"Amount": 1.0, "Time": 1.0}
+
+    async def scenario():
+        server = ScoringServer(never, port=0, max_wait_ms=1)
+        await server.start()
+        try:
+            before = await _http(server.port, "POST", "/predict", transaction)
+            server.set_predictor(always)
+            after = await _http(server.port, "POST", "/predict", transaction)
+        finally:
+            await server.stop()
+        return before, after
+
+    before, after = asyncio.run(scenario())
+
+    assert before[1]["fraud_pred"] == 0
+    assert after[1]["fraud_pred"] == 1
+    assert after[1]["fraud_proba"] == before[1]["fraud_proba"]
+
+
+def test_unix_socket_daemon_and_client(predictor, tmp_path):
+    """Test le mode démon (socket Unix) interrogé par le client synchrone."""
+    from src.serving.client import ScoringClient
+
+    socket_path = tmp_path / "scoring.sock"
+    socket_path.write_text("")  # socket laissée par un démon arrêté
+    model_dir = tmp_path / "model"
+    transaction = {"Amount": 42.0, "Time": 10.0}
+
+    async def scenario():
+        server = ScoringServer(
+            predictor,
+            unix_socket=socket_path,
+            metadata={"model_dir": str(model_dir.resolve()), "engine": "auto", "mmap": False},
+        )
+        await server.start()
+        client = ScoringClient(socket_path)
+        loop = asyncio.get_running_loop()
+        try:
+            serves = await loop.run_in_executor(None, client.serves, model_dir)
+            other = await loop.run_in_executor(None, client.serves, tmp_path / "autre")
+            same_engine = await loop.run_in_executor(
+                None, client.serves, model_dir, {"engine": "auto"}
+            )
+            other_engine = await loop.run_in_executor(
+                None, client.serves, model_dir, {"engine": "sklearn"}
+            )
+            mmap = await loop.run_in_executor(None, client.serves, model_dir, {"mmap": True})
+            assert same_engine and not other_engine and not mmap
+            result = await loop.run_in_executor(None, client.predict, transaction)
+            with pytest.raises(ValueError):
+                await loop.run_in_executor(None, client.predict, {"Amount": "abc"})
+        finally:
+            await server.stop()
+        return serves, other, result
+
+    serves, other, result = asyncio.run(scenario())
+
+    assert serves and not other
+    assert result["fraud_proba"] == pytest.approx(predictor.predict_single(transaction)[0])
+    assert not socket_path.exists()
+    assert not ScoringClient(socket_path).serves(model_dir)
+
+
+def test_risk_level_comes_from_predictor_that_scored(predictor):
+    """Test que le niveau de risque vient du prédicateur du lot, même après bascule."""
+    # Bornes hors de [0, 1]: toujours FAIBLE pour l'un, toujours CRITIQUE pour l'autre
+    lenient = FraudPredictor(predictor.pipeline, COLUMNS, risk_bands=(1.1, 1.2, 1.3))
+    strict = FraudPredictor(predictor.pipeline, COLUMNS, risk_bands=(-3.0, -2.0, -1.0))
+    transaction = {"Amount": 1.0, "Time": 1.0}
+
+    async def scenario():
+        # Lot tenu ouvert 300 ms: la bascule a lieu entre la requête et son évaluation
+        server = ScoringServer(lenient, port=0, max_wait_ms=300)
+        await server.start()
+        try:
+            request = asyncio.create_task(_http(server.port, "POST", "/predict", transaction))
+            await asyncio.sleep(0.1)
+            server.set_predictor(strict)
+            return await request
+        finally:
+            await server.stop()
+
+    status, payload = asyncio.run(scenario())
+
+    assert status == 200
+    # Niveau du prédicateur qui a évalué le lot (le nouveau), pas de celui de la requête
+    assert payload["risk_level"] == "CRITIQUE"
+
+
+def test_collect_failure_does_not_leave_requests_hanging(predictor):
+    """Test qu'une erreur de collecte fait échouer le lot au lieu de le bloquer."""
+
+    async def scenario():
+        batcher = MicroBatcher(predictor, max_batch_size=64, max_wait_ms=50)
+        original = batcher._collect
+        calls = []
+
+        async def failing_collect(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                batch.append(await batcher._queue.get())
+                raise RuntimeError("collecte interrompue")
+            await original(batch)
+
+        batcher._collect = failing_collect
+        await batcher.start()
+        try:
+            first = asyncio.wait_for(batcher.submit({"Amount": 1.0, "Time": 1.0}), 5)
+            with pytest.raises(RuntimeError, match="collecte interrompue"):
+                await first
+            # Le regroupeur continue de servir les lots suivants
+            second = await asyncio.wait_for(batcher.submit({"Amount": 2.0, "Time": 2.0}), 5)
+        finally:
+            await batcher.stop()
+        return second
+
+    proba, pred = asyncio.run(scenario())
+
+    assert (proba, pred) == pytest.approx(predictor.predict_single({"Amount": 2.0, "Time": 2.0}))
@@ -91,6 +91,17 @@ def test_validate_transaction_negative_amount(validator):
     assert any("négatif" in err for err in errors)
 
 
+def test_validate_transaction_non_numeric_feature(validator):
+    """Test le refus d'une feature V non numérique."""
+    transaction = {"Amount": 100.0, "Time": 500.0, "V1": "abc", "V2": None}
+
+    is_valid, errors = validator.validate_transaction(transaction)
+
+    assert is_valid is False
+    assert any("V1" in err for err in errors)
+    assert not any("V2" in err for err in errors)
+
+
 def test_sanitize_dataframe(validator):
     """Test le nettoyage d'un DataFrame."""
     df = pd.DataFrame(